@@ -8,12 +8,31 @@ msgpack / intake YAML approach.  See issue #1131.
 
 import gzip
 import json
+import os
 import pathlib
 
 import databroker
 import pytest
 
 TEST_DATA = pathlib.Path(__file__).parent / "tests"
+BENCHMARK_ENV = "APSTOOLS_BENCHMARK"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        f"benchmark: report timing, not part of the unit tests (run when ${BENCHMARK_ENV} is set)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless requested, such as: APSTOOLS_BENCHMARK=1 pytest -m benchmark -s"""
+    if os.environ.get(BENCHMARK_ENV):
+        return
+    skip = pytest.mark.skip(reason=f"benchmark: set ${BENCHMARK_ENV} to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
 
 
 def _load_catalog(path: pathlib.Path):
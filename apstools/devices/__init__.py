@@ -1,222 +1,180 @@
 """
 Support for APS hardware abstractions (both physical and virtual).
-"""
-
-# isort: skip_file
-
-# must come first to avoid circular imports
-from .positioner_soft_done import PVPositionerSoftDone
-from .positioner_soft_done import PVPositionerSoftDoneWithStop
-
-# other imports
-from .acs_motors import AcsMotor
-
-from .aps_bss_user import ApsBssUserInfoDevice
-
-from .aps_cycle import ApsCycleDM
-
-from .aps_data_management import DM_WorkflowConnector
-
-from .aps_machine import ApsMachineParametersDevice
-
-from .aps_undulator import PlanarUndulator
-from .aps_undulator import Revolver_Undulator
-from .aps_undulator import STI_Undulator
-from .aps_undulator import Undulator2M
-from .aps_undulator import Undulator4M
-
-from .area_detector_factory import ad_creator
-from .area_detector_factory import ad_class_factory
-from .area_detector_factory import PLUGIN_DEFAULTS
-
-from .area_detector_support import AD_EpicsFileNameMixin
-from .area_detector_support import AD_FrameType_schemes
-from .area_detector_support import AD_plugin_primed
-from .area_detector_support import AD_prime_plugin
-from .area_detector_support import AD_prime_plugin2
-from .area_detector_support import AD_full_file_name_local
-from .area_detector_support import AD_EpicsFileNameHDF5Plugin
-from .area_detector_support import AD_EpicsFileNameJPEGPlugin
-from .area_detector_support import AD_EpicsFileNameTIFFPlugin
-from .area_detector_support import AD_EpicsHdf5FileName
-from .area_detector_support import AD_EpicsHDF5IterativeWriter
-from .area_detector_support import AD_EpicsJPEGFileName
-from .area_detector_support import AD_EpicsJPEGIterativeWriter
-from .area_detector_support import AD_EpicsTIFFFileName
-from .area_detector_support import AD_EpicsTIFFIterativeWriter
-from .area_detector_support import BadPixelPlugin
-from .area_detector_support import CamMixin_V34
-from .area_detector_support import CamMixin_V3_1_1
-from .area_detector_support import HDF5FileWriterPlugin
-from .area_detector_support import SimDetectorCam_V34
-from .area_detector_support import SingleTrigger_V34
-from .area_detector_support import ensure_AD_plugin_primed
-
-from .avs_filters import AVSfilters
-
-from .axis_tuner import AxisTunerException
-from .axis_tuner import AxisTunerMixin
-
-from .delay import DG645Delay
-
-from .description_mixin import EpicsDescriptionMixin
-
-from .dict_device_support import dict_device_factory
-from .dict_device_support import make_dict_device
-
-from .epics_scan_id_signal import EpicsScanIdSignal
-
-from .eurotherm_2216e import Eurotherm2216e
-
-# issue #763
-# from .flyer_motor_scaler import FlyerBase
-# from .flyer_motor_scaler import ActionsFlyerBase
-# from .flyer_motor_scaler import ScalerMotorFlyer
-# from .flyer_motor_scaler import SignalValueStack
-# from .flyer_motor_scaler import _SMFlyer_Step_1
-# from .flyer_motor_scaler import _SMFlyer_Step_2
-# from .flyer_motor_scaler import _SMFlyer_Step_3
-
-from .hhl_apertures import HHLAperture
-
-from .hhl_slits import HHLSlits
-
-from .jj_transfocators import JJtransfocator1x, JJtransfocator2x
-from .jj_transfocators import JJtransfocator1xZ, JJtransfocator2xZ
-
-from .kohzu_monochromator import KohzuSeqCtl_Monochromator
-
-from .lakeshore_controllers import LakeShore336Device
-from .lakeshore_controllers import LakeShore340Device
-
-from .labjack import LabJackT4, LabJackT7, LabJackT7Pro, LabJackT8
-
-from .linkam_controllers import Linkam_CI94_Device
-from .linkam_controllers import Linkam_T96_Device
-
-from .measComp_tc32_support import MeasCompTc32
 
-from .measComp_usb_ctr_support import MeasCompCtr
-from .measComp_usb_ctr_support import MeasCompCtrMcs
-
-from .mixin_base import DeviceMixinBase
-
-from .motor_factory import axis_component
-from .motor_factory import mb_class_factory
-from .motor_factory import mb_creator
-
-from .motor_mixins import EpicsMotorDialMixin
-from .motor_mixins import EpicsMotorEnableMixin
-from .motor_mixins import EpicsMotorRawMixin
-from .motor_mixins import EpicsMotorResolutionMixin
-from .motor_mixins import EpicsMotorServoMixin
-
-from .ptc10_controller import PTC10AioChannel
-from .ptc10_controller import PTC10RtdChannel
-from .ptc10_controller import PTC10TcChannel
-from .ptc10_controller import PTC10PositionerMixin
-
-from .scaler_support import SCALER_AUTOCOUNT_MODE
-from .scaler_support import use_EPICS_scaler_channels
-
-from .shutters import ApsPssShutter
-from .shutters import ApsPssShutterWithStatus
-from .shutters import EpicsMotorShutter
-from .shutters import EpicsOnOffShutter
-from .shutters import OneSignalShutter
-from .shutters import ShutterBase
-from .shutters import SimulatedApsPssShutterWithStatus
-
-from .simulated_controllers import SimulatedSwaitControllerPositioner
-from .simulated_controllers import SimulatedTransformControllerPositioner
-
-from .srs570_preamplifier import SRS570_PreAmplifier
-
-from .struck3820 import Struck3820
-
-from .synth_pseudo_voigt import SynPseudoVoigt
-
-from .tracking_signal import TrackingSignal
-
-from .xia_pf4 import DualPf4FilterBox
-from .xia_pf4 import Pf4FilterBank
-from .xia_pf4 import Pf4FilterCommon
-from .xia_pf4 import Pf4FilterDual
-from .xia_pf4 import Pf4FilterSingle
-from .xia_pf4 import Pf4FilterTriple
-
-from .xia_slit import XiaSlit2D
-
-# synApps
-
-# ## _common
-from ..synApps import EpicsRecordDeviceCommonAll
-from ..synApps import EpicsRecordInputFields
-from ..synApps import EpicsRecordOutputFields
-from ..synApps import EpicsRecordFloatFields
-from ..synApps import EpicsSynAppsRecordEnableMixin
-
-# ## asyn
-from ..synApps import AsynRecord
-
-# ## busy
-from ..synApps import BusyRecord
-
-# ## calcout
-from ..synApps import CalcoutRecord
-from ..synApps import CalcoutRecordChannel
-from ..synApps import setup_gaussian_calcout
-from ..synApps import setup_incrementer_calcout
-from ..synApps import setup_lorentzian_calcout
-from ..synApps import UserCalcoutDevice
-from ..synApps import UserCalcoutN
-
-# ## epid
-from ..synApps import EpidRecord
-
-# ## iocstats
-from ..synApps import IocStatsDevice
-
-# ## save_data
-from ..synApps import SaveData
-
-# ## scalcout
-from ..synApps import UserScalcoutDevice
-from ..synApps import UserScalcoutN
-from ..synApps import ScalcoutRecord
-from ..synApps import ScalcoutRecordNumberChannel
-from ..synApps import ScalcoutRecordStringChannel
-
-# ## sscan
-from ..synApps import SscanRecord
-from ..synApps import SscanDevice
-
-# sseq
-from ..synApps import EditStringSequence
-from ..synApps import SseqRecord
-from ..synApps import UserStringSequenceDevice
-from ..synApps import UserStringSequenceN
-
-# ## sub
-from ..synApps import SubRecord
-from ..synApps import SubRecordChannel
-from ..synApps import UserAverageN
-from ..synApps import UserAverageDevice
-
-# ## swait
-from ..synApps import SwaitRecord
-from ..synApps import SwaitRecordChannel
-from ..synApps import UserCalcN
-from ..synApps import UserCalcsDevice
-from ..synApps import setup_random_number_swait
-from ..synApps import setup_gaussian_swait
-from ..synApps import setup_lorentzian_swait
-from ..synApps import setup_incrementer_swait
+Public names are imported from their module on first use (PEP 562).
+"""
 
-# ## transform
-from ..synApps import TransformRecord
-from ..synApps import UserTransformN
-from ..synApps import UserTransformsDevice
+from ..utils._lazy import lazy_import as _lazy_import
+
+_lazy_imports = {
+    "PVPositionerSoftDone": ".positioner_soft_done",
+    "PVPositionerSoftDoneWithStop": ".positioner_soft_done",
+    "AcsMotor": ".acs_motors",
+    "ApsBssUserInfoDevice": ".aps_bss_user",
+    "ApsCycleDM": ".aps_cycle",
+    "DM_WorkflowConnector": ".aps_data_management",
+    "ApsMachineParametersDevice": ".aps_machine",
+    "PlanarUndulator": ".aps_undulator",
+    "Revolver_Undulator": ".aps_undulator",
+    "STI_Undulator": ".aps_undulator",
+    "Undulator2M": ".aps_undulator",
+    "Undulator4M": ".aps_undulator",
+    "ad_creator": ".area_detector_factory",
+    "ad_class_factory": ".area_detector_factory",
+    "PLUGIN_DEFAULTS": ".area_detector_factory",
+    "AD_EpicsFileNameMixin": ".area_detector_support",
+    "AD_FrameType_schemes": ".area_detector_support",
+    "AD_plugin_primed": ".area_detector_support",
+    "AD_prime_plugin": ".area_detector_support",
+    "AD_prime_plugin2": ".area_detector_support",
+    "AD_full_file_name_local": ".area_detector_support",
+    "AD_EpicsFileNameHDF5Plugin": ".area_detector_support",
+    "AD_EpicsFileNameJPEGPlugin": ".area_detector_support",
+    "AD_EpicsFileNameTIFFPlugin": ".area_detector_support",
+    "AD_EpicsHdf5FileName": ".area_detector_support",
+    "AD_EpicsHDF5IterativeWriter": ".area_detector_support",
+    "AD_EpicsJPEGFileName": ".area_detector_support",
+    "AD_EpicsJPEGIterativeWriter": ".area_detector_support",
+    "AD_EpicsTIFFFileName": ".area_detector_support",
+    "AD_EpicsTIFFIterativeWriter": ".area_detector_support",
+    "BadPixelPlugin": ".area_detector_support",
+    "CamMixin_V34": ".area_detector_support",
+    "CamMixin_V3_1_1": ".area_detector_support",
+    "HDF5FileWriterPlugin": ".area_detector_support",
+    "SimDetectorCam_V34": ".area_detector_support",
+    "SingleTrigger_V34": ".area_detector_support",
+    "ensure_AD_plugin_primed": ".area_detector_support",
+    "AVSfilters": ".avs_filters",
+    "AxisTunerException": ".axis_tuner",
+    "AxisTunerMixin": ".axis_tuner",
+    "DG645Delay": ".delay",
+    "EpicsDescriptionMixin": ".description_mixin",
+    "dict_device_factory": ".dict_device_support",
+    "make_dict_device": ".dict_device_support",
+    "EpicsScanIdSignal": ".epics_scan_id_signal",
+    "Eurotherm2216e": ".eurotherm_2216e",
+    # issue #763
+    # from .flyer_motor_scaler import FlyerBase
+    # from .flyer_motor_scaler import ActionsFlyerBase
+    # from .flyer_motor_scaler import ScalerMotorFlyer
+    # from .flyer_motor_scaler import SignalValueStack
+    # from .flyer_motor_scaler import _SMFlyer_Step_1
+    # from .flyer_motor_scaler import _SMFlyer_Step_2
+    # from .flyer_motor_scaler import _SMFlyer_Step_3
+    "HHLAperture": ".hhl_apertures",
+    "HHLSlits": ".hhl_slits",
+    "JJtransfocator1x": ".jj_transfocators",
+    "JJtransfocator2x": ".jj_transfocators",
+    "JJtransfocator1xZ": ".jj_transfocators",
+    "JJtransfocator2xZ": ".jj_transfocators",
+    "KohzuSeqCtl_Monochromator": ".kohzu_monochromator",
+    "LakeShore336Device": ".lakeshore_controllers",
+    "LakeShore340Device": ".lakeshore_controllers",
+    "LabJackT4": ".labjack",
+    "LabJackT7": ".labjack",
+    "LabJackT7Pro": ".labjack",
+    "LabJackT8": ".labjack",
+    "Linkam_CI94_Device": ".linkam_controllers",
+    "Linkam_T96_Device": ".linkam_controllers",
+    "MeasCompTc32": ".measComp_tc32_support",
+    "MeasCompCtr": ".measComp_usb_ctr_support",
+    "MeasCompCtrMcs": ".measComp_usb_ctr_support",
+    "DeviceMixinBase": ".mixin_base",
+    "axis_component": ".motor_factory",
+    "mb_class_factory": ".motor_factory",
+    "mb_creator": ".motor_factory",
+    "EpicsMotorDialMixin": ".motor_mixins",
+    "EpicsMotorEnableMixin": ".motor_mixins",
+    "EpicsMotorRawMixin": ".motor_mixins",
+    "EpicsMotorResolutionMixin": ".motor_mixins",
+    "EpicsMotorServoMixin": ".motor_mixins",
+    "PTC10AioChannel": ".ptc10_controller",
+    "PTC10RtdChannel": ".ptc10_controller",
+    "PTC10TcChannel": ".ptc10_controller",
+    "PTC10PositionerMixin": ".ptc10_controller",
+    "SCALER_AUTOCOUNT_MODE": ".scaler_support",
+    "use_EPICS_scaler_channels": ".scaler_support",
+    "ApsPssShutter": ".shutters",
+    "ApsPssShutterWithStatus": ".shutters",
+    "EpicsMotorShutter": ".shutters",
+    "EpicsOnOffShutter": ".shutters",
+    "OneSignalShutter": ".shutters",
+    "ShutterBase": ".shutters",
+    "SimulatedApsPssShutterWithStatus": ".shutters",
+    "SimulatedSwaitControllerPositioner": ".simulated_controllers",
+    "SimulatedTransformControllerPositioner": ".simulated_controllers",
+    "SRS570_PreAmplifier": ".srs570_preamplifier",
+    "Struck3820": ".struck3820",
+    "SynPseudoVoigt": ".synth_pseudo_voigt",
+    "TrackingSignal": ".tracking_signal",
+    "DualPf4FilterBox": ".xia_pf4",
+    "Pf4FilterBank": ".xia_pf4",
+    "Pf4FilterCommon": ".xia_pf4",
+    "Pf4FilterDual": ".xia_pf4",
+    "Pf4FilterSingle": ".xia_pf4",
+    "Pf4FilterTriple": ".xia_pf4",
+    "XiaSlit2D": ".xia_slit",
+    # synApps
+    # ## _common
+    "EpicsRecordDeviceCommonAll": "..synApps",
+    "EpicsRecordInputFields": "..synApps",
+    "EpicsRecordOutputFields": "..synApps",
+    "EpicsRecordFloatFields": "..synApps",
+    "EpicsSynAppsRecordEnableMixin": "..synApps",
+    # ## asyn
+    "AsynRecord": "..synApps",
+    # ## busy
+    "BusyRecord": "..synApps",
+    # ## calcout
+    "CalcoutRecord": "..synApps",
+    "CalcoutRecordChannel": "..synApps",
+    "setup_gaussian_calcout": "..synApps",
+    "setup_incrementer_calcout": "..synApps",
+    "setup_lorentzian_calcout": "..synApps",
+    "UserCalcoutDevice": "..synApps",
+    "UserCalcoutN": "..synApps",
+    # ## epid
+    "EpidRecord": "..synApps",
+    # ## iocstats
+    "IocStatsDevice": "..synApps",
+    # ## save_data
+    "SaveData": "..synApps",
+    # ## scalcout
+    "UserScalcoutDevice": "..synApps",
+    "UserScalcoutN": "..synApps",
+    "ScalcoutRecord": "..synApps",
+    "ScalcoutRecordNumberChannel": "..synApps",
+    "ScalcoutRecordStringChannel": "..synApps",
+    # ## sscan
+    "SscanRecord": "..synApps",
+    "SscanDevice": "..synApps",
+    # sseq
+    "EditStringSequence": "..synApps",
+    "SseqRecord": "..synApps",
+    "UserStringSequenceDevice": "..synApps",
+    "UserStringSequenceN": "..synApps",
+    # ## sub
+    "SubRecord": "..synApps",
+    "SubRecordChannel": "..synApps",
+    "UserAverageN": "..synApps",
+    "UserAverageDevice": "..synApps",
+    # ## swait
+    "SwaitRecord": "..synApps",
+    "SwaitRecordChannel": "..synApps",
+    "UserCalcN": "..synApps",
+    "UserCalcsDevice": "..synApps",
+    "setup_random_number_swait": "..synApps",
+    "setup_gaussian_swait": "..synApps",
+    "setup_lorentzian_swait": "..synApps",
+    "setup_incrementer_swait": "..synApps",
+    # ## transform
+    "TransformRecord": "..synApps",
+    "UserTransformN": "..synApps",
+    "UserTransformsDevice": "..synApps",
+}
+
+__all__ = list(_lazy_imports)
+__getattr__, __dir__ = _lazy_import(__name__, _lazy_imports)
 
 # -----------------------------------------------------------------------------
 # :author:    BCDA
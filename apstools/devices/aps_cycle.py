@@ -7,12 +7,15 @@ APS cycles
    ~ApsCycleDM
 """
 
+import bisect
 import datetime
 import json
 import logging
 import pathlib
+import threading
 import time
 
+import numpy
 import yaml
 from deprecated.sphinx import versionchanged
 from ophyd.sim import SynSignalRO
@@ -20,6 +23,8 @@ from ophyd.sim import SynSignalRO
 logger = logging.getLogger(__name__)
 _PATH = pathlib.Path(__file__).parent
 YAML_CYCLE_FILE = _PATH / "aps_cycle_info.yml"
+_cycle_db = None  # created on first use, see cycle_db
+_cycle_db_lock = threading.Lock()
 
 
 class _ApsCycleDB:
@@ -29,6 +34,29 @@ class _ApsCycleDB:
 
     def __init__(self):
         self.db = self._read_cycle_data()
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Index the cycles by time for ``bisect`` searches.
+
+        ``self._bounds`` is the sorted list of all start & end times.
+        ``self._names[i]`` is the cycle from ``bounds[i]`` to ``bounds[i+1]``
+        (or ``None``).  Where cycles overlap, the first one in ``self.db``
+        is chosen.
+        """
+        spans = list(self.db.items())
+        bounds = sorted({t for _cycle, span in spans for t in (span["start"], span["end"])})
+        # fmt: off
+        self._names = [
+            next(
+                (cycle for cycle, span in spans if span["start"] <= t < span["end"]),
+                None,
+            )
+            for t in bounds[:-1]
+        ]
+        # fmt: on
+        self._bounds = bounds
 
     def get_cycle_name(self, ts=None):
         """
@@ -48,11 +76,31 @@ class _ApsCycleDB:
         Returns cycle name (str) or ``None`` if timestamp is not in data table.
         """
         ts = ts or time.time()
-        for cycle, span in self.db.items():
-            if span["start"] <= ts < span["end"]:
-                return cycle
+        i = bisect.bisect_right(self._bounds, ts) - 1
+        if 0 <= i < len(self._names):
+            return self._names[i]
         return None  # not found
 
+    def get_cycle_names(self, timestamps):
+        """
+        Get the names of the APS run cycles of many time stamps.
+
+        PARAMETERS
+
+        timestamps [float]:
+            Absolute time stamps (such as from ``time.time()``).
+
+        RETURNS
+
+        Returns list of cycle names (str or ``None`` if timestamp is not in
+        data table).
+        """
+        ts = numpy.atleast_1d(numpy.asarray(timestamps, dtype=float))
+        indices = numpy.searchsorted(self._bounds, ts, side="right") - 1
+        indices[(indices < 0) | (indices >= len(self._names))] = len(self._names)
+        names = numpy.array(self._names + [None], dtype=object)
+        return names[indices].tolist()
+
     def _read_cycle_data(self):
         """
         Read the list of APS run cycles from a local file.
@@ -61,8 +109,8 @@ class _ApsCycleDB:
         the APS Data Management package (*aps-dm-api*).  The YAML format is
         easily updated and human-readable.
         """
-        _cycles_yml = YAML_CYCLE_FILE.open().read()
-        _cycles = yaml.load(_cycles_yml, Loader=yaml.BaseLoader)
+        _cycles_yml = YAML_CYCLE_FILE.read_text()
+        _cycles = yaml.load(_cycles_yml, Loader=getattr(yaml, "CBaseLoader", yaml.BaseLoader))
 
         def iso2ts(isodatetime):
             return datetime.datetime.timestamp(datetime.datetime.fromisoformat(isodatetime))
@@ -131,7 +179,22 @@ class _ApsCycleDB:
             return None
 
 
-cycle_db = _ApsCycleDB()
+def _get_cycle_db():
+    """Return the table of APS cycles, read on first use."""
+    global _cycle_db
+
+    if _cycle_db is None:
+        with _cycle_db_lock:
+            if _cycle_db is None:
+                _cycle_db = _ApsCycleDB()
+    return _cycle_db
+
+
+def __getattr__(name):
+    """Read the table of APS cycles (``cycle_db``) when first used, not on import."""
+    if name == "cycle_db":
+        return _get_cycle_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @versionchanged(
@@ -156,6 +219,7 @@ class ApsCycleDM(SynSignalRO):
 
     def get(self):
         now = datetime.datetime.now()
+        cycle_db = _get_cycle_db()
         cycle = cycle_db.get_cycle_name()
         if cycle is None:  # empirical
             if now.month < 5:
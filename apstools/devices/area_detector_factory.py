@@ -73,16 +73,35 @@ support and switch to the plugin class from ophyd::
         ],
         plugin_defaults=plugin_defaults,
     )
+
+EXAMPLE 5: LAZY CONSTRUCTION
+
+Do not wait for PV connections at startup.  Plugins are created (and
+connected) on first use.  The asyn ports are validated in the background::
+
+    from ophyd.areadetector import SimDetectorCam
+    from apstools.devices import ad_creator
+
+    det = ad_creator(
+        "ad:", name="det", class_name="MySimDetector",
+        plugins=[{"cam": {"class": SimDetectorCam}}, "image", "hdf1"],
+        lazy=True,
+    )
+    # later, if needed
+    det.validate_ports_status.wait(timeout=30)
 """
 
+import hashlib
 import logging
-import uuid
+import threading
 
 logger = logging.getLogger(__name__)
 
 import ophyd.areadetector.plugins
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 from ophyd import ADComponent
+from ophyd.status import Status
 
 from ..utils import dynamic_import
 from .area_detector_support import AD_EpicsFileNameJPEGPlugin
@@ -242,16 +261,40 @@ example, the ``"class"`` could be replaced by a newer, version-specific class.
 Another use case is to remove an existing set of defaults.
 """
 
+_ad_class_cache = {}
+"""Classes built by ad_class_factory(), by (name, bases, plugins)."""
+
+_lazy_classes = {}
+"""Subclasses which do not wait for connections, by original class."""
+
+
+def _lazy_class(cls):
+    """Subclass of ``cls`` that does not wait to connect lazy components."""
+    if cls not in _lazy_classes:
+        # fmt: off
+        _lazy_classes[cls] = type(
+            f"{cls.__name__}_Lazy", (cls,), {"lazy_wait_for_connection": False}
+        )
+        # fmt: on
+    return _lazy_classes[cls]
+
 
 @versionadded(version="1.7.0")
-def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None):
+@versionchanged(version="1.8.0", reason="Add lazy.  Classes are cached.")
+def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None, lazy=False):
     """
     Build an Area Detector class with specified plugins.
 
+    The class is remembered.  The same class is returned when called again
+    with the same name, bases, plugins (and their configuration), and
+    ``lazy``.
+
     PARAMETERS
 
     name str :
         Name of the class to be created.
+        (default: ``"ADclass_HEX7"`` where HEX is a 7-digit hexadecimal
+        digest of the other arguments)
     bases object or tuple :
         Parent(s) of the new class.
         (default: ``(SingleTrigger_V34, DetectorBase)``)
@@ -262,6 +305,13 @@ def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None):
     plugin_defaults object :
         Plugin configuration dictionary.
         (default: ``None``, PLUGIN_DEFAULTS will be used.)
+    lazy bool :
+        When True, do not wait for PV connections: plugins (lazy components)
+        are created on first use and neither the detector nor its plugins
+        wait for their lazy components to connect when created.  PVs
+        connect in the background.  A plugin configuration may set its
+        own ``"lazy"`` key.
+        (default: ``False``)
 
     Here are a couple examples of the ``plugins`` keyword.
 
@@ -301,6 +351,8 @@ def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None):
     """
     if bases is None:
         bases = DEFAULT_DETECTOR_BASES
+    if not isinstance(bases, tuple):
+        bases = (bases,)
     if plugins is None:
         plugins = ["cam"]
     if plugin_defaults is None:
@@ -311,6 +363,7 @@ def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None):
         raise TypeError(f"Must be a dict.  Received {plugin_defaults=!r}")
 
     attributes = {}
+    components = []  # description of the components, for the cache
     for spec in plugins:
         if isinstance(spec, dict):
             config = list(spec.values())[0]
@@ -333,14 +386,54 @@ def ad_class_factory(name, bases=None, plugins=None, plugin_defaults=None):
             #    "apstools.devices.area_detector_support.SimDetectorCam_V34"
             component_class = dynamic_import(component_class)
         suffix = kwargs.pop("suffix")
+        if lazy:
+            component_class = _lazy_class(component_class)
+            kwargs.setdefault("lazy", True)
 
         # if "write_path_template" in defaults
         attributes[key] = ADComponent(component_class, suffix, **kwargs)
+        components.append((key, component_class, suffix, tuple(sorted(kwargs.items()))))
+
+    if lazy:
+        attributes["lazy_wait_for_connection"] = False
+
+    cache_key = (bases, tuple(components), lazy)
+    # Same name in every Python process (unlike hash()).
+    name = name or f"ADclass_{hashlib.sha256(repr(cache_key).encode()).hexdigest()[:7]}"
+    cache_key = (name,) + cache_key
+    try:
+        hash(cache_key)
+    except TypeError:  # Some configuration value cannot be hashed.
+        return type(name, bases, attributes)
+    if cache_key not in _ad_class_cache:
+        _ad_class_cache[cache_key] = type(name, bases, attributes)
+    return _ad_class_cache[cache_key]
+
+
+def _validate_ports_in_background(det):
+    """
+    Call ``det.validate_asyn_ports()`` in a thread.  Return a status object.
+
+    The status finishes when the ports are validated.  If validation fails,
+    the exception is set in the status (and logged).
+    """
+    status = Status(obj=det)  # Not DeviceStatus: do not stop det on failure.
+
+    def validate():
+        try:
+            det.validate_asyn_ports()
+        except Exception as exc:
+            logger.warning("%s: asyn port validation failed: %s", det.name, exc)
+            status.set_exception(exc)
+        else:
+            status.set_finished()
 
-    return type(name, bases, attributes)
+    threading.Thread(target=validate, name=f"{det.name}_validate_ports", daemon=True).start()
+    return status
 
 
 @versionadded(version="1.7.0")
+@versionchanged(version="1.8.0", reason="Add lazy, to validate ports in the background.")
 def ad_creator(
     prefix: str,
     *,
@@ -351,6 +444,7 @@ def ad_creator(
     plugin_defaults: dict = None,
     plugins=None,
     validate_ports: bool = True,
+    lazy: bool = False,
     **kwargs,
 ):
     """
@@ -364,8 +458,8 @@ def ad_creator(
         Name of the ophyd object.
     class_name str :
         Name of the class to be created.
-        (default: ``"ADclass_HEX7"`` where HEX is a random
-        7-digit hexadecimal string)
+        (default: ``"ADclass_HEX7"`` where HEX is a 7-digit hexadecimal
+        string derived from the plugin configuration)
     plugins list :
         Description of the plugins used.
     bases object or tuple:
@@ -387,20 +481,32 @@ def ad_creator(
         image.
 
         (new in apstools release 1.7.3)
+    lazy bool :
+        When True, plugins are lazy components (see
+        :func:`ad_class_factory`) and ``validate_ports`` runs in the
+        background.  Its status object is ``det.validate_ports_status``.
+        (This status is always set: it is already finished when not lazy
+        or when the ports are not validated.)
+        (default: ``False``)
     kwargs dict :
         Any additional keyword arguments for the new class definition.
         (default: ``{}``)
     """
-    class_name = class_name or f"ADclass_{str(uuid.uuid4())[:7]}"
     ad_class = ad_class_factory(
         class_name,
         bases,
         plugins,
         plugin_defaults=plugin_defaults,
+        lazy=lazy,
     )
     det = ad_class(prefix, name=name, **kwargs)
-    if validate_ports:
-        det.validate_asyn_ports()
+    if validate_ports and lazy:
+        det.validate_ports_status = _validate_ports_in_background(det)
+    else:
+        if validate_ports:
+            det.validate_asyn_ports()
+        det.validate_ports_status = Status(obj=det)
+        det.validate_ports_status.set_finished()  # Nothing more to validate.
     if ad_setup is not None:
         # User-defined setup (blocking code allowed) of the detector.
         ad_setup(det)
@@ -14,17 +14,44 @@ that a simple dictionary can be recorded in a bluesky data stream.
 import time
 
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 from ophyd import Component
 from ophyd import Device
 from ophyd import Signal
 
+CLASS_CACHE_SIZE = 128
+"""Most classes remembered by dict_device_factory() (least recently used are forgotten)."""
 
-def dict_device_factory(data={}):
+_dict_device_classes = {}
+"""Classes built by dict_device_factory(), by (class_name, keys & values)."""
+
+
+@versionchanged(version="1.8.0", reason="Classes are cached.  Add class_name.")
+def dict_device_factory(data={}, class_name="DictionaryDevice"):
     """
     Create a DictionaryDevice class using the supplied dictionary.
+
+    The class is remembered.  The same class is returned when called again
+    with the same class_name, keys, and (hashable) values.  Only the most
+    recently used ``CLASS_CACHE_SIZE`` classes are remembered.
     """
+    try:
+        # type(v): distinguish values that compare equal, such as 1 and 1.0
+        cache_key = (class_name,) + tuple((k, type(v), v) for k, v in data.items())
+        hash(cache_key)
+    except TypeError:  # Some value cannot be hashed.
+        cache_key = None
+    if cache_key in _dict_device_classes:
+        # Most recently used is last.
+        _dict_device_classes[cache_key] = _dict_device_classes.pop(cache_key)
+        return _dict_device_classes[cache_key]
+
     component_dict = {k: Component(Signal, value=v) for k, v in data.items()}
-    fc = type("DictionaryDevice", (Device,), component_dict)
+    fc = type(class_name, (Device,), component_dict)
+    if cache_key is not None:
+        _dict_device_classes[cache_key] = fc
+        while len(_dict_device_classes) > CLASS_CACHE_SIZE:
+            _dict_device_classes.pop(next(iter(_dict_device_classes)))
     return fc
 
 
@@ -54,11 +81,13 @@ def make_dict_device(obj, name="ddev"):
         return d_new
 
     obj = standardize(obj)
-    kv = {k: v["value"] for k, v in obj.items()}
-    ddev = dict_device_factory(kv)("", name=name)
-    # set the timestamps to what was read
+    # Same class for the same keys, whatever the values.
+    ddev = dict_device_factory(dict.fromkeys(obj))("", name=name)
     for k, v in obj.items():
-        getattr(ddev, k)._metadata["timestamp"] = v["timestamp"]
+        signal = getattr(ddev, k)
+        signal.put(v["value"])
+        # set the timestamps to what was read
+        signal._metadata["timestamp"] = v["timestamp"]
     return ddev
 
 
@@ -44,6 +44,7 @@ from typing import Type
 from typing import Union
 
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 from ophyd import Component
 from ophyd import Device
 from ophyd import EpicsMotor
@@ -60,6 +61,29 @@ DEFAULT_KIND: Kind = Kind.hinted | Kind.normal
 
 MOTORS_TYPE = Union[Sequence[str], Mapping[str, Optional[Union[str, Mapping]]]]
 
+CLASS_CACHE_SIZE: int = 128
+"""Most classes remembered by mb_class_factory() (least recently used are forgotten)."""
+
+_mb_class_cache: Dict[tuple, Type[Device]] = {}
+"""Classes built by mb_class_factory(), by structure of the specification."""
+
+
+def _structural_key(obj: Any) -> Any:
+    """
+    Return a hashable equivalent of 'obj' (dicts, lists, ... to tuples).
+
+    Raises TypeError if some part of 'obj' cannot be hashed.
+    """
+    if isinstance(obj, Mapping):
+        return ("{}",) + tuple((k, _structural_key(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return ("[]",) + tuple(_structural_key(v) for v in obj)
+    if isinstance(obj, (set, frozenset)):
+        return ("set",) + tuple(sorted(_structural_key(v) for v in obj))
+    hash(obj)
+    # Distinguish values that compare equal, such as 1, 1.0, and True.
+    return (type(obj), obj)
+
 
 def axis_component(
     parms: Union[None, str, Mapping[str, Any]],
@@ -91,6 +115,7 @@ def axis_component(
     if axis_class_name is not None and factory is not None:
         raise ValueError(f"Cannot be used together: {axis_class_name=!r} and {factory=!r}")
     if factory is not None:
+        factory = {**factory}  # Do not change the caller's dictionary.
         creator: Union[Callable[..., type], str] = factory.pop("function")
         if isinstance(creator, str):
             creator = dynamic_import(creator)
@@ -115,6 +140,7 @@ def axis_component(
 
 
 @versionadded(version="1.7.4")
+@versionchanged(version="1.8.0", reason="Classes are cached.")
 def mb_class_factory(
     motors: Union[MOTORS_TYPE, None] = None,
     class_bases: Sequence[Union[str, Type]] = DEFAULT_DEVICE_BASE_CLASSES,
@@ -123,6 +149,10 @@ def mb_class_factory(
     """
     Create a custom MotorBundle (or as specified in 'class_bases') class.
 
+    The class is remembered.  The same class is returned when called again
+    with the same motors, class_bases, and class_name.  Only the most
+    recently used ``CLASS_CACHE_SIZE`` classes are remembered.
+
     PARAMETERS
 
         motors:
@@ -142,6 +172,15 @@ def mb_class_factory(
     if not isinstance(class_bases, (list, set, tuple)):
         raise TypeError(f"Must be a list, received {class_bases=!r}")
 
+    try:
+        cache_key = _structural_key((class_name, class_bases, _motors))
+    except TypeError:  # Some part of the specification cannot be hashed.
+        cache_key = None
+    if cache_key in _mb_class_cache:
+        # Most recently used is last.
+        _mb_class_cache[cache_key] = _mb_class_cache.pop(cache_key)
+        return _mb_class_cache[cache_key]
+
     bases = [
         dynamic_import(base) if isinstance(base, str) else base
         # .
@@ -163,7 +202,12 @@ def mb_class_factory(
 
     factory_class_attributes["__init__"] = __init__
 
-    return type(class_name, tuple(bases), factory_class_attributes)
+    mb_class = type(class_name, tuple(bases), factory_class_attributes)
+    if cache_key is not None:
+        _mb_class_cache[cache_key] = mb_class
+        while len(_mb_class_cache) > CLASS_CACHE_SIZE:
+            _mb_class_cache.pop(next(iter(_mb_class_cache)))
+    return mb_class
 
 
 @versionadded(version="1.7.4")
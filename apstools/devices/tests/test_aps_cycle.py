@@ -77,3 +77,33 @@ def test_cycles(iso8601, cycle_name):
     dt = datetime.datetime.fromisoformat(iso8601)
     ts = datetime.datetime.timestamp(dt)
     assert aps_cycle.cycle_db.get_cycle_name(ts) == cycle_name
+
+
+def test_get_cycle_names():
+    db = aps_cycle.cycle_db
+
+    def linear_search(ts):
+        for cycle, span in db.db.items():
+            if span["start"] <= ts < span["end"]:
+                return cycle
+        return None
+
+    t_first = min(span["start"] for span in db.db.values())
+    t_last = max(span["end"] for span in db.db.values())
+    timestamps = [t_first - 1, t_first, t_last - 1, t_last, t_last + 1]
+    timestamps += list(range(int(t_first), int(t_last), 86_400 // 3))
+    # 2010-2 & 2010-3 overlap: first in the table wins
+    timestamps.append(db.db["2010-3"]["start"])
+
+    expected = [linear_search(ts) for ts in timestamps]
+    assert db.get_cycle_names(timestamps) == expected
+    assert [db.get_cycle_name(ts) for ts in timestamps] == expected
+    assert db.get_cycle_name(db.db["2010-3"]["start"]) == "2010-2"
+
+
+def test_cycle_db_lazy(monkeypatch):
+    monkeypatch.setattr(aps_cycle, "_cycle_db", None)
+    assert "_cycle_db" in vars(aps_cycle)
+    db = aps_cycle.cycle_db  # read on first use
+    assert isinstance(db, aps_cycle._ApsCycleDB)
+    assert aps_cycle.cycle_db is db
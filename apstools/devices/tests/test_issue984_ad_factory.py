@@ -4,9 +4,24 @@ Test the area detector factory class with an ophyd fake device.
 .. seealso:: https://github.com/BCDA-APS/apstools/issues/984#issuecomment-2195201893
 """
 
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+from ophyd import Device
+from ophyd.areadetector import DetectorBase
 from ophyd.sim import instantiate_fake_device as make_fake
 
 from ..area_detector_factory import ad_class_factory
+from ..area_detector_factory import ad_creator
+
+
+def eager_cam_name():
+    from ..area_detector_factory import PLUGIN_DEFAULTS
+
+    return PLUGIN_DEFAULTS["cam"]["class"].__name__
 
 
 def test_my_fake_area_detector():
@@ -17,3 +32,111 @@ def test_my_fake_area_detector():
     fake_ad.stage_sigs["cam.acquire_time"] = 2.0
     fake_ad.stage()
     assert fake_ad.cam.acquire_time.get() == 2.0
+
+
+def test_ad_class_cache():
+    plugins = ["cam", "image", {"hdf1": {"write_path_template": "/tmp/"}}]
+    ad_class = ad_class_factory("CachedAD", plugins=plugins)
+    assert ad_class_factory("CachedAD", plugins=list(plugins)) is ad_class
+    assert ad_class_factory("CachedAD", plugins=["cam"]) is not ad_class
+    assert ad_class_factory("OtherAD", plugins=plugins) is not ad_class
+    assert ad_class_factory("CachedAD", plugins=plugins, lazy=True) is not ad_class
+
+    # default name is the same for the same configuration
+    default = ad_class_factory(None, plugins=plugins)
+    assert default.__name__.startswith("ADclass_")
+    assert ad_class_factory(None, plugins=plugins) is default
+
+    # ... in every Python process (not from hash())
+    code = (
+        "from apstools.devices.area_detector_factory import ad_class_factory;"
+        f"print(ad_class_factory(None, plugins={plugins!r}).__name__)"
+    )
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        assert result.stdout.strip() == default.__name__
+
+
+@pytest.mark.parametrize("first", [True, False])
+def test_ad_class_cache_lazy(first):
+    """lazy is part of the cache key, whichever is created first."""
+    for name in (None, f"NoPlugins{first}"):
+        classes = {lazy: ad_class_factory(name, plugins=[], lazy=lazy) for lazy in (first, not first)}
+        assert classes[True] is not classes[False]
+        assert not classes[True].lazy_wait_for_connection
+        assert classes[False].lazy_wait_for_connection
+        if name is None:
+            assert classes[True].__name__ != classes[False].__name__
+
+
+def test_ad_class_lazy():
+    ad_class = ad_class_factory("LazyAD", plugins=["cam", "image", {"pva": {"lazy": False}}], lazy=True)
+    assert not ad_class.lazy_wait_for_connection
+    assert ad_class.cam.lazy
+    assert not ad_class.cam.cls.lazy_wait_for_connection
+    assert ad_class.cam.cls.__name__ == f"{eager_cam_name()}_Lazy"
+    assert ad_class.image.lazy
+    assert not ad_class.pva.lazy
+
+    eager = ad_class_factory("EagerAD", plugins=["cam"])
+    assert eager.lazy_wait_for_connection
+    assert eager.cam.cls.lazy_wait_for_connection
+
+    # not connected (no IOC), created without waiting for connections
+    det = ad_class("Fake:AD", name="det")
+    assert not det.cam.acquire.connected
+
+
+class SlowValidationDetector(DetectorBase):
+    release = threading.Event()  # validation waits for this
+
+    def validate_asyn_ports(self):
+        self.release.wait(timeout=5)
+        if self.prefix.startswith("bad"):
+            raise RuntimeError("ports")
+
+
+@pytest.mark.parametrize("prefix, success", [["Fake:AD", True], ["bad:AD", False]])
+def test_ad_creator_lazy(prefix, success):
+    SlowValidationDetector.release.clear()
+    det = ad_creator(
+        prefix,
+        name="det",
+        bases=SlowValidationDetector,
+        plugins=["cam", "image"],
+        lazy=True,
+    )
+    assert "image" not in det._signals  # not created yet
+
+    status = det.validate_ports_status
+    assert not status.done  # did not wait for validation
+    SlowValidationDetector.release.set()
+    if success:
+        status.wait(timeout=2)
+        assert status.success
+    else:
+        with pytest.raises(RuntimeError, match="ports"):
+            status.wait(timeout=2)
+
+
+class ValidatedDevice(Device):
+    validated = False
+
+    def validate_asyn_ports(self):
+        self.validated = True
+
+
+@pytest.mark.parametrize("validate_ports", [False, True])
+def test_ad_creator_validate_ports_status(validate_ports):
+    det = ad_creator(
+        "Fake:AD",
+        name="det",
+        bases=ValidatedDevice,
+        plugins=[],  # no PVs to connect
+        validate_ports=validate_ports,
+        lazy=False,
+    )
+    assert det.validated == validate_ports
+    assert det.validate_ports_status.done  # always set
+    assert det.validate_ports_status.success
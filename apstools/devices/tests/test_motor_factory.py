@@ -13,6 +13,8 @@ from ophyd import Device
 from ophyd import MotorBundle
 from ophyd import OphydObject
 
+from ..dict_device_support import dict_device_factory
+from ..dict_device_support import make_dict_device
 from ..motor_factory import axis_component
 from ..motor_factory import mb_class_factory
 from ..motor_factory import mb_creator
@@ -288,3 +290,94 @@ def test_mb_creator(
 
     if raises is not None and expected is not None:
         assert expected in str(reason)
+
+
+def test_mb_class_cache() -> None:
+    """Identical specifications share one class."""
+    motors = dict(x=dict(prefix="ioc:m1"), y=None)
+    cls = mb_class_factory(motors, class_name="CachedBundle")
+    assert mb_class_factory(dict(motors), class_name="CachedBundle") is cls
+    assert mb_class_factory(motors, class_name="OtherBundle") is not cls
+    assert mb_class_factory(dict(x=None, y=None), class_name="CachedBundle") is not cls
+    assert mb_class_factory(["x", "y"], class_name="CachedBundle") is not cls
+
+    # A factory specification is not changed by the call.
+    factory = dict(function="apstools.devices.mb_class_factory", motors=["a"])
+    specification = dict(x=dict(factory=factory))
+    mb_class_factory(specification)
+    assert factory == dict(function="apstools.devices.mb_class_factory", motors=["a"])
+
+    # Bundles made by mb_creator() share the class.
+    soft = dict(m1=dict(limits=(-10, 10)), m2=dict(limits=(-10, 10)))
+    assert type(mb_creator(motors=soft, name="b1")) is type(mb_creator(motors=soft, name="b2"))
+
+
+def test_dict_device_class_cache() -> None:
+    """Dictionary devices with the same keys & values share one class."""
+    cls = dict_device_factory(dict(a=1, b="two"))
+    assert dict_device_factory(dict(a=1, b="two")) is cls
+    assert dict_device_factory(dict(a=1.0, b="two")) is not cls
+    assert dict_device_factory(dict(a=1, b="two"), "Other") is not cls
+    assert dict_device_factory(dict(a=[1])) is not dict_device_factory(dict(a=[1]))
+
+    # make_dict_device() uses one class for the same keys.
+    d1 = make_dict_device(dict(a=1, b="two"))
+    d2 = make_dict_device(dict(a=[5], b=dict(c=3)))
+    assert type(d1) is type(d2)
+    assert d2.a.get() == [5]
+    assert d2.b.get() == dict(c=3)
+
+
+def test_class_cache_size(monkeypatch) -> None:
+    """The class caches forget the least recently used classes."""
+    from .. import dict_device_support
+    from .. import motor_factory
+
+    for module, cache, factory in (
+        (dict_device_support, "_dict_device_classes", lambda i: dict_device_factory(dict(t=i))),
+        (motor_factory, "_mb_class_cache", lambda i: mb_class_factory(dict(x=dict(prefix=f"ioc:m{i}")))),
+    ):
+        monkeypatch.setattr(module, "CLASS_CACHE_SIZE", 2)
+        monkeypatch.setattr(module, cache, {})
+        first = factory(0)
+        second = factory(1)
+        for i in range(2, 10):  # as if values change on every call
+            assert factory(0) is first  # recently used: kept
+            factory(i)
+        assert len(getattr(module, cache)) == 2
+        assert factory(1) is not second  # forgotten, made again
+
+
+@pytest.mark.benchmark
+def test_mb_class_cache_benchmark() -> None:
+    """Build 1000 bundles, with & without the class cache."""
+    import time
+    import tracemalloc
+
+    from ..motor_factory import _mb_class_cache
+
+    motors = {f"m{i}": dict(limits=(-10, 10)) for i in range(4)}  # soft positioners
+
+    def build(cached: bool):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        classes = set()
+        for i in range(1000):
+            if not cached:
+                _mb_class_cache.clear()
+            bundle = mb_creator(motors=motors, name=f"bundle{i}")
+            classes.add(type(bundle))
+        duration = time.perf_counter() - t0
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return classes, duration, peak
+
+    _mb_class_cache.clear()
+    classes, t_cached, mem_cached = build(True)
+    assert len(classes) == 1
+    classes, t_uncached, mem_uncached = build(False)
+    assert len(classes) == 1000
+    print(
+        f"1000 bundles: cached {t_cached:.3f}s ({mem_cached / 1e6:.1f} MB)"
+        f", uncached {t_uncached:.3f}s ({mem_uncached / 1e6:.1f} MB)"
+    )
@@ -5,13 +5,16 @@ from .alignment import lineup2
 from .alignment import edge_align
 from .alignment import tune_axes
 from .command_list import CommandFileReadError
+from .command_list import CommandFileValidationError
 from .command_list import command_list_as_table
+from .command_list import compile_command_file
 from .command_list import execute_command_list
 from .command_list import get_command_list
 from .command_list import parse_Excel_command_file
 from .command_list import parse_text_command_file
 from .command_list import register_command_handler
 from .command_list import run_command_file
+from .command_list import run_command_queue
 from .command_list import summarize_command_file
 from .doc_run import addDeviceDataAsStream
 from .doc_run import documentation_run
@@ -23,6 +26,7 @@ from .labels_to_streams import label_stream_stub
 from .nscan_support import nscan
 from .run_blocking_function_plan import run_blocking_function
 from .sscan_support import sscan_1D
+from .sscan_support import sscan_nD
 from .stage_sigs_support import restorable_stage_sigs
 from .stage_sigs_support import stage_sigs_wrapper
 from .xpcs_mesh import mesh_list_grid_scan
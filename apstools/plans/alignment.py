@@ -34,6 +34,7 @@ from scipy.optimize import curve_fit
 from scipy.special import erf
 
 from .. import utils
+from ..devices.dict_device_support import dict_device_factory
 from .doc_run import write_stream
 
 logger = logging.getLogger(__name__)
@@ -589,8 +590,8 @@ def lineup2(
                     _target[0] = find_peak_position()
                     if signal_stats.analysis is not None:
                         stats = signal_stats.analysis
-                        components = {k: Component(Signal) for k in stats}
-                        DynDevice = type("SignalStatsResults", (Device,), components)
+                        # Same class for the same statistics.
+                        DynDevice = dict_device_factory(dict.fromkeys(stats), "SignalStatsResults")
                         dev = DynDevice(name="lineup2_signal_stats")
                         for k, v in stats.items():
                             if isinstance(v, list):
@@ -5,28 +5,42 @@ nscan plan
 .. autosummary::
 
    ~CommandFileReadError
+   ~CommandFileValidationError
    ~command_list_as_table
+   ~compile_command_file
    ~execute_command_list
    ~get_command_list
    ~parse_Excel_command_file
    ~parse_text_command_file
    ~register_command_handler
    ~run_command_file
+   ~run_command_queue
    ~summarize_command_file
 """
 
+import copy
+import datetime
+import hashlib
+import json
 import logging
+import os
 import pathlib
+import threading
+import time
 
 import pyRestTable
 from bluesky import plan_stubs as bps
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 
 from .. import utils
 
 logger = logging.getLogger(__name__)
 logger.info(__file__)
 
+CHECKPOINT_TIMINGS = 100
+"""Number of command timings kept in the run_command_queue() checkpoint."""
+
 
 class CommandFileReadError(IOError):
     """
@@ -36,6 +50,63 @@ class CommandFileReadError(IOError):
     """
 
 
+class CommandFileValidationError(CommandFileReadError):
+    """
+    Exception when commands in a command file are not valid.
+
+    .. index:: Bluesky Exception; CommandFileValidationError
+
+    All the problems found are listed (by line number) in ``errors``.
+    """
+
+    def __init__(self, filename, errors):
+        self.filename = filename
+        self.errors = errors  # [(line_number, raw_command, message)]
+        text = "\n".join(f"  line {i}: {raw!r}: {msg}" for i, raw, msg in errors)
+        self.message = f"{len(errors)} invalid command(s) in {filename}:\n{text}"
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
+
+
+_command_file_cache = {}  # {absolute path: (mtime_ns, size, sha256, commands)}
+_command_file_cache_lock = threading.Lock()
+
+
+def _file_digest(path):
+    """Return the SHA-256 hash of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_commands(path, parser):
+    """
+    Return the commands parsed from 'path', parsing only if it has changed.
+
+    Cached by modification time.  If only that has changed, the content
+    hash decides if the file must be parsed again.
+    """
+    path = pathlib.Path(path).absolute()
+    stat = path.stat()
+    with _command_file_cache_lock:
+        cached = _command_file_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[3])
+
+    digest = _file_digest(path)
+    if cached is not None and cached[2] == digest:
+        commands = cached[3]  # touched, not changed
+    else:
+        commands = parser(path)
+    with _command_file_cache_lock:
+        _command_file_cache[path] = (stat.st_mtime_ns, stat.st_size, digest, commands)
+    return copy.deepcopy(commands)
+
+
 def command_list_as_table(commands, show_raw=False):
     """
     format a command list as a pyRestTable.Table object
@@ -55,6 +126,87 @@ def command_list_as_table(commands, show_raw=False):
     return tbl
 
 
+def _command_errors(commands, actions):
+    """Return [(line_number, raw_command, message)] of the invalid commands."""
+    known = {k.lower(): v for k, v in actions.items()}
+    errors = []
+    for action, args, line_number, raw_command in commands:
+        key = str(action).lower()
+        if key not in known:
+            errors.append((line_number, raw_command, f"unknown action {action!r}"))
+            continue
+        validator = known[key]
+        if validator is None:
+            continue
+        if isinstance(validator, int):
+            if len(args) != validator:
+                msg = f"expected {validator} parameter(s), received {len(args)}"
+                errors.append((line_number, raw_command, msg))
+            continue
+        try:
+            ok = validator(args)
+        except Exception as exc:  # Report it with the line, do not stop.
+            errors.append((line_number, raw_command, f"{type(exc).__name__}: {exc}"))
+        else:
+            if ok is False:
+                errors.append((line_number, raw_command, "parameters not valid"))
+
+    return errors
+
+
+@versionadded(version="1.8.0")
+def compile_command_file(filename, actions=None):
+    """
+    Read and validate a command file, return the command list.
+
+    Report *all* the invalid commands (by raising
+    :class:`CommandFileValidationError`) before any command is run, rather
+    than in the middle of the command list.  The command list is cached,
+    (see :func:`get_command_list`) so the file is parsed again only when
+    it changes.
+
+    PARAMETERS
+
+    filename
+        *str* :
+        Name of input text or Excel file.
+    actions
+        *dict* or ``None`` :
+        The known actions (see :func:`register_command_handler`).
+        (default: ``None``, the actions of the registered handler.
+        If there are none, actions are not validated.)
+
+    RETURNS
+
+    list of commands
+        *[command]* :
+        List of command tuples for use in ``execute_command_list()``
+
+    RAISES
+
+    CommandFileValidationError
+        if any command is not valid
+
+    SEE ALSO
+
+    .. autosummary::
+
+        ~get_command_list
+        ~register_command_handler
+        ~run_command_file
+    """
+    if actions is None:
+        actions = COMMAND_LIST_REGISTRY.actions
+    commands = get_command_list(filename)
+    if actions is None:
+        return commands
+
+    errors = _command_errors(commands, actions)
+    if len(errors) > 0:
+        raise CommandFileValidationError(filename, errors)
+    return commands
+
+
 @versionadded(version="1.1.7")
 def execute_command_list(filename, commands, md=None):
     """
@@ -153,10 +305,14 @@ def execute_command_list(filename, commands, md=None):
 
 
 @versionadded(version="1.1.7")
+@versionchanged(version="1.8.0", reason="Parsed command lists are cached.")
 def get_command_list(filename):
     """
     return command list from either text or Excel file
 
+    The file is parsed again only if it has changed (by modification time,
+    then by content hash) since the last call.
+
     SEE ALSO
 
     .. autosummary::
@@ -172,6 +328,11 @@ def get_command_list(filename):
     full_filename = pathlib.Path(filename)
     if not full_filename.exists():
         raise IOError(f"file not found: {filename}")
+    return _cached_commands(full_filename, _parse_command_file)
+
+
+def _parse_command_file(filename):
+    """Parse either text or Excel command file (no cache)."""
     try:
         commands = parse_Excel_command_file(filename)
     except (ValueError, utils.ExcelReadError):
@@ -188,6 +349,7 @@ class _HandlerRegistrar:
     """
 
     command = None
+    actions = None  # {action: validator}, for compile_command_file()
 
 
 @versionadded(version="1.1.7")
@@ -335,7 +497,8 @@ def parse_text_command_file(filename):
 
 
 @versionadded(version="1.1.7")
-def register_command_handler(handler=None):
+@versionchanged(version="1.8.0", reason="Add 'actions' to validate command files.")
+def register_command_handler(handler=None, actions=None):
     """
     Define the function called to execute the command list
 
@@ -347,6 +510,28 @@ def register_command_handler(handler=None):
         If ``None`` or not provided,
         will reset to :func:`~apstools.plans.execute_command_list()`,
         which is also the initial setting.
+    actions *dict* :
+        The actions handled by ``handler`` (not case sensitive), used by
+        :func:`~apstools.plans.compile_command_file()` to validate each
+        command.  The value for each action is one of:
+
+        * ``None`` : any parameters
+        * *int* : the number of parameters
+        * *callable* : called with the list of parameters, raises
+          ``ValueError`` (or returns ``False``) if they are not valid
+
+        If ``None`` or not provided, actions are not validated.
+
+    EXAMPLE::
+
+        register_command_handler(
+            my_execute_command_list,
+            actions=dict(
+                mono_shutter=lambda args: args[0] in ("open", "close"),
+                FlyScan=4,
+                preusaxstune=0,
+            ),
+        )
 
     SEE ALSO
 
@@ -360,16 +545,19 @@ def register_command_handler(handler=None):
         ~parse_text_command_file
     """
     COMMAND_LIST_REGISTRY.command = handler or execute_command_list
+    COMMAND_LIST_REGISTRY.actions = actions
 
 
 @versionadded(version="1.1.7")
+@versionchanged(version="1.8.0", reason="Validate the commands first.")
 def run_command_file(filename, md=None):
     """
     plan: execute a list of commands from a text or Excel file
 
     .. index:: Bluesky Plan; run_command_file
 
-    * Parse the file into a command list
+    * Parse (and validate) the file into a command list
+      (:func:`compile_command_file`)
     * yield the command list to the RunEngine (or other)
 
     SEE ALSO
@@ -379,16 +567,219 @@ def run_command_file(filename, md=None):
         ~execute_command_list
         ~get_command_list
         ~register_command_handler
+        ~run_command_queue
         ~summarize_command_file
         ~parse_Excel_command_file
         ~parse_text_command_file
     """
     _md = dict(command_file=filename)
     _md.update(md or {})
-    commands = get_command_list(filename)
+    commands = compile_command_file(filename)
     yield from COMMAND_LIST_REGISTRY.command(filename, commands, md=_md)
 
 
+def _read_checkpoint(checkpoint, full_filename):
+    """Return the checkpoint (dict) for this command file, or None."""
+    try:
+        with open(checkpoint, "r") as fp:
+            state = json.load(fp)
+    except (FileNotFoundError, ValueError):
+        return None
+    if state.get("filename") != str(full_filename):
+        logger.warning("Checkpoint %s is for another file: %s", checkpoint, state.get("filename"))
+        return None
+    return state
+
+
+def _write_checkpoint(checkpoint, state):
+    """Replace the checkpoint file (atomically: write a new file, then rename)."""
+    checkpoint = pathlib.Path(checkpoint)
+    tmp = checkpoint.with_name(f".{checkpoint.name}.{os.getpid()}.tmp")
+    with open(tmp, "w") as fp:
+        json.dump(state, fp, indent=2)
+        fp.flush()
+        os.fsync(fp.fileno())
+    os.replace(tmp, checkpoint)
+
+
+def _occurrence(commands, line_number, raw_command):
+    """Count the commands with this text, through this line."""
+    return len([c for c in commands if c[3] == raw_command and c[2] <= line_number])
+
+
+def _pending_commands(commands, state):
+    """
+    Return the commands after the last one completed.
+
+    The last completed command is found by its text and its occurrence
+    (the same text may be repeated in the file), in case lines were added
+    or removed above it.  If it is not found (the command was edited or
+    removed), use its line number.
+    """
+    last_line = state["line_number"]
+    last_command = state.get("raw_command")
+    occurrence = state.get("occurrence")
+    if last_line > 0 and last_command is not None and occurrence is not None:
+        matches = [c[2] for c in commands if c[3] == last_command]
+        if len(matches) >= occurrence:
+            found = matches[occurrence - 1]
+            if found != last_line:
+                logger.info("Last completed command %r moved: line %d to %d", last_command, last_line, found)
+                last_line = state["line_number"] = found
+        else:
+            logger.warning("Last completed command %r not found, resume after line %d", last_command, last_line)
+    return [c for c in commands if c[2] > last_line]
+
+
+@versionadded(version="1.8.0")
+def run_command_queue(
+    filename,
+    md=None,
+    checkpoint=None,
+    resume=True,
+    wait_for_more_s=0,
+    poll_interval_s=1.0,
+):
+    """
+    plan: execute commands from a text or Excel file, as a queue
+
+    .. index:: Bluesky Plan; run_command_queue
+
+    Like :func:`run_command_file`, but the file is read again (when it has
+    changed) after each command.  Commands appended, or edited after the
+    last completed command, are run without restarting the plan.
+
+    * Each command is passed, by itself, to the registered handler
+      (see :func:`register_command_handler`).
+    * A command that is not valid (see :func:`compile_command_file`) is
+      reported and skipped.
+    * After each command, its line number and text are written to the
+      ``checkpoint`` file.  If the plan is restarted (such as after a
+      crash), the queue resumes after the last completed command.  The
+      command is found by its text (and which repetition of that text it
+      is), so lines may be added or removed above it (even while the
+      queue runs).
+    * The metadata of each command includes ``command_queue``: line
+      number, when the command started, and timing of the queue so far.
+      The checkpoint file has the timing of the most recent commands
+      (up to ``CHECKPOINT_TIMINGS``).
+
+    To run the whole file again, use ``resume=False`` (or remove the
+    checkpoint file).
+
+    PARAMETERS
+
+    filename
+        *str* :
+        Name of input text or Excel file.
+    md
+        *dict* :
+        Metadata for every command.
+        (default: ``None``)
+    checkpoint
+        *str* :
+        Name of the checkpoint (JSON) file.
+        (default: ``None``, the command file name plus ``.checkpoint.json``)
+    resume
+        *bool* :
+        Resume after the line in the checkpoint file.
+        If ``False``, start from the beginning.
+        (default: ``True``)
+    wait_for_more_s
+        *float* :
+        When all commands are done, wait this long for more commands to
+        be added to the file.
+        (default: 0)
+    poll_interval_s
+        *float* :
+        While waiting for more commands, check the file this often.
+        (default: 1 s)
+
+    SEE ALSO
+
+    .. autosummary::
+
+        ~compile_command_file
+        ~register_command_handler
+        ~run_command_file
+    """
+    full_filename = pathlib.Path(filename).absolute()
+    if checkpoint is None:
+        checkpoint = full_filename.with_name(full_filename.name + ".checkpoint.json")
+
+    state = _read_checkpoint(checkpoint, full_filename) if resume else None
+    if state is None:
+        state = dict(
+            filename=str(full_filename),
+            line_number=0,
+            commands_completed=0,
+            completed_s=0.0,
+            timings=[],
+        )
+    if state["line_number"] > 0:
+        print(f"Resume {filename} after line {state['line_number']}.")
+
+    t_queue = time.monotonic()
+    deadline = None
+    while True:
+        actions = COMMAND_LIST_REGISTRY.actions
+        commands = get_command_list(full_filename)
+        pending = _pending_commands(commands, state)
+        if len(pending) == 0:
+            if deadline is None:
+                deadline = time.monotonic() + wait_for_more_s
+            if time.monotonic() >= deadline:
+                break
+            yield from bps.sleep(min(poll_interval_s, max(0, deadline - time.monotonic())))
+            continue
+        deadline = None
+
+        command = pending[0]
+        action, args, line_number, raw_command = command
+        errors = [] if actions is None else _command_errors([command], actions)
+        t0 = time.time()
+        t_start = time.monotonic()
+        if len(errors) > 0:
+            msg = errors[0][2]
+            logger.error("Skipping line %d of %s: %r: %s", line_number, filename, raw_command, msg)
+            print(f"Skipping line {line_number}: {raw_command!r}: {msg}")
+            status = "skipped"
+        else:
+            completed = state["commands_completed"]
+            previous = [t["elapsed_s"] for t in state["timings"] if t["status"] == "done"]
+            _md = dict(command_file=filename)
+            _md["command_queue"] = dict(
+                line_number=line_number,
+                started=datetime.datetime.fromtimestamp(t0).isoformat(sep=" "),
+                commands_completed=completed,
+                previous_command_s=previous[-1] if previous else None,
+                mean_command_s=state["completed_s"] / completed if completed else None,
+                queue_elapsed_s=t_start - t_queue,
+            )
+            _md.update(md or {})
+            yield from COMMAND_LIST_REGISTRY.command(filename, [command], md=_md)
+            status = "done"
+
+        elapsed = time.monotonic() - t_start
+        if status == "done":
+            state["commands_completed"] += 1
+            state["completed_s"] += elapsed
+        state["line_number"] = line_number
+        state["raw_command"] = raw_command
+        state["occurrence"] = _occurrence(commands, line_number, raw_command)
+        state["timings"].append(
+            dict(
+                line_number=line_number,
+                action=action,
+                started=t0,
+                elapsed_s=elapsed,
+                status=status,
+            )
+        )
+        state["timings"] = state["timings"][-CHECKPOINT_TIMINGS:]
+        _write_checkpoint(checkpoint, state)
+
+
 @versionadded(version="1.1.7")
 def summarize_command_file(filename):
     """
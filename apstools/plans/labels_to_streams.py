@@ -87,6 +87,11 @@ values record at both *start* and *end*, then use **two** decorators::
    ~label_stream_stub
    ~label_stream_wrapper
    ~When
+
+The labeled objects are found in the namespace by a (cached) index.  The
+namespace is walked once.  After that, only the symbols that are new or
+have changed are walked again.  Wrapping many plans (or every plan, as a
+RunEngine preprocessor) with label streams adds little time to each run.
 """
 
 from enum import Enum
@@ -101,7 +106,101 @@ from deprecated.sphinx import versionchanged
 from ..utils import getDefaultNamespace
 from .doc_run import write_stream
 
+_label_index_memo = None  # (namespace, _LabelIndex)
+
+
+class _LabelIndex:
+    """
+    Index of the labeled ophyd objects in a namespace.
 
+    Same content as ``bluesky.magics.get_labeled_devices(ns)``, but each
+    namespace symbol is walked only once.  :meth:`refresh` walks the symbols
+    that are new, bound to a different object, or with different labels.
+    It forgets symbols no longer in the namespace.
+    """
+
+    def __init__(self):
+        self.bec = None  # first BestEffortCallback in the namespace
+        self._symbols = {}  # symbol: signature
+        self._found = {}  # symbol: {label: [(name, obj)]}
+        self._devices = {}  # label: [(name, obj)], all symbols
+        self._objects = {}  # label: [obj], all symbols
+
+    @staticmethod
+    def _signature(obj):
+        """Summary of ``obj``, changes when it should be walked again."""
+        if hasattr(obj, "_ophyd_labels_"):
+            return obj, tuple(sorted(obj._ophyd_labels_))
+        return id(obj), type(obj)
+
+    def refresh(self, ns, full=False):
+        """
+        Update the index from namespace ``ns``.  Return the number of symbols walked (or forgotten).
+
+        Changes made *within* an indexed device (such as the ``kind`` of
+        its components) are not detected.  Use ``full=True`` to walk every
+        symbol again.
+        """
+        from bluesky.callbacks.best_effort import BestEffortCallback
+
+        self.bec = None
+        walked = 0
+        symbols = {}
+        for key, obj in list(ns.items()):
+            if self.bec is None and isinstance(obj, BestEffortCallback):
+                self.bec = obj
+            if key.startswith("_"):
+                continue  # as get_labeled_devices() does
+            signature = self._signature(obj)
+            symbols[key] = signature
+            known = self._symbols.get(key)
+            if full or known != signature:
+                self._found[key] = get_labeled_devices({key: obj})
+                walked += 1
+        for key in set(self._symbols) - set(symbols):
+            self._found.pop(key, None)
+            walked += 1
+        self._symbols = symbols
+
+        if walked > 0:
+            devices = {}
+            for found in self._found.values():
+                for label, pairs in found.items():
+                    devices.setdefault(label, []).extend(pairs)
+            # fmt: off
+            self._devices = {
+                label: sorted(pairs, key=lambda pair: pair[0])
+                for label, pairs in devices.items()
+            }
+            self._objects = {
+                label: [pair[-1] for pair in pairs]
+                for label, pairs in self._devices.items()
+            }
+            # fmt: on
+        return walked
+
+    @property
+    def labels(self):
+        """List of all the labels in the index."""
+        return list(self._devices)
+
+    def objects(self, label):
+        """List of the objects with ``label`` (empty if none)."""
+        return list(self._objects.get(label, []))
+
+
+def _label_index(ns):
+    """Return the (refreshed) label index of namespace ``ns``."""
+    global _label_index_memo
+
+    if _label_index_memo is None or _label_index_memo[0] is not ns:
+        _label_index_memo = (ns, _LabelIndex())
+    index = _label_index_memo[1]
+    index.refresh(ns)
+    return index
+
+
+@versionchanged(version="1.8.0", reason="Labeled objects found from a cached index.")
 @versionchanged(version="1.7.6", reason="Caller can specify namespace dict.")
 @versionadded(version="1.6.11")
 def label_stream_stub(labels=None, fmt=None, bec=None, ns: dict[str, object] = None):
@@ -130,31 +229,22 @@ def label_stream_stub(labels=None, fmt=None, bec=None, ns: dict[str, object] = N
         Namespace dictionary to search for labeled objects.
         Default: selected from default namespace, if available.
     """
-    from bluesky.callbacks.best_effort import BestEffortCallback
-
     fmt = fmt or "label_{}"
     ns = ns or getDefaultNamespace()
-    devices = get_labeled_devices(ns)
-    labels = labels or list(devices.keys())
+    index = _label_index(ns)
+    labels = labels or index.labels
     if not isinstance(labels, (list, tuple)):
         labels = [labels]
     if bec is None:  # look for bec in default namespace
-        for obj in ns.values():
-            if isinstance(obj, BestEffortCallback):
-                bec = obj
-                break
+        bec = index.bec
 
-    # fmt: off
     for label in labels:
-        if label in devices:
+        objects = index.objects(label)
+        if len(objects) > 0:
             stream_name = fmt.format(label)
             if bec is not None and stream_name not in bec.noplot_streams:
                 bec.noplot_streams.append(stream_name)
-            yield from write_stream(
-                [pair[-1] for pair in devices[label]],
-                stream_name
-            )
-    # fmt: on
+            yield from write_stream(objects, stream_name)
 
 
 @versionadded(version="1.6.11")
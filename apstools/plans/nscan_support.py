@@ -8,14 +8,29 @@ nscan plan
 """
 
 import datetime
+import os
 from collections import OrderedDict
+from collections import defaultdict
 
 import numpy as np
 from bluesky import plan_stubs as bps
 from bluesky import preprocessors as bpp
-
-
-def nscan(detectors, *motor_sets, num=11, per_step=None, md=None):
+from deprecated.sphinx import versionchanged
+
+
+@versionchanged(
+    version="1.8.0",
+    reason="Use the RunEngine pos_cache, add 'read_positions' & 'predeclare'.",
+)
+def nscan(
+    detectors,
+    *motor_sets,
+    num=11,
+    per_step=None,
+    md=None,
+    read_positions=False,
+    predeclare=None,
+):
     """
     Scan over ``n`` variables moved together, each in equally spaced steps.
 
@@ -42,6 +57,22 @@ def nscan(detectors, *motor_sets, num=11, per_step=None, md=None):
     md *dict*
         (optional)
         metadata
+    read_positions *bool* :
+        (optional)
+        If ``True``, read each motor's position (outside of the RunEngine)
+        before every step, as before release 1.8.0, for a ``per_step``
+        that needs the current positions in ``pos_cache``.
+        Otherwise, the plan keeps ``pos_cache`` as bluesky's own scans do
+        (the last position set, so unchanged motors are not moved).
+        (default: ``False``)
+    predeclare *bool* :
+        (optional)
+        Declare the ``primary`` stream (``bps.declare_stream()``) before
+        the first step.  Only with the default ``per_step``.
+        (default: ``None``, use environment variable ``BLUESKY_PREDECLARE``)
+
+    The trajectories of all motors are computed (as a table) before
+    the run starts.
 
     See the ``nscan()`` example in a Jupyter notebook:
     https://github.com/BCDA-APS/apstools/blob/master/docs/source/resources/demo_nscan.ipynb
@@ -63,12 +94,16 @@ def nscan(detectors, *motor_sets, num=11, per_step=None, md=None):
         if not isinstance(f, (int, float)):
             msg = "finish={} ({}): is not a number".format(f, type(f))
             raise ValueError(msg)
-        motors[m.name] = dict(
-            motor=m,
-            start=s,
-            finish=f,
-            steps=np.linspace(start=s, stop=f, num=num),
-        )
+        motors[m.name] = dict(motor=m, start=s, finish=f)
+
+    # trajectory table: one row for each step, one column for each motor
+    movers = [m["motor"] for m in motors.values()]
+    # fmt: off
+    trajectory = np.column_stack([
+        np.linspace(start=m["start"], stop=m["finish"], num=num)
+        for m in motors.values()
+    ]).tolist()
+    # fmt: on
 
     _md = {
         "detectors": [det.name for det in detectors],
@@ -96,19 +131,23 @@ def nscan(detectors, *motor_sets, num=11, per_step=None, md=None):
     else:
         _md["hints"].setdefault("dimensions", dimensions)
 
+    if predeclare is None:
+        predeclare = os.environ.get("BLUESKY_PREDECLARE", False)
+    predeclare = predeclare and per_step is None
     if per_step is None:
         per_step = bps.one_nd_step
 
-    @bpp.stage_decorator(list(detectors) + [m["motor"] for m in motors.values()])
+    @bpp.stage_decorator(list(detectors) + movers)
     @bpp.run_decorator(md=_md)
     def inner_scan():
-        for step in range(num):
-            step_cache, pos_cache = {}, {}
-            for m in motors.values():
-                next_pos = m["steps"][step]
-                m = m["motor"]
-                pos_cache[m] = m.read()[m.name]["value"]
-                step_cache[m] = next_pos
+        if predeclare:
+            yield from bps.declare_stream(*movers, *detectors, name="primary")
+
+        pos_cache = defaultdict(lambda: None)  # where last position is stashed
+        for row in trajectory:
+            step_cache = dict(zip(movers, row))
+            if read_positions:
+                pos_cache = {m: m.read()[m.name]["value"] for m in movers}
             yield from per_step(detectors, step_cache, pos_cache)
 
     return (yield from inner_scan())
@@ -5,18 +5,101 @@ sscan Record plans
 .. autosummary::
 
    ~sscan_1D
+   ~sscan_nD
 """
 
+import asyncio
+import concurrent.futures
+import threading
 import time
 from collections import OrderedDict
+from collections import deque
 
+import numpy as np
 from bluesky import plan_stubs as bps
-from ophyd import DeviceStatus
+from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
+from ophyd import Signal
 
 from .doc_run import write_stream
 
-new_data = False  # sscan has new data, boolean
-inactive_deadline = 0  # sscan timeout, absolute time.time()
+PHASE_RECORD_SCALAR_DATA = 15  # sscan.FAZE: "RECORD SCALAR DATA"
+ARRAY_READ_MAX_WORKERS = 16  # parallel reads of the final arrays
+
+
+class _EventQueue:
+    """
+    Events from EPICS callbacks, waiting to be handled by a plan.
+
+    Callbacks (in any thread) :meth:`put` events.  The plan waits with
+    ``bps.wait_for([queue.wait])`` and then takes them with :meth:`drain`.
+    Each plan invocation has its own queue.
+    """
+
+    def __init__(self):
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._waiter = None  # (loop, future) of the plan waiting now
+        self.last_activity = time.monotonic()
+
+    def put(self, event):
+        """Add an event (called from a callback thread)."""
+        with self._lock:
+            self._events.append(event)
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            loop, future = waiter
+            loop.call_soon_threadsafe(self._wake, future)
+
+    def touch(self):
+        """Note that the source is still active (no event)."""
+        self.last_activity = time.monotonic()
+
+    @staticmethod
+    def _wake(future):
+        if not future.done():
+            future.set_result(None)
+
+    def wait(self):
+        """Awaitable factory for ``bps.wait_for()``: done when events are queued."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if len(self._events) > 0:
+                future.set_result(None)
+            else:
+                self._waiter = (loop, future)
+        return future
+
+    def drain(self):
+        """Remove and return all the queued events, oldest first."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+
+class _Readings:
+    """
+    Readable snapshot of some signals, for ``write_stream()``.
+
+    Take the snapshot (set :attr:`reading`) in the callback that reports
+    the new data.  The signals will have new values by the time the plan
+    writes the event.  Use the same object for each event of a stream.
+    """
+
+    parent = None
+
+    def __init__(self, name, description):
+        self.name = name
+        self.reading = {}
+        self._description = description
+
+    def describe(self):
+        return self._description
+
+    def read(self):
+        return self.reading
 
 
 def _get_sscan_data_objects(sscan):
@@ -41,6 +124,68 @@ def _get_sscan_data_objects(sscan):
     return scan_data_objects
 
 
+def _read_acquired(signal, npts):
+    """Read the first 'npts' elements of an array signal."""
+    if npts <= 0:
+        return np.array([])
+    try:
+        # Ask EPICS (CA) for just the acquired elements.
+        value = signal.get(count=npts, use_monitor=False)
+    except TypeError:  # not an EPICS signal
+        value = signal.get()
+    return np.atleast_1d(np.asarray(value))[:npts]
+
+
+def _get_sscan_final_arrays(sscan, npts=None, max_workers=ARRAY_READ_MAX_WORKERS):
+    """
+    Read the acquired part of the sscan's positioner and detector arrays.
+
+    Only the configured channels (``read_attrs``) are read, in parallel.
+    Return a list of (soft) Signals with the trimmed arrays, named as the
+    sscan's array signals.
+
+    PARAMETERS
+
+    sscan
+        *Device* :
+        one EPICS sscan record (instance of `apstools.synApps.sscanRecord`)
+    npts
+        *int* or ``None`` :
+        Number of points to read.
+        (default: ``None``, the current point, or ``NPTS`` if that is zero)
+    max_workers
+        *int* :
+        Maximum number of arrays to read at the same time.
+        (default: 16)
+    """
+    if npts is None:
+        npts = int(sscan.current_point.get()) or int(sscan.number_points.get())
+
+    # fmt: off
+    arrays = [
+        # we have to search for the arrays since they have ``kind="omitted"``
+        # (which means they do not get reported by the ``.read()`` method)
+        getattr(part, nm).array
+        for part in (sscan.positioners, sscan.detectors)
+        for nm in part.read_attrs
+        if "." not in nm
+    ]
+    # fmt: on
+    if len(arrays) == 0:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        values = list(executor.map(lambda signal: _read_acquired(signal, npts), arrays))
+    return [Signal(name=signal.name, value=value) for signal, value in zip(arrays, values)]
+
+
+@versionchanged(
+    version="1.8.0",
+    reason=(
+        "Driven by sscan record callbacks, ``poll_delay_s`` is ignored."
+        "  Final arrays contain just the acquired points."
+    ),
+)
 def sscan_1D(
     sscan,
     poll_delay_s=0.001,
@@ -69,7 +214,8 @@ def sscan_1D(
         If set to `None`, this stream will not be written.
     final_array_stream *str*  or ``None`` :
         Name of document stream to write positioners and detectors data
-        posted *after* the sscan has ended.
+        posted *after* the sscan has ended.  Only the acquired points
+        of the configured channels are written.
         If set to `None`, this stream will not be written.
         (default: ``None``)
     device_settings_stream *str*  or ``None`` :
@@ -78,10 +224,8 @@ def sscan_1D(
         If set to `None`, this stream will not be written.
         (default: ``"settings"``)
     poll_delay_s *float* :
-        How long to sleep during each polling loop while collecting
-        interim data values and waiting for sscan to complete.
-        Must be a number between zero and 0.1 seconds.
-        (default: 0.001 seconds)
+        Ignored.  The plan waits for sscan record callbacks instead of
+        polling.  Kept for compatibility with existing code.
     phase_timeout_s *float* :
         How long to wait after last update of the ``sscan.FAZE``.
         When scanning, we expect the scan phase to update regularly
@@ -90,6 +234,11 @@ def sscan_1D(
         To cancel this feature, set it to ``None``.
         (default: 60 seconds)
 
+    Each time the sscan record reports ``RECORD SCALAR DATA`` (``FAZE``),
+    an event is queued.  The plan writes one ``running_stream`` event for
+    each, with the channel values read when the event was queued, so no
+    data point is skipped (or repeated) when points arrive quickly.
+
     NOTE about the document stream names
 
     Make certain the names for the document streams are different from
@@ -109,83 +258,83 @@ def sscan_1D(
         RE(sscan_1D(scans.scan1), md=dict(purpose="demo"))
 
     """
-    global new_data, inactive_deadline
-
-    if not (0 <= poll_delay_s <= 0.1):
-        # fmt: off
-        raise ValueError(
-            "poll_delay_s must be a number between 0 and 0.1,"
-            f" received {poll_delay_s}"
-        )
-        # fmt: on
-
     t0 = time.time()
-    sscan_status = DeviceStatus(sscan.execute_scan)
-    started = False
-    new_data = False
-    inactive_deadline = time.time()
-    if phase_timeout_s is not None:
-        inactive_deadline += phase_timeout_s
-
-    def execute_cb(value, timestamp, **kwargs):
+    events = _EventQueue()
+
+    def execute_cb(value, **kwargs):
         """watch for sscan to complete"""
-        if started and value in (0, "IDLE"):
-            sscan_status._finished()
-            sscan.execute_scan.unsubscribe_all()
-            sscan.scan_phase.unsubscribe_all()
-
-    def phase_cb(value, timestamp, **kwargs):
-        """watch for new data"""
-        global new_data, inactive_deadline
-        if phase_timeout_s is not None:
-            inactive_deadline = time.time() + phase_timeout_s
-        if value in (15, "RECORD SCALAR DATA"):
-            new_data = True  # set flag for main plan
+        events.put(("idle" if value in (0, "IDLE") else "busy", None))
+
+    def phase_cb(value, **kwargs):
+        """watch for new data, read it now"""
+        events.touch()
+        if value in (PHASE_RECORD_SCALAR_DATA, "RECORD SCALAR DATA"):
+            reading = {}
+            for obj in sscan_data_objects:
+                reading.update(obj.read())
+            events.put(("data", reading))
 
     # acquire only the channels with non-empty configuration in EPICS
     sscan.select_channels()
     # pre-identify the configured channels
-    sscan_data_objects = _get_sscan_data_objects(sscan)
-
-    # watch for sscan to complete
-    sscan.execute_scan.subscribe(execute_cb)
-    # watch for new data to be read out
-    sscan.scan_phase.subscribe(phase_cb)
+    sscan_data_objects = list(_get_sscan_data_objects(sscan).values())
+    description = {}
+    for obj in sscan_data_objects:
+        description.update(obj.describe())
+    point = _Readings(sscan.name, description)
 
     _md = dict(plan_name="sscan_1D")
     _md.update(md or {})
 
-    uid = yield from bps.open_run(_md)  # start data collection
-    yield from bps.mv(sscan.execute_scan, 1)  # start sscan
-    started = True
-
-    # collect and emit data, wait for sscan to end
-    while not sscan_status.done or new_data:
-        if new_data and running_stream is not None:
-            yield from write_stream(sscan_data_objects.values(), running_stream)
-        new_data = False
-        if phase_timeout_s is not None and time.time() > inactive_deadline:
-            print(f"No change in sscan record for {phase_timeout_s} seconds.")
-            print("ending plan early as unsuccessful")
-            sscan_status._finished(success=False)
-        yield from bps.sleep(poll_delay_s)
-
-    # dump the complete data arrays
+    # watch for sscan to complete & for new data to be read out
+    subscriptions = [
+        (sscan.execute_scan, sscan.execute_scan.subscribe(execute_cb, run=False)),
+        (sscan.scan_phase, sscan.scan_phase.subscribe(phase_cb, run=False)),
+    ]
+    try:
+        uid = yield from bps.open_run(_md)  # start data collection
+        events.drain()  # Ignore anything before the sscan is started.
+        events.touch()
+        # start sscan: put(), not set(), which would wait for the readback to
+        # equal 1.  A short sscan could be done (EXSC=0) before then.
+        # The callbacks report when the sscan is done.
+        sscan.execute_scan.put(1)
+
+        # collect and emit data, wait for sscan to end
+        started = False
+        finished = False
+        while True:
+            for event, reading in events.drain():
+                if event == "busy":
+                    started = True
+                elif event == "idle" and started:
+                    finished = True
+                elif event == "data":
+                    started = True
+                    if running_stream is not None:
+                        point.reading = reading
+                        yield from write_stream(point, running_stream)
+            if finished:
+                break
+
+            timeout = None
+            if phase_timeout_s is not None:
+                timeout = events.last_activity + phase_timeout_s - time.monotonic()
+                if timeout <= 0:
+                    print(f"No change in sscan record for {phase_timeout_s} seconds.")
+                    print("ending plan early as unsuccessful")
+                    break
+            try:
+                yield from bps.wait_for([events.wait], timeout=timeout)
+            except TimeoutError:  # bluesky raises WaitForTimeoutError
+                pass  # Check the deadline again.
+    finally:
+        for signal, cid in subscriptions:
+            signal.unsubscribe(cid)
+
+    # dump the data arrays, just the acquired points
     if final_array_stream is not None:
-        # fmt: off
-        yield from write_stream(
-            [
-                # TODO: write just the acquired data, not the FULL arrays!
-                getattr(part, nm).array
-                # we have to search for the arrays since they have ``kind="omitted"``
-                # (which means they do not get reported by the ``.read()`` method)
-                for part in (sscan.positioners, sscan.detectors)
-                for nm in part.read_attrs
-                if "." not in nm
-            ],
-            final_array_stream
-        )
-        # fmt: on
+        yield from write_stream(_get_sscan_final_arrays(sscan), final_array_stream)
 
     # dump the entire sscan record into another stream
     if device_settings_stream is not None:
@@ -199,6 +348,251 @@ def sscan_1D(
     return uid
 
 
+def _sscan_channels(sscan, detectors=True):
+    """
+    List the configured channels of a sscan record as (value, array) pairs.
+
+    The *value* signal (positioner readback or detector current value)
+    names the data, the *array* signal has the values of all the points.
+    """
+    parts = [(sscan.positioners, "readback_value")]
+    if detectors:
+        parts.append((sscan.detectors, "current_value"))
+    channels = []
+    for part, value_attr in parts:
+        for nm in part.read_attrs:
+            if "." not in nm:
+                channel = getattr(part, nm)
+                channels.append((getattr(channel, value_attr), channel.array))
+    return channels
+
+
+def _data_key(signal, shape=None):
+    """Describe (for an event descriptor) one value of a sscan signal."""
+    pvname = getattr(signal, "pvname", None)
+    source = "SIM" if pvname is None else f"PV:{pvname}"
+    return dict(source=source, dtype="number", shape=shape or [])
+
+
+class _SscanRows:
+    """
+    Rows of a multi-dimensional sscan, collected as event pages.
+
+    One event for each point of the inner sscan record, one event page
+    for each row (each time the inner sscan record has finished).
+    """
+
+    def __init__(self, name, stream, inner_channels, outer_signals):
+        self.name = name
+        self.parent = None
+        self.stream = stream
+        self.inner_channels = inner_channels
+        self.outer_signals = outer_signals
+        self._pages = deque()
+
+    def describe_collect(self):
+        """Describe the data from :meth:`~collect_pages()`."""
+        data_keys = {sig.name: _data_key(sig) for sig, _ in self.inner_channels}
+        data_keys.update({sig.name: _data_key(sig) for sig in self.outer_signals})
+        return {self.stream: data_keys}
+
+    def read_row(self, npts, max_workers=ARRAY_READ_MAX_WORKERS):
+        """Read the acquired points of the inner record.  (Call from a thread.)"""
+        arrays = [array for _, array in self.inner_channels]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            values = list(executor.map(lambda signal: _read_acquired(signal, npts), arrays))
+        t_row = time.time()
+
+        npts = min([npts] + [len(v) for v in values])
+        data = {sig.name: v[:npts].tolist() for (sig, _), v in zip(self.inner_channels, values)}
+        data.update({sig.name: [sig.get()] * npts for sig in self.outer_signals})
+        return dict(
+            time=[t_row] * npts,
+            data=data,
+            timestamps={k: [t_row] * npts for k in data},
+        )
+
+    def add_page(self, page):
+        """Queue a page to be collected."""
+        self._pages.append(page)
+
+    def collect_pages(self):
+        """Yield (and forget) the pages read so far."""
+        while len(self._pages) > 0:
+            yield self._pages.popleft()
+
+
+@versionadded(version="1.8.0")
+def sscan_nD(
+    sscans,
+    phase_timeout_s=60.0,
+    stream="primary",
+    device_settings_stream="settings",
+    hold_rows=True,
+    md=None,
+):
+    """
+    multi-dimensional scan using chained EPICS synApps sscan records
+
+    .. index:: Bluesky Plan; sscan_nD
+
+    The sscan records must be setup (and chained) already: each outer
+    record triggers the next inner record (such as ``scan2.T1PV`` is
+    ``scan1.EXSC``).  The scan runs entirely in the IOC.  The plan starts
+    the outermost record.
+
+    Each time the innermost record finishes (a *row*), its acquired
+    points are written to ``stream`` as one event page (one event for
+    each point), with the positions of the outer records.
+
+    PARAMETERS
+
+    sscans *[Device]* :
+        list of EPICS sscan records (instances of
+        `apstools.synApps.sscanRecord`), innermost first,
+        such as ``[scans.scan1, scans.scan2]``.
+    phase_timeout_s *float* :
+        How long to wait after the last update of any ``sscan.FAZE``.
+        If the scan hangs for some reason, this is a way to end the
+        plan early.  To cancel this feature, set it to ``None``.
+        (default: 60 seconds)
+    stream *str* :
+        Name of document stream to write the rows.
+        (default: ``"primary"``)
+    device_settings_stream *str*  or ``None`` :
+        Name of document stream to write *settings* of the sscan devices.
+        If set to `None`, this stream will not be written.
+        (default: ``"settings"``)
+    hold_rows *bool* :
+        If ``True``, use the inner record's *wait for client* feature
+        (``AWCT``, ``WCNT``, ``WAIT``) so the next row does not start
+        before this row has been read.  Otherwise, read each row when
+        the inner record reports its data is ready (``DATA``).
+        (default: ``True``)
+
+    EXAMPLE
+
+    Assume that ``scan1`` and ``scan2`` have already been setup.
+
+        from apstools.synApps import SscanDevice
+        scans = SscanDevice(P, name="scans")
+
+        from apstools.plans import sscan_nD
+        RE(sscan_nD([scans.scan1, scans.scan2]), md=dict(purpose="demo"))
+
+    """
+    if len(sscans) < 1:
+        raise ValueError("Need at least one sscan record.")
+
+    t0 = time.time()
+    inner, outer = sscans[0], sscans[-1]
+    events = _EventQueue()
+    row_reader = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # rows in order
+
+    # acquire only the channels with non-empty configuration in EPICS
+    for sscan in sscans:
+        sscan.select_channels()
+    rows = _SscanRows(
+        f"{inner.name}_rows",
+        stream,
+        _sscan_channels(inner),
+        [
+            # positions of the outer records
+            signal
+            for sscan in sscans[1:]
+            for signal, _ in _sscan_channels(sscan, detectors=False)
+        ],
+    )
+
+    def read_row():
+        npts = int(inner.current_point.get()) or int(inner.number_points.get())
+        try:
+            return rows.read_row(npts)
+        finally:
+            if hold_rows:
+                inner.wait.put(0)  # Release the inner record.
+
+    def row_cb(value, old_value=None, **kwargs):
+        """watch for each row to finish (data ready or waiting for clients)"""
+        if value and not old_value:
+            events.put(("row", row_reader.submit(read_row)))
+
+    def execute_cb(value, **kwargs):
+        """watch for sscan to complete"""
+        events.put(("idle",) if value in (0, "IDLE") else ("busy",))
+
+    def phase_cb(value, **kwargs):
+        events.touch()
+
+    _md = dict(plan_name="sscan_nD", sscan_dimensions=len(sscans))
+    _md.update(md or {})
+
+    if hold_rows:
+        # One more client: the inner record waits (WCNT > 0) for the plan.
+        awct = inner.awct.get()
+        inner.awct.put(awct + 1)
+        row_signal = inner.wcnt
+    else:
+        row_signal = inner.data_ready
+
+    # watch for sscan to complete, rows to finish, & activity
+    subscriptions = [
+        (outer.execute_scan, outer.execute_scan.subscribe(execute_cb, run=False)),
+        (row_signal, row_signal.subscribe(row_cb, run=False)),
+    ] + [(sscan.scan_phase, sscan.scan_phase.subscribe(phase_cb, run=False)) for sscan in sscans]
+    try:
+        uid = yield from bps.open_run(_md)  # start data collection
+        events.drain()  # Ignore anything before the sscan is started.
+        events.touch()
+        # see sscan_1D() for why put() and not set()
+        outer.execute_scan.put(1)
+
+        started = False
+        finished = False
+        while True:
+            for event in events.drain():
+                if event[0] == "busy":
+                    started = True
+                elif event[0] == "idle" and started:
+                    finished = True
+                elif event[0] == "row":
+                    future = event[1]
+                    yield from bps.wait_for([lambda: asyncio.wrap_future(future)])
+                    rows.add_page(future.result())
+                    yield from bps.collect(rows, return_payload=False)
+            if finished:
+                break
+
+            timeout = None
+            if phase_timeout_s is not None:
+                timeout = events.last_activity + phase_timeout_s - time.monotonic()
+                if timeout <= 0:
+                    print(f"No change in sscan records for {phase_timeout_s} seconds.")
+                    print("ending plan early as unsuccessful")
+                    break
+            try:
+                yield from bps.wait_for([events.wait], timeout=timeout)
+            except TimeoutError:  # bluesky raises WaitForTimeoutError
+                pass  # Check the deadline again.
+    finally:
+        for signal, cid in subscriptions:
+            signal.unsubscribe(cid)
+        row_reader.shutdown(wait=True)
+        if hold_rows:
+            inner.awct.put(awct)
+
+    # dump the sscan records into another stream
+    if device_settings_stream is not None:
+        yield from write_stream(list(sscans), device_settings_stream)
+
+    yield from bps.close_run()
+
+    elapsed = time.time() - t0
+    print(f"total time for sscan_nD: {elapsed} s")
+
+    return uid
+
+
 # -----------------------------------------------------------------------------
 # :author:    BCDA
 # :copyright: (c) 2017-2026, UChicago Argonne, LLC
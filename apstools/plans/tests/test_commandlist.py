@@ -2,14 +2,25 @@
 Test the command list support.
 """
 
+import os
 import pathlib
+import shutil
+
+import json
 
 import pyRestTable
 import pytest
+from bluesky import RunEngine
+from bluesky import plan_stubs as bps
 
 from .. import CommandFileReadError
+from .. import CommandFileValidationError
 from .. import command_list_as_table
+from .. import compile_command_file
 from .. import get_command_list
+from .. import register_command_handler
+from .. import run_command_queue
+from .. import command_list
 
 DATA_PATH = pathlib.Path(__file__).parent
 
@@ -142,3 +153,197 @@ def test_known_exceptions(error, expected, item):
     with pytest.raises(error) as exc:
         get_command_list(item)
     assert str(exc.value).startswith(expected)
+
+
+def test_command_file_cache(tmp_path, monkeypatch, text_command_file):
+    filename = tmp_path / "actions.txt"
+    shutil.copy(text_command_file, filename)
+
+    parsed = []
+    parser = command_list.parse_text_command_file
+
+    def counting_parser(*args, **kwargs):
+        parsed.append(args)
+        return parser(*args, **kwargs)
+
+    monkeypatch.setattr(command_list, "parse_text_command_file", counting_parser)
+
+    commands = get_command_list(filename)
+    assert len(commands) == 5
+    assert len(parsed) == 1
+    commands[0][1].append("changed by caller")
+    assert get_command_list(filename) == parser(filename)  # a copy from the cache
+    assert len(parsed) == 1
+
+    # touched, not changed: same hash
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(get_command_list(filename)) == 5
+    assert len(parsed) == 1
+
+    with open(filename, "a") as f:
+        f.write("SAXS 1 1 1 appended\n")
+    assert len(get_command_list(filename)) == 6
+    assert len(parsed) == 2
+
+
+def test_compile_command_file(text_command_file):
+    actions = dict(
+        sample_slits=4,
+        preusaxstune=None,
+        flyscan=lambda args: float(args[2]) >= 0,
+    )
+    with pytest.raises(CommandFileValidationError) as exc:
+        compile_command_file(text_command_file, actions=actions)
+    assert exc.value.errors == [(12, "SAXS 0 0 0 blank", "unknown action 'SAXS'")]
+    assert "line 12" in str(exc.value)
+    assert isinstance(exc.value, CommandFileReadError)
+
+    actions["SAXS"] = lambda args: float(args[0]) > 0
+    actions["sample_slits"] = 3
+    with pytest.raises(CommandFileValidationError) as exc:
+        compile_command_file(text_command_file, actions=actions)
+    assert [err[0] for err in exc.value.errors] == [5, 12]  # all the problems
+    assert "expected 3 parameter(s), received 4" in exc.value.errors[0][2]
+
+    actions["sample_slits"] = 4
+    actions["SAXS"] = lambda args: float(args[3])  # raises ValueError
+    with pytest.raises(CommandFileValidationError) as exc:
+        compile_command_file(text_command_file, actions=actions)
+    assert "could not convert" in exc.value.errors[0][2]
+
+    actions["SAXS"] = lambda args: args[9] in ("open", "close")  # raises IndexError
+    with pytest.raises(CommandFileValidationError) as exc:
+        compile_command_file(text_command_file, actions=actions)
+    assert exc.value.errors == [(12, "SAXS 0 0 0 blank", "IndexError: list index out of range")]
+
+    actions["SAXS"] = 4
+    assert len(compile_command_file(text_command_file, actions=actions)) == 5
+
+    # from the registered handler
+    try:
+        register_command_handler(actions=dict(flyscan=4))
+        with pytest.raises(CommandFileValidationError) as exc:
+            compile_command_file(text_command_file)
+        assert len(exc.value.errors) == 3
+    finally:
+        register_command_handler()
+    assert len(compile_command_file(text_command_file)) == 5  # not validated
+
+
+def test_run_command_queue(tmp_path, text_command_file):
+    filename = tmp_path / "queue.txt"
+    shutil.copy(text_command_file, filename)
+    checkpoint = tmp_path / "queue.checkpoint.json"
+    executed = []
+    crashed = []
+
+    def handler(fname, commands, md=None):
+        assert len(commands) == 1  # one at a time
+        action, args, line_number, raw_command = commands[0]
+        executed.append((line_number, md["command_queue"]))
+        if line_number == 7:
+            with open(filename, "a") as f:  # picked up without restarting
+                f.write("SAXS 1 1 1 appended\n")
+        if line_number == 11 and not crashed:
+            crashed.append(line_number)
+            raise RuntimeError("simulated crash")
+        yield from bps.null()
+
+    RE = RunEngine({})
+    try:
+        register_command_handler(handler, actions=dict(sample_slits=4, preusaxstune=0, flyscan=4, saxs=4))
+        with pytest.raises(RuntimeError):
+            RE(run_command_queue(filename, checkpoint=checkpoint))
+        assert [i for i, _ in executed] == [5, 7, 10, 11]
+        assert json.loads(checkpoint.read_text())["line_number"] == 10
+
+        # resume after the crash, then edit a line not yet run
+        executed.clear()
+        text = filename.read_text().replace("SAXS 0 0 0 blank", "SAXS 0 0 0")  # not valid
+        filename.write_text(text)
+        RE(run_command_queue(filename, checkpoint=checkpoint))
+    finally:
+        register_command_handler()
+
+    assert [i for i, _ in executed] == [11, 13]  # line 12 skipped
+    queue_md = executed[-1][1]
+    assert queue_md["line_number"] == 13
+    assert queue_md["commands_completed"] == 4
+    assert queue_md["mean_command_s"] >= 0
+
+    state = json.loads(checkpoint.read_text())
+    assert state["line_number"] == 13
+    assert [t["status"] for t in state["timings"]] == ["done"] * 4 + ["skipped", "done"]
+
+    executed.clear()
+    RE(run_command_queue(filename, checkpoint=checkpoint))
+    assert executed == []  # all done
+
+
+def test_run_command_queue_lines_moved(tmp_path, text_command_file, monkeypatch):
+    filename = tmp_path / "queue.txt"
+    shutil.copy(text_command_file, filename)
+    checkpoint = tmp_path / "queue.checkpoint.json"
+    executed = []
+    crashed = []
+
+    def handler(fname, commands, md=None):
+        action, args, line_number, raw_command = commands[0]
+        executed.append(raw_command)
+        if raw_command.startswith("FlyScan 0") and not crashed:
+            crashed.append(line_number)
+            # edited while running: two lines added above this command
+            filename.write_text("# added\nsample_slits 1 1 1 1\n" + filename.read_text())
+            raise RuntimeError("simulated crash")
+        yield from bps.null()
+
+    RE = RunEngine({})
+    try:
+        register_command_handler(handler, actions=dict(sample_slits=4, preusaxstune=0, flyscan=4, saxs=4))
+        with pytest.raises(RuntimeError):
+            RE(run_command_queue(filename, checkpoint=checkpoint))
+        state = json.loads(checkpoint.read_text())
+        assert (state["line_number"], state["raw_command"]) == (7, "preusaxstune")
+
+        executed.clear()
+        RE(run_command_queue(filename, checkpoint=checkpoint))
+    finally:
+        register_command_handler()
+
+    # neither repeated nor skipped
+    assert [c.split()[0] for c in executed] == ["FlyScan", "FlyScan", "SAXS"]
+    assert json.loads(checkpoint.read_text())["line_number"] == 14
+
+    # repeated commands: resume after the same repetition
+    filename.write_text("SAXS 0 0 0 blank\n" * 4)
+    executed.clear()
+    crashed.clear()
+
+    def handler(fname, commands, md=None):
+        action, args, line_number, raw_command = commands[0]
+        executed.append(line_number)
+        if len(executed) == 3 and not crashed:
+            crashed.append(line_number)
+            filename.write_text("preusaxstune\n" + filename.read_text())
+            raise RuntimeError("simulated crash")
+        yield from bps.null()
+
+    monkeypatch.setattr(command_list, "CHECKPOINT_TIMINGS", 2)
+    try:
+        register_command_handler(handler, actions=dict(preusaxstune=0, saxs=4))
+        with pytest.raises(RuntimeError):
+            RE(run_command_queue(filename, checkpoint=checkpoint, resume=False))
+        state = json.loads(checkpoint.read_text())
+        assert (state["line_number"], state["occurrence"]) == (2, 2)
+
+        executed.clear()
+        RE(run_command_queue(filename, checkpoint=checkpoint))
+    finally:
+        register_command_handler()
+
+    assert executed == [4, 5]  # lines 3 & 4, moved down by one line
+    state = json.loads(checkpoint.read_text())
+    assert (state["line_number"], state["occurrence"]) == (5, 4)
+    assert state["commands_completed"] == 4
+    assert [t["line_number"] for t in state["timings"]] == [4, 5]  # only the most recent
@@ -357,3 +357,56 @@ def test_issue_1113(rename: bool, labels: list[str], context, expected: str, m1,
         assert m1.name in specwriter.motors, f"{labels=}"
     if expected is not None:
         assert expected in str(reason)
+
+
+def test_label_index():
+    from ophyd import Component
+    from ophyd import Device
+    from ophyd import SoftPositioner
+
+    from ..labels_to_streams import _label_index
+
+    class Stage(Device):
+        x = Component(SoftPositioner, init_pos=0, labels=["motor"])
+        y = Component(SoftPositioner, init_pos=0, labels=["motor"])
+
+    stage = Stage("", name="stage", labels=["stage"])
+    sim = Signal(name="sim", value=0, labels=["signal"])
+    ns = dict(stage=stage, sim=sim, bec=bec, other=5)
+    ns.update({f"m{i}": SoftPositioner(name=f"m{i}", init_pos=0, labels=["motor"]) for i in range(3)})
+
+    def expected(label):
+        return [pair[-1] for pair in get_labeled_devices(ns).get(label, [])]
+
+    index = _label_index(ns)
+    assert index is _label_index(ns)  # cached
+    assert index.bec is bec
+    assert sorted(index.labels) == sorted(get_labeled_devices(ns))
+    for label in "motor signal stage".split():
+        assert index.objects(label) == expected(label)
+    assert index.objects("detector") == []
+
+    # walk only the symbols that changed
+    assert index.refresh(ns) == 0
+    ns["m1"] = Signal(name="m1", labels=["detector"])  # rebound
+    ns.pop("m2")
+    assert index.refresh(ns) == 2
+    assert index.objects("motor") == expected("motor")
+    assert index.objects("detector") == [ns["m1"]]
+
+    stage.read_attrs = ["x"]  # stage.y is not walked by get_labeled_devices()
+    assert index.refresh(ns) == 0
+    assert stage.y in index.objects("motor")
+    assert index.refresh(ns, full=True) == len(ns)
+    assert index.objects("motor") == expected("motor")
+    assert stage.y not in index.objects("motor")
+
+    # stub writes the labeled objects from the index
+    @label_stream_decorator("motor", ns=ns)
+    def tester():
+        yield from bp.count([sim])
+
+    uids = RE(tester())
+    run = cat.v2[uids[-1]]
+    assert "label_start_motor" in run.metadata["stop"]["num_events"]
+    assert "label_start_motor" in bec.noplot_streams
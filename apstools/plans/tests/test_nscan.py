@@ -1,7 +1,11 @@
+import time
+
 import databroker
 import pytest
 from bluesky import RunEngine
 from ophyd import EpicsMotor
+from ophyd.sim import SynAxis
+from ophyd.sim import det
 
 from ...synApps import UserCalcN
 from ...synApps import setup_random_number_swait
@@ -106,3 +110,61 @@ def test_pl_nscan(m1, m2, noisy):
     for k in (m1, m2, noisy):
         assert k.name in ds, f"{k=} {list(ds.keys())=}"
         assert len(ds[k.name]) == npoints, f"{k=}"
+
+
+class SlowReadAxis(SynAxis):
+    """Simulated motor, read() takes about as long as a CA round trip."""
+
+    def read(self):
+        time.sleep(0.001)
+        return super().read()
+
+
+def run_sim_nscan(motors, npoints, read_positions, predeclare):
+    """Run nscan (sim0 does not move).  Return events, elapsed time, and moves."""
+    motor_sets = []
+    for i, motor in enumerate(motors):
+        motor_sets += [motor, 0, i]
+        motor.set(0)
+
+    RE = RunEngine()
+    docs = []
+    moves = []
+    RE.msg_hook = lambda msg: moves.append(msg.obj) if msg.command == "set" else None
+    t0 = time.perf_counter()
+    RE(
+        nscan([det], *motor_sets, num=npoints, read_positions=read_positions, predeclare=predeclare),
+        lambda name, doc: docs.append((name, doc)),
+    )
+    elapsed = time.perf_counter() - t0
+    events = [doc["data"] for name, doc in docs if name == "event"]
+    return events, elapsed, len(moves)
+
+
+@pytest.mark.parametrize("predeclare", [False, True])
+def test_nscan_sim(predeclare):
+    """Both variants give the same data."""
+    motors = [SynAxis(name=f"sim{i}") for i in range(5)]
+    npoints = 20
+
+    events, _t, _moves = run_sim_nscan(motors, npoints, True, predeclare)
+    events_native, _t, moves_native = run_sim_nscan(motors, npoints, False, predeclare)
+    assert len(events) == npoints
+    assert events_native == events
+    assert events[-1]["sim4"] == 4
+    assert moves_native == len(motors) + (len(motors) - 1) * (npoints - 1)  # sim0 set once
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("predeclare", [False, True])
+def test_nscan_sim_benchmark(predeclare):
+    """Report the time per step, with & without reading the positions."""
+    motors = [SlowReadAxis(name=f"sim{i}") for i in range(5)]
+    npoints = 200
+
+    _events, t_read, _moves = run_sim_nscan(motors, npoints, True, predeclare)
+    _events, t_native, _moves = run_sim_nscan(motors, npoints, False, predeclare)
+    print(
+        f"nscan per step ({predeclare=}): read_positions {t_read / npoints * 1e3:.3f} ms"
+        f", RunEngine pos_cache {t_native / npoints * 1e3:.3f} ms"
+    )
@@ -1,16 +1,25 @@
+import threading
+import time
+
 import databroker
+import numpy as np
 import pytest
 from bluesky import RunEngine
 from bluesky import SupplementalData
 from bluesky.callbacks.best_effort import BestEffortCallback
+from ophyd import Component
+from ophyd import Device
 from ophyd import EpicsMotor
+from ophyd import Signal
 from ophyd.scaler import ScalerCH
 
 from ...synApps import SscanDevice
 from ...tests import IOC_GP
 from ...tests import in_gha_workflow
 from ..sscan_support import _get_sscan_data_objects
+from ..sscan_support import _get_sscan_final_arrays
 from ..sscan_support import sscan_1D
+from ..sscan_support import sscan_nD
 
 
 @pytest.mark.skipif(
@@ -62,8 +71,9 @@ def test_i108():
     assert run is not None
 
     streams = list(run.metadata["stop"]["num_events"].keys())
-    assert len(streams) == 1
-    assert "settings" in streams  # Why not a primary stream?
+    assert len(streams) == 2
+    assert "primary" in streams
+    assert "settings" in streams
 
     ds = run.settings.read()
     assert ds is not None
@@ -75,3 +85,191 @@ def test_i108():
 
     data = _get_sscan_data_objects(scans.scan1)
     assert len(data) == num_det + num_pos
+
+
+class FakeExecute(Signal):
+    """Run a simulated scan (as fast as possible) when set to 1."""
+
+    def put(self, value, **kwargs):
+        super().put(value, **kwargs)
+        if value == 1:
+            threading.Thread(target=self.parent.simulate, daemon=True).start()
+
+
+MAXIMUM_POINTS = 5000
+
+
+class FakePositioner(Device):
+    readback_value = Component(Signal, value=0)
+    array = Component(Signal, value=np.zeros(MAXIMUM_POINTS), kind="omitted")
+
+
+class FakeDetector(Device):
+    current_value = Component(Signal, value=0)
+    array = Component(Signal, value=np.zeros(MAXIMUM_POINTS), kind="omitted")
+
+
+class FakePositioners(Device):
+    p1 = Component(FakePositioner)
+
+
+class FakeDetectors(Device):
+    d01 = Component(FakeDetector)
+    d02 = Component(FakeDetector)
+
+
+class FakeWait(Signal):
+    """A client is done: decrement the wait count."""
+
+    def put(self, value, **kwargs):
+        super().put(value, **kwargs)
+        if value == 0:
+            wcnt = self.parent.wcnt
+            wcnt.put(max(0, wcnt.get() - 1))
+
+
+class FakeSscan(Device):
+    """Just enough of a sscan record for sscan_1D() & sscan_nD()."""
+
+    scan_phase = Component(Signal, value=0, kind="config")
+    execute_scan = Component(FakeExecute, value=0, kind="omitted")
+    data_ready = Component(Signal, value=0, kind="config")
+    awct = Component(Signal, value=0, kind="config")
+    wait = Component(FakeWait, value=0, kind="config")
+    wcnt = Component(Signal, value=0, kind="config")
+    number_points = Component(Signal, value=100, kind="config")
+    current_point = Component(Signal, value=0)
+    positioners = Component(FakePositioners)
+    detectors = Component(FakeDetectors)
+
+    def select_channels(self):
+        self.detectors.read_attrs = ["d01"]  # d02 is not configured
+
+    def simulate(self):
+        p1 = self.positioners.p1
+        d01 = self.detectors.d01
+        p1.array.put(np.zeros(MAXIMUM_POINTS))
+        d01.array.put(np.zeros(MAXIMUM_POINTS))
+        self.data_ready.put(0)
+        for i in range(self.number_points.get()):
+            p1.readback_value.put(i)
+            self.acquire_point(i)
+            d01.current_value.put(i * i)
+            p1.array.get()[i] = i
+            d01.array.get()[i] = i * i
+            self.current_point.put(i + 1)
+            self.scan_phase.put(15)  # RECORD SCALAR DATA
+            self.scan_phase.put(1)
+        self.wcnt.put(self.awct.get())
+        self.data_ready.put(1)
+        deadline = time.time() + 5
+        while self.wcnt.get() > 0 and time.time() < deadline:
+            time.sleep(0.001)  # Wait for the clients.
+        self.execute_scan.put(0)
+
+    def acquire_point(self, i):
+        pass
+
+
+class FakeOuterSscan(FakeSscan):
+    """Triggers an inner sscan at each point."""
+
+    inner = None
+
+    def acquire_point(self, i):
+        self.inner.execute_scan.put(1)
+        deadline = time.time() + 5
+        while self.inner.execute_scan.get() != 0 and time.time() < deadline:
+            time.sleep(0.001)  # Wait for the inner sscan.
+        time.sleep(0.1)  # Time to record the data & move (without hold_rows).
+
+
+@pytest.mark.parametrize("npts", [1, 100, 1000])
+def test_sscan_1D_callbacks(npts):
+    RE = RunEngine({})
+    docs = []
+    RE.subscribe(lambda name, doc: docs.append((name, doc)))
+
+    scan = FakeSscan("", name="scan")
+    scan.number_points.put(npts)
+    for _ in range(2):  # can run again
+        docs.clear()
+        RE(sscan_1D(scan, phase_timeout_s=5, final_array_stream="arrays"))
+        stop = [doc for name, doc in docs if name == "stop"][0]
+        assert stop["exit_status"] == "success"
+        assert stop["num_events"]["primary"] == npts  # every point
+        descriptor = [doc for name, doc in docs if name == "descriptor" and doc["name"] == "primary"][0]
+        # fmt: off
+        points = [
+            doc["data"] for name, doc in docs
+            if name == "event" and doc["descriptor"] == descriptor["uid"]
+        ]
+        # fmt: on
+        assert [p["scan_positioners_p1_readback_value"] for p in points] == list(range(npts))
+        assert [p["scan_detectors_d01_current_value"] for p in points] == [i * i for i in range(npts)]
+        assert stop["num_events"]["arrays"] == 1
+        event = [doc for name, doc in docs if name == "event"][-2]  # arrays
+        assert sorted(event["data"]) == ["scan_detectors_d01_array", "scan_positioners_p1_array"]
+        assert len(event["data"]["scan_positioners_p1_array"]) == npts  # trimmed
+        assert list(event["data"]["scan_detectors_d01_array"][:3]) == [0, 1, 4][:npts]
+        assert stop["num_events"]["settings"] == 1
+        assert len(scan.scan_phase._callbacks[scan.scan_phase.SUB_VALUE]) == 0
+        assert len(scan.execute_scan._callbacks[scan.execute_scan.SUB_VALUE]) == 0
+
+
+def test_sscan_1D_phase_timeout():
+    class StuckSscan(FakeSscan):
+        def simulate(self):
+            pass  # never finishes
+
+    RE = RunEngine({})
+    scan = StuckSscan("", name="scan")
+    RE(sscan_1D(scan, phase_timeout_s=0.2))
+    assert len(scan.scan_phase._callbacks[scan.scan_phase.SUB_VALUE]) == 0
+
+
+def test_get_sscan_final_arrays():
+    scan = FakeSscan("", name="scan")
+    scan.number_points.put(10)
+    scan.simulate()
+    scan.select_channels()
+
+    arrays = _get_sscan_final_arrays(scan)
+    assert [a.name for a in arrays] == ["scan_positioners_p1_array", "scan_detectors_d01_array"]
+    assert list(arrays[0].get()) == list(range(10))
+    assert arrays[1].describe()[arrays[1].name]["shape"] == [10]
+
+    assert len(_get_sscan_final_arrays(scan, npts=3)[0].get()) == 3
+    assert len(_get_sscan_final_arrays(scan, npts=0)[0].get()) == 0
+
+
+@pytest.mark.parametrize("hold_rows", [True, False])
+def test_sscan_nD(hold_rows):
+    RE = RunEngine({})
+    docs = []
+    RE.subscribe(lambda name, doc: docs.append((name, doc)))
+
+    scan1 = FakeSscan("", name="scan1")
+    scan2 = FakeOuterSscan("", name="scan2")
+    scan2.inner = scan1
+    scan1.number_points.put(5)
+    scan2.number_points.put(3)
+
+    RE(sscan_nD([scan1, scan2], phase_timeout_s=5, hold_rows=hold_rows))
+    stop = [doc for name, doc in docs if name == "stop"][0]
+    assert stop["exit_status"] == "success"
+    assert stop["num_events"]["primary"] == 3 * 5
+    assert stop["num_events"]["settings"] == 1
+
+    pages = [doc for name, doc in docs if name == "event_page"]
+    assert len(pages) == 3  # one per row
+    for row, page in enumerate(pages):
+        assert page["data"]["scan1_positioners_p1_readback_value"] == [0, 1, 2, 3, 4]
+        assert page["data"]["scan1_detectors_d01_current_value"] == [0, 1, 4, 9, 16]
+        assert page["data"]["scan2_positioners_p1_readback_value"] == [row] * 5
+        assert "scan2_detectors_d01_current_value" not in page["data"]
+
+    assert scan1.awct.get() == 0  # restored
+    assert scan1.wcnt.get() == 0
+    for signal in (scan1.data_ready, scan2.execute_scan, scan1.scan_phase, scan2.scan_phase):
+        assert len(signal._callbacks[signal.SUB_VALUE]) == 0
@@ -0,0 +1,69 @@
+import pytest
+from bluesky import RunEngine
+from bluesky import plan_patterns
+from ophyd.sim import det
+from ophyd.sim import motor1
+from ophyd.sim import motor2
+from ophyd.sim import motor3
+
+from ..xpcs_mesh import cycler_trajectory
+from ..xpcs_mesh import grid_trajectory
+from ..xpcs_mesh import mesh_list_grid_scan
+
+ARGS = [motor1, [1, 2, 3], motor2, [10, 20], motor3, [-1, -2, -3, -4]]
+
+
+@pytest.mark.parametrize("snake_axes", [False, True, [motor3], [motor2, motor3]])
+def test_grid_trajectory(snake_axes):
+    """Same points, in the same order, as bluesky's outer_list_product()."""
+    trajectory = grid_trajectory(ARGS, snake_axes)
+    assert trajectory.dtype.names == ("motor1", "motor2", "motor3")
+    assert len(trajectory) == 3 * 2 * 4
+
+    expected = cycler_trajectory(plan_patterns.outer_list_product(ARGS, snake_axes))
+    for name in trajectory.dtype.names:
+        assert trajectory[name].tolist() == expected[name].tolist(), name
+
+
+def scan_points(**kwargs):
+    RE = RunEngine({})
+    docs = []
+    RE(
+        mesh_list_grid_scan([det], *ARGS, snake_axes=True, **kwargs),
+        lambda name, doc: docs.append((name, doc)),
+    )
+    return [doc["data"] for name, doc in docs if name == "event"], docs[0][1]
+
+
+def test_mesh_list_grid_scan():
+    points, start = scan_points(number_of_collection_points=30)
+    assert len(points) == 30
+    assert start["start_index"] == 0
+    trajectory = grid_trajectory(ARGS, True)
+    for i, point in enumerate(points):
+        row = trajectory[i % len(trajectory)]  # repeats after 24 points
+        assert point["motor1"] == row["motor1"]
+        assert point["motor3"] == row["motor3"]
+
+    # resume
+    resumed, start = scan_points(number_of_collection_points=30, start_index=20)
+    assert start["start_index"] == 20
+    assert resumed == points[20:]
+
+
+def test_mesh_list_grid_scan_moves():
+    """Only the motors that change are moved."""
+    RE = RunEngine({})
+    moves = []
+    RE.msg_hook = lambda msg: moves.append(msg.obj.name) if msg.command == "set" else None
+    RE(mesh_list_grid_scan([det], *ARGS, number_of_collection_points=24, snake_axes=True))
+    assert moves.count("motor1") == 3
+    assert moves.count("motor2") == 4  # 10, 20, (20) 10, (10) 20
+    assert moves.count("motor3") == 3 * 2 * 3 + 1  # snaking: no move at a turn
+
+
+def test_mesh_list_grid_scan_raises():
+    RE = RunEngine({})
+    with pytest.raises(ValueError) as exinfo:
+        RE(mesh_list_grid_scan([det], *ARGS, number_of_collection_points=5, start_index=6))
+    assert "start_index=6" in str(exinfo.value)
@@ -3,15 +3,87 @@ from bluesky import utils
 from bluesky import plan_patterns
 from bluesky import preprocessors as bpp
 
+import collections.abc
 import inspect
-from itertools import zip_longest, cycle
+from itertools import zip_longest
 from collections import defaultdict
 import os
 
+import numpy as np
 from toolz import partition
 
 
-def mesh_list_grid_scan(detectors, *args, number_of_collection_points, snake_axes=False, per_step=None, md=None):
+def _structured_trajectory(columns):
+    """
+    Combine equal-length columns into one NumPy structured array.
+
+    Parameters
+    ----------
+    columns: dict
+        ``{motor_name: array_of_positions}``
+    """
+    columns = {name: np.asarray(values) for name, values in columns.items()}
+    lengths = set(len(values) for values in columns.values())
+    if len(lengths) > 1:
+        raise ValueError(f"Trajectory columns have different lengths: {lengths}")
+    trajectory = np.empty(lengths.pop() if lengths else 0, dtype=[(name, v.dtype) for name, v in columns.items()])
+    for name, values in columns.items():
+        trajectory[name] = values
+    return trajectory
+
+
+def grid_trajectory(args, snake_axes=False):
+    """
+    Compute the trajectory of :func:`mesh_list_grid_scan` as a NumPy structured array.
+
+    The same order of points as :func:`bluesky.plan_patterns.outer_list_product`
+    (including snaking), computed with NumPy.  One field for each motor (by
+    name), one row for each point.
+
+    Parameters
+    ----------
+    args: list
+        patterned like (``motor1, position_list1,`` ``...,`` ``motorN, position_listN``)
+    snake_axes: boolean or iterable, optional
+        which axes should be snaked (see :func:`mesh_list_grid_scan`)
+    """
+    pairs = list(partition(2, args))
+    lengths = [len(pos_list) for _, pos_list in pairs]
+    total = int(np.prod(lengths))
+
+    columns = {}
+    for i, (motor, pos_list) in enumerate(pairs):
+        if isinstance(snake_axes, collections.abc.Iterable):
+            snake = motor in snake_axes
+        else:
+            snake = bool(snake_axes) and i > 0
+        values = np.asarray(pos_list)
+        if snake:
+            values = np.concatenate([values, values[::-1]])  # back-and-forth
+        values = np.repeat(values, int(np.prod(lengths[i + 1 :])))
+        columns[motor.name] = np.tile(values, int(np.prod(lengths[:i])))[:total]
+    return _structured_trajectory(columns)
+
+
+def cycler_trajectory(cycler):
+    """
+    Compute the trajectory of a cycler as a NumPy structured array.
+
+    One field for each motor (by name), one row for each point.
+    """
+    return _structured_trajectory({motor.name: values for motor, values in cycler.by_key().items()})
+
+
+def mesh_list_grid_scan(
+    detectors,
+    *args,
+    number_of_collection_points,
+    snake_axes=False,
+    per_step=None,
+    md=None,
+    start_index=0,
+    predeclare=None,
+):
     """
     Scan over a multi-dimensional mesh, collecting a total of *n* points; each motor is on an independent trajectory.
 
@@ -45,6 +117,12 @@ def mesh_list_grid_scan(detectors, *args, number_of_collection_points, snake_axe
         for details.
     md: dict, optional
         metadata
+    start_index: int, optional
+        Resume from this collection point (see :func:`mesh_scan_nd`).
+    predeclare: bool, optional
+        Declare the primary stream first (see :func:`mesh_scan_nd`).
+
+    The trajectory is computed (with NumPy) before the scan starts.
 
     See Also
     --------
@@ -81,11 +159,30 @@ def mesh_list_grid_scan(detectors, *args, number_of_collection_points, snake_axe
         ...
 
     return (
-        yield from mesh_scan_nd(detectors, full_cycler, number_of_collection_points, per_step=per_step, md=_md)
+        yield from mesh_scan_nd(
+            detectors,
+            full_cycler,
+            number_of_collection_points,
+            per_step=per_step,
+            md=_md,
+            start_index=start_index,
+            predeclare=predeclare,
+            trajectory=grid_trajectory(args, snake_axes),
+        )
     )
 
 
-def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=None, md=None):
+def mesh_scan_nd(
+    detectors,
+    cycler,
+    number_of_collection_points,
+    *,
+    per_step=None,
+    md=None,
+    start_index=0,
+    predeclare=None,
+    trajectory=None,
+):
     """
     Scan over an arbitrary N-dimensional trajectory.
 
@@ -103,6 +200,18 @@ def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=Non
         for details.
     md : dict, optional
         metadata
+    start_index : int, optional
+        Resume from this collection point (such as after an interrupted
+        scan).  The first step moves all motors, later steps move only
+        the motors that change.  (default: 0)
+    predeclare : bool, optional
+        Declare the primary stream (``bps.declare_stream()``) first.  Only
+        with the default ``per_step``.
+        (default: ``None``, use environment variable ``BLUESKY_PREDECLARE``)
+    trajectory : numpy.ndarray, optional
+        The positions of ``cycler``, if already computed: structured array
+        with one field (by motor name) for each motor, one row for each
+        point.  (default: computed from ``cycler`` before the scan starts)
 
     See Also
     --------
@@ -122,6 +231,7 @@ def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=Non
         "num_intervals": len(cycler) - 1,
         "plan_args": {"detectors": list(map(repr, detectors)), "cycler": repr(cycler), "per_step": repr(per_step)},
         "plan_name": "scan_nd",
+        "start_index": start_index,
         "hints": {},
     }
     _md.update(md or {})
@@ -138,7 +248,9 @@ def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=Non
         # change it, else set it to the one generated above
         _md["hints"].setdefault("dimensions", dimensions)
 
-    predeclare = per_step is None and os.environ.get("BLUESKY_PREDECLARE", False)
+    if predeclare is None:
+        predeclare = os.environ.get("BLUESKY_PREDECLARE", False)
+    predeclare = per_step is None and predeclare
     if per_step is None:
         per_step = bps.one_nd_step
     else:
@@ -194,6 +306,16 @@ def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=Non
     pos_cache = defaultdict(lambda: None)  # where last position is stashed
     cycler = utils.merge_cycler(cycler)
     motors = list(cycler.keys)
+    if trajectory is None:
+        trajectory = cycler_trajectory(cycler)
+    fields = [m.name for m in motors]
+    if sorted(fields) != sorted(trajectory.dtype.names):
+        raise ValueError(f"Trajectory fields {trajectory.dtype.names} do not match motors {fields}.")
+    if len(trajectory) == 0:
+        raise ValueError("Trajectory has no points.")
+    trajectory = trajectory[fields]  # same order as 'motors'
+    if not (0 <= start_index <= number_of_collection_points):
+        raise ValueError(f"start_index={start_index} must be between 0 and {number_of_collection_points}.")
 
     @bpp.stage_decorator(list(detectors) + motors)
     @bpp.run_decorator(md=_md)
@@ -204,11 +326,10 @@ def mesh_scan_nd(detectors, cycler, number_of_collection_points, *, per_step=Non
         if predeclare:
             yield from bps.declare_stream(*motors, *detectors, name="primary")
 
-        iterations = 0
-        for step in cycle(cycler):
-            yield from per_step(detectors, step, pos_cache)
-            iterations += 1
-            if iterations == number_of_collection_points:
-                break
+        # The trajectory repeats (as needed) to collect all the points.
+        num_rows = len(trajectory)
+        for iteration in range(start_index, number_of_collection_points):
+            row = trajectory[iteration % num_rows].item()
+            yield from per_step(detectors, dict(zip(motors, row)), pos_cache)
 
     return (yield from scan_until_completion())
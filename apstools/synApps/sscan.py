@@ -27,8 +27,12 @@ Private Structures
 
 """
 
+import concurrent.futures
+import threading
 from collections import OrderedDict
 
+from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 from ophyd import Component as Cpt
 from ophyd import Device
 from ophyd import DynamicDeviceComponent as DDC
@@ -39,6 +43,14 @@ from ophyd.status import DeviceStatus
 
 from .. import utils as APS_utils
 
+CHANNEL_NAME_FIELDS = dict(
+    # part: name of the signal with the PV name that configures the channel
+    positioners="setpoint_pv",
+    detectors="input_pv",
+    triggers="trigger_pv",
+)
+CHANNEL_CONFIG_MAX_WORKERS = 16
+
 
 class sscanPositioner(Device):
     """
@@ -185,6 +197,7 @@ class SscanRecord(Device):
 
     .. autosummary::
 
+        ~channel_configuration
         ~defined_in_EPICS
         ~reset
         ~select_channels
@@ -227,6 +240,70 @@ class SscanRecord(Device):
     detectors = DDC(_sscan_detectors(APS_utils.itemizer("%02d", range(1, 71))))
     triggers = DDC(_sscan_triggers("1 2 3 4".split()))
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._channel_config = None  # {"positioners.p1": "PV name", ...}
+        self._channel_config_lock = threading.RLock()
+        self._channel_config_watched = False
+
+    def _channel_name_signals(self):
+        """Dict of the signals with the PV names that configure the channels."""
+        signals = {}
+        for part_name, signal_name in CHANNEL_NAME_FIELDS.items():
+            part = getattr(self, part_name)
+            for ch in part.component_names:
+                signals[f"{part_name}.{ch}"] = getattr(getattr(part, ch), signal_name)
+        return signals
+
+    def _channel_name_cb(self, value=None, obj=None, **kwargs):
+        """Monitor: update the cached configuration of one channel."""
+        with self._channel_config_lock:
+            if self._channel_config is not None:
+                key = f"{obj.parent.parent.attr_name}.{obj.parent.attr_name}"
+                self._channel_config[key] = str(value).strip()
+
+    def _channel_connection_cb(self, connected=True, **kwargs):
+        """Disconnected: the cached configuration might become stale."""
+        if not connected:
+            with self._channel_config_lock:
+                self._channel_config = None
+
+    @versionadded(version="1.8.0")
+    def channel_configuration(self, refresh=False):
+        """
+        Return the PV names that configure the channels, ``{"positioners.p1": "PV", ...}``.
+
+        The first call reads all the ``PnPV``, ``DnnPV``, & ``TnPV`` fields
+        at once (in parallel).  After that, EPICS monitors keep this
+        snapshot current.  An empty string means the channel is not used.
+
+        PARAMETERS
+
+        refresh
+            *bool* :
+            If ``True``, read the fields again.
+            (default: ``False``)
+        """
+        with self._channel_config_lock:
+            if self._channel_config is None or refresh:
+                signals = self._channel_name_signals()
+                if not self._channel_config_watched:
+                    # Subscribe first so no update is missed after the read.
+                    for signal in signals.values():
+                        signal.subscribe(self._channel_name_cb, run=False)
+                        signal.subscribe(
+                            self._channel_connection_cb,
+                            event_type=signal.SUB_META,
+                            run=False,
+                        )
+                    self._channel_config_watched = True
+
+                max_workers = CHANNEL_CONFIG_MAX_WORKERS
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    values = list(executor.map(lambda signal: signal.get(), signals.values()))
+                self._channel_config = {key: str(value).strip() for key, value in zip(signals, values)}
+            return dict(self._channel_config)
+
     def set(self, value, **kwargs):
         """interface to use bps.mv()"""
         if value != 1:
@@ -276,17 +353,18 @@ class SscanRecord(Device):
         while self.wcnt.get() > 0:
             self.wait.put(0)
 
+    @versionchanged(version="1.8.0", reason="Use the channel_configuration() snapshot.")
     def select_channels(self):
         """
         Select channels that are configured in EPICS
         """
+        config = self.channel_configuration()
         for part in (self.positioners, self.detectors, self.triggers):
-            channel_names = []  # part.get_configured_channels()
             # fmt: off
             channel_names = [
                 ch
                 for ch in part.component_names
-                if getattr(part, ch).defined_in_EPICS
+                if len(config[f"{part.attr_name}.{ch}"]) > 0
             ]
             # fmt: on
 
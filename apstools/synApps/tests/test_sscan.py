@@ -0,0 +1,51 @@
+from ophyd.sim import FakeEpicsSignal
+from ophyd.sim import make_fake_device
+
+from ..sscan import SscanRecord
+
+
+def fake_sscan_record():
+    sscan = make_fake_device(SscanRecord)("fake:scan1", name="scan1")
+    for signal in sscan._channel_name_signals().values():
+        signal.sim_put("")  # no channels configured
+    return sscan
+
+
+def test_channel_configuration(monkeypatch):
+    sscan = fake_sscan_record()
+    config = sscan.channel_configuration()
+    assert len(config) == 4 + 70 + 4
+    assert set(config.values()) == {""}
+
+    sscan.positioners.p1.setpoint_pv.sim_put("ioc:m1.VAL")
+    sscan.detectors.d01.input_pv.sim_put("ioc:scaler1.S1 ")
+    sscan.triggers.t1.trigger_pv.sim_put("ioc:scaler1.CNT")
+
+    # Monitors keep the snapshot current: no more gets.
+    gets = []
+
+    def get(self, *args, **kwargs):
+        gets.append(self.name)
+        return self._readback
+
+    monkeypatch.setattr(FakeEpicsSignal, "get", get)
+    config = sscan.channel_configuration()
+    assert config["positioners.p1"] == "ioc:m1.VAL"
+    assert config["detectors.d01"] == "ioc:scaler1.S1"
+    assert config["triggers.t1"] == "ioc:scaler1.CNT"
+
+    sscan.select_channels()
+    assert sscan.positioners.read_attrs == ["p1", "p1.readback_value", "p1.array", "p1.setpoint_value"]
+    assert "d01" in sscan.detectors.read_attrs
+    assert "d02" not in sscan.detectors.read_attrs
+    assert sscan.triggers.read_attrs == ["t1"]
+    assert sscan.defined_in_EPICS
+    assert gets == []
+
+    sscan.detectors.d01.input_pv.sim_put("")
+    sscan.select_channels()
+    assert sscan.detectors.read_attrs == []
+    assert gets == []
+
+    assert len(sscan.channel_configuration(refresh=True)) == 78
+    assert len(gets) == 78
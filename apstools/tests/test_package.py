@@ -1,6 +1,70 @@
+import subprocess
+import sys
+
+import pytest
+
 from .. import __version__
 
+IMPORT_TIME_BUDGET = 0.5  # seconds, for each package
+"""Cumulative import time allowed for each package (generous, for CI)."""
+
+HEAVY_MODULES = "databroker matplotlib openpyxl ophyd pandas".split()
+"""Not imported by ``import apstools.devices`` or ``import apstools.utils``."""
+
 
 def test_Version():
     assert isinstance(__version__, str)
     assert len(__version__) >= len("#.#.#")
+
+
+def import_times(package):
+    """Cumulative time (s) of each module imported by ``import package``."""
+    # fmt: off
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {package}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # fmt: on
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if line.startswith("import time:") and "|" in line:
+            _self, cumulative, module = line.split(":", 1)[1].split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative) * 1e-6
+    return times
+
+
+@pytest.mark.parametrize("package", ["apstools.devices", "apstools.utils"])
+def test_import_time(package):
+    times = import_times(package)
+    assert package in times
+    assert times[package] < IMPORT_TIME_BUDGET, f"{package=} {times[package]=:.3f}s"
+    for module in HEAVY_MODULES:
+        assert module not in times, f"{package=} imported {module=}"
+
+
+@pytest.mark.parametrize(
+    "package, name, module",
+    [
+        ["apstools.devices", "ApsCycleDM", "apstools.devices.aps_cycle"],
+        ["apstools.devices", "SscanRecord", "apstools.synApps.sscan"],
+        ["apstools.utils", "listdevice", "apstools.utils.device_info"],
+        ["apstools.utils", "StoredDict", "apstools.utils.stored_dict"],
+    ],
+)
+def test_lazy_import(package, name, module):
+    import importlib
+
+    pkg = importlib.import_module(package)
+    assert name in pkg.__all__
+    assert name in dir(pkg)
+    obj = getattr(pkg, name)
+    assert obj.__module__ == module
+    assert vars(pkg)[name] is obj  # cached, no more __getattr__()
+
+    with pytest.raises(AttributeError, match="has no attribute 'no_such_name'"):
+        pkg.no_such_name
+    assert "lazy_import" not in dir(pkg)  # helper is not public
@@ -1,109 +1,128 @@
-from ._core import TableStyle
-from .aps_data_management import dm_setup
-from .aps_data_management import build_run_metadata_dict
-from .aps_data_management import dm_add_workflow
-from .aps_data_management import dm_api_cat
-from .aps_data_management import dm_api_daq
-from .aps_data_management import dm_api_dataset_cat
-from .aps_data_management import dm_api_ds
-from .aps_data_management import dm_api_file
-from .aps_data_management import dm_api_filecat
-from .aps_data_management import dm_api_proc
-from .aps_data_management import dm_file_ready_to_process
-from .aps_data_management import dm_get_daqs
-from .aps_data_management import dm_get_experiment_datadir_active_daq
-from .aps_data_management import dm_get_experiment_file
-from .aps_data_management import dm_get_experiment_path
-from .aps_data_management import dm_get_experiments
-from .aps_data_management import dm_get_workflow
-from .aps_data_management import dm_source_environ
-from .aps_data_management import dm_start_daq
-from .aps_data_management import dm_station_name
-from .aps_data_management import dm_stop_daq
-from .aps_data_management import dm_update_workflow
-from .aps_data_management import dm_upload
-from .aps_data_management import get_workflow_last_stage
-from .aps_data_management import share_bluesky_metadata_with_dm
-from .aps_data_management import validate_experiment_dataDirectory
-from .aps_data_management import wait_dm_upload
-from .aps_data_management import DEFAULT_UPLOAD_TIMEOUT
-from .aps_data_management import DEFAULT_UPLOAD_POLL_PERIOD
-from .aps_data_management import DM_WorkflowCache
-from .apsu_controls_subnet import warn_if_not_aps_controls_subnet
-from .catalog import copy_filtered_catalog
-from .catalog import findCatalogsInNamespace
-from .catalog import getCatalog
-from .catalog import getDatabase
-from .catalog import getDefaultCatalog
-from .catalog import getDefaultDatabase
-from .catalog import getStreamValues
-from .descriptor_support import get_stream_data_map
-from .device_info import listdevice
-from .email import EmailNotifications
-from .image_analysis import analyze_1D
-from .image_analysis import analyze_2D
-from .list_plans import listplans
-from .list_runs import ListRuns
-from .list_runs import getRunData
-from .list_runs import getRunDataValue
-from .list_runs import listRunKeys
-from .list_runs import listruns
-from .list_runs import summarize_runs
-from .log_utils import file_log_handler
-from .log_utils import get_log_path
-from .log_utils import setup_IPython_console_logging
-from .log_utils import stream_log_handler
-from .memory import rss_mem
-from .misc import call_signature_decorator
-from .misc import cleanupText
-from .misc import connect_pvlist
-from .misc import count_child_devices_and_signals
-from .misc import count_common_subdirs
-from .misc import dictionary_table
-from .misc import dynamic_import
-from .misc import full_dotted_name
-from .misc import itemizer
-from .misc import listobjects
-from .misc import pairwise
-from .misc import print_RE_md
-from .misc import redefine_motor_position
-from .misc import render
-from .misc import replay
-from .misc import run_in_thread
-from .misc import safe_ophyd_name
-from .misc import split_quoted_line
-from .misc import text_encode
-from .misc import to_unicode_or_bust
-from .misc import trim_string_for_EPICS
-from .misc import unix
-from .mmap_dict import MMap
-from .override_parameters import OverrideParameters
-from .plot import plotxy
-from .plot import select_live_plot
-from .plot import select_mpl_figure
-from .plot import trim_plot_by_name
-from .plot import trim_plot_lines
-from .profile_support import getDefaultNamespace
-from .profile_support import ipython_profile_name
-from .profile_support import ipython_shell_namespace
-from .pvregistry import findbyname
-from .pvregistry import findbypv
-from .query import db_query
-from .slit_core import SlitGeometry
-from .spreadsheet import ExcelDatabaseFileBase
-from .spreadsheet import ExcelDatabaseFileGeneric
-from .spreadsheet import ExcelReadError
-from .statistics import array_index
-from .statistics import xy_statistics
-from .statistics import factor_fwhm
-from .statistics import peak_full_width
-from .stored_dict import StoredDict
-from .time_constants import DAY
-from .time_constants import HOUR
-from .time_constants import MINUTE
-from .time_constants import SECOND
-from .time_constants import WEEK
-from .time_constants import ts2iso
+"""
+Utilities for bluesky sessions.
+
+Public names are imported from their module on first use (PEP 562).
+"""
+
+from ._lazy import lazy_import as _lazy_import
+
+_lazy_imports = {
+    "TableStyle": "._core",
+    "dm_setup": ".aps_data_management",
+    "build_run_metadata_dict": ".aps_data_management",
+    "dm_add_workflow": ".aps_data_management",
+    "dm_api_cat": ".aps_data_management",
+    "dm_api_daq": ".aps_data_management",
+    "dm_api_dataset_cat": ".aps_data_management",
+    "dm_api_ds": ".aps_data_management",
+    "dm_api_file": ".aps_data_management",
+    "dm_api_filecat": ".aps_data_management",
+    "dm_api_proc": ".aps_data_management",
+    "dm_file_ready_to_process": ".aps_data_management",
+    "dm_get_daqs": ".aps_data_management",
+    "dm_get_experiment_datadir_active_daq": ".aps_data_management",
+    "dm_get_experiment_file": ".aps_data_management",
+    "dm_get_experiment_path": ".aps_data_management",
+    "dm_get_experiments": ".aps_data_management",
+    "dm_get_workflow": ".aps_data_management",
+    "dm_source_environ": ".aps_data_management",
+    "dm_start_daq": ".aps_data_management",
+    "dm_station_name": ".aps_data_management",
+    "dm_stop_daq": ".aps_data_management",
+    "dm_update_workflow": ".aps_data_management",
+    "dm_upload": ".aps_data_management",
+    "get_workflow_last_stage": ".aps_data_management",
+    "share_bluesky_metadata_with_dm": ".aps_data_management",
+    "validate_experiment_dataDirectory": ".aps_data_management",
+    "wait_dm_upload": ".aps_data_management",
+    "DEFAULT_UPLOAD_TIMEOUT": ".aps_data_management",
+    "DEFAULT_UPLOAD_POLL_PERIOD": ".aps_data_management",
+    "DM_WorkflowCache": ".aps_data_management",
+    "warn_if_not_aps_controls_subnet": ".apsu_controls_subnet",
+    "copy_filtered_catalog": ".catalog",
+    "findCatalogsInNamespace": ".catalog",
+    "getCatalog": ".catalog",
+    "getDatabase": ".catalog",
+    "getDefaultCatalog": ".catalog",
+    "getDefaultDatabase": ".catalog",
+    "getStreamValues": ".catalog",
+    "set_default_catalog": ".catalog",
+    "get_stream_data_map": ".descriptor_support",
+    "listdevice": ".device_info",
+    "EmailNotifications": ".email",
+    "analyze_1D": ".image_analysis",
+    "analyze_2D": ".image_analysis",
+    "listplans": ".list_plans",
+    "ListRuns": ".list_runs",
+    "getRunData": ".list_runs",
+    "getRunDataValue": ".list_runs",
+    "listRunKeys": ".list_runs",
+    "listruns": ".list_runs",
+    "load_run_metadata": ".list_runs",
+    "plan_frequency": ".list_runs",
+    "run_latency_histogram": ".list_runs",
+    "summarize_runs": ".list_runs",
+    "file_log_handler": ".log_utils",
+    "get_log_path": ".log_utils",
+    "setup_IPython_console_logging": ".log_utils",
+    "stream_log_handler": ".log_utils",
+    "rss_mem": ".memory",
+    "call_signature_decorator": ".misc",
+    "cleanupText": ".misc",
+    "connect_pvlist": ".misc",
+    "count_child_devices_and_signals": ".misc",
+    "count_common_subdirs": ".misc",
+    "dictionary_table": ".misc",
+    "dynamic_import": ".misc",
+    "full_dotted_name": ".misc",
+    "itemizer": ".misc",
+    "listobjects": ".misc",
+    "pairwise": ".misc",
+    "print_RE_md": ".misc",
+    "redefine_motor_position": ".misc",
+    "render": ".misc",
+    "replay": ".misc",
+    "run_in_thread": ".misc",
+    "safe_ophyd_name": ".misc",
+    "split_quoted_line": ".misc",
+    "text_encode": ".misc",
+    "to_unicode_or_bust": ".misc",
+    "trim_string_for_EPICS": ".misc",
+    "unix": ".misc",
+    "MMap": ".mmap_dict",
+    "OverrideParameters": ".override_parameters",
+    "plotxy": ".plot",
+    "select_live_plot": ".plot",
+    "select_mpl_figure": ".plot",
+    "trim_plot_by_name": ".plot",
+    "trim_plot_lines": ".plot",
+    "getDefaultNamespace": ".profile_support",
+    "ipython_profile_name": ".profile_support",
+    "ipython_shell_namespace": ".profile_support",
+    "PVConnectionManager": ".pv_connection",
+    "findbyname": ".pvregistry",
+    "findbypv": ".pvregistry",
+    "findpvs": ".pvregistry",
+    "db_query": ".query",
+    "SlitGeometry": ".slit_core",
+    "ExcelDatabaseFileBase": ".spreadsheet",
+    "ExcelDatabaseFileGeneric": ".spreadsheet",
+    "ExcelReadError": ".spreadsheet",
+    "array_index": ".statistics",
+    "xy_statistics": ".statistics",
+    "factor_fwhm": ".statistics",
+    "peak_full_width": ".statistics",
+    "StoredDict": ".stored_dict",
+    "DAY": ".time_constants",
+    "HOUR": ".time_constants",
+    "MINUTE": ".time_constants",
+    "SECOND": ".time_constants",
+    "WEEK": ".time_constants",
+    "ts2iso": ".time_constants",
+}
+
+__all__ = list(_lazy_imports)
+__getattr__, __dir__ = _lazy_import(__name__, _lazy_imports)
 
 # -----------------------------------------------------------------------------
 # :author:    BCDA
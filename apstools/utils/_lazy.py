@@ -0,0 +1,66 @@
+"""
+Lazy import of the public names of a package (PEP 562).
+
+The package ``__init__`` lists its public names, each with the (relative)
+module that defines it.  Each module is imported when one of its names is
+first used, so ``import apstools.devices`` does not import the whole stack.
+
+EXAMPLE::
+
+    from ..utils._lazy import lazy_import as _lazy_import
+
+    _lazy_imports = {
+        "ApsCycleDM": ".aps_cycle",
+    }
+    __all__ = list(_lazy_imports)
+    __getattr__, __dir__ = _lazy_import(__name__, _lazy_imports)
+"""
+
+import importlib
+import sys
+
+
+def lazy_import(package, lazy_imports):
+    """
+    Return module ``__getattr__()`` and ``__dir__()`` functions for ``package``.
+
+    PARAMETERS
+
+    package
+        *str* : Full name of the package, such as ``"apstools.devices"``.
+    lazy_imports
+        *dict* : Public names and the (relative) module of each, such as
+        ``{"ApsCycleDM": ".aps_cycle"}``.
+    """
+
+    def __getattr__(name):
+        if name in lazy_imports:
+            module = importlib.import_module(lazy_imports[name], package)
+            value = getattr(module, name)
+        elif not name.startswith("__"):
+            # Submodule, such as apstools.utils.misc
+            try:
+                value = importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as exc:
+                if exc.name != f"{package}.{name}":
+                    raise  # Submodule exists, something it imports does not.
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)  # Next time, no __getattr__().
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(lazy_imports))
+
+    return __getattr__, __dir__
+
+
+# -----------------------------------------------------------------------------
+# :author:    BCDA
+# :copyright: (c) 2017-2026, UChicago Argonne, LLC
+#
+# Distributed under the terms of the Argonne National Laboratory Open Source License.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+# -----------------------------------------------------------------------------
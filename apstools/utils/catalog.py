@@ -12,9 +12,13 @@ Working with databroker catalogs
    ~getDefaultDatabase
    ~getStreamValues
    ~quantify_md_key_use
+   ~set_default_catalog
 """
 
 import logging
+import pathlib
+import queue
+import threading
 
 import pandas as pd
 import pyRestTable
@@ -27,8 +31,51 @@ from .profile_support import ipython_shell_namespace
 
 logger = logging.getLogger(__name__)
 
+_default_catalog = None  # chosen by set_default_catalog()
+_namespace_memo = None  # (key, catalogs found in namespace, default catalog)
+_namespace_version = 0  # incremented after each IPython cell
+_watched_shell = None  # IPython shell calling _namespace_changed()
 
-def copy_filtered_catalog(source_cat, target_cat, query=None):
+
+def _batched_documents(documents, batch_size):
+    """
+    Group consecutive events (datums) of a run into event (datum) pages.
+
+    Each page holds at most ``batch_size`` documents, all from the same
+    descriptor (resource).  All other documents pass through unchanged and
+    the order of the run's documents is kept.
+    """
+    from event_model import pack_datum_page
+    from event_model import pack_event_page
+
+    pending = []  # consecutive events or consecutive datums
+    packers = dict(
+        event=("event_page", "descriptor", pack_event_page),
+        datum=("datum_page", "resource", pack_datum_page),
+    )
+
+    def flush():
+        if len(pending) > 0:
+            page_name, _key, pack = packers[pending[0][0]]
+            yield page_name, pack(*[doc for _name, doc in pending])
+            pending.clear()
+
+    for name, doc in documents:
+        if name in packers and batch_size > 1:
+            _page_name, key, _pack = packers[name]
+            if len(pending) > 0 and (
+                pending[0][0] != name or pending[0][1][key] != doc[key] or len(pending) >= batch_size
+            ):
+                yield from flush()
+            pending.append((name, doc))
+            continue
+        yield from flush()
+        yield name, doc
+    yield from flush()
+
+
+@versionchanged(version="1.8.0", reason="Add batch_size, max_workers, & checkpoint_file.")
+def copy_filtered_catalog(source_cat, target_cat, query=None, batch_size=1, max_workers=1, checkpoint_file=None):
     """
     copy filtered runs from source_cat to target_cat
 
@@ -46,6 +93,26 @@ def copy_filtered_catalog(source_cat, target_cat, query=None):
         (default: ``{}``)
 
         see: https://docs.mongodb.com/manual/reference/operator/query/
+    batch_size
+        *int* :
+        Insert consecutive event (datum) documents as ``event_page``
+        (``datum_page``) documents of up to this many documents.  A MongoDB
+        target writes each page with one ``insert_many()`` call.
+        (default: ``1``, insert each document by itself)
+    max_workers
+        *int* :
+        Number of threads reading runs from ``source_cat``.  All documents
+        are inserted into ``target_cat`` from the calling thread, while the
+        next documents are read.  The documents of each run are inserted
+        in their original order.
+        (default: ``1``)
+    checkpoint_file
+        *str* or *pathlib.Path* :
+        Text file listing the ``uid`` of each run copied, one per line.
+        Runs listed in this file are skipped, so a copy that was interrupted
+        can be resumed by calling again with the same file.  A run that was
+        interrupted part way is copied again from its start.
+        (default: ``None``, no checkpoints)
 
     example::
 
@@ -53,25 +120,136 @@ def copy_filtered_catalog(source_cat, target_cat, query=None):
             databroker.Broker.named("mongodb_config"),
             databroker.catalog["test1"],
             {'plan_name': 'snapshot'})
+
+    example (resume a large copy)::
+
+        copy_filtered_catalog(
+            databroker.catalog["old"],
+            databroker.catalog["new"],
+            batch_size=1000,
+            max_workers=4,
+            checkpoint_file="copied_uids.txt")
     """
     query = query or {}
-    for i, uid in enumerate(source_cat.v2.search(query)):
-        run = source_cat.v1[uid]
-        # fmt: off
-        logger.debug(
-            "%d  %s  #docs=%d", i + 1, uid, len(list(run.documents()))
-        )
-        # fmt: on
-        for key, doc in run.documents():
-            target_cat.v1.insert(key, doc)
+    batch_size = max(1, int(batch_size))
+    max_workers = max(1, int(max_workers))
+
+    done = set()
+    if checkpoint_file is not None:
+        checkpoint_file = pathlib.Path(checkpoint_file)
+        if checkpoint_file.exists():
+            done = set(checkpoint_file.read_text().split())
+            logger.info("%d runs already copied, from %s", len(done), checkpoint_file)
+
+    uids = (uid for uid in source_cat.v2.search(query) if uid not in done)
+    uids_lock = threading.Lock()
+    stop = threading.Event()
+    pipeline = queue.Queue(maxsize=4 * max_workers)
+
+    def put(item):
+        """Wait for room in the pipeline, unless the copy has stopped."""
+        while not stop.is_set():
+            try:
+                pipeline.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
 
+    def reader():
+        try:
+            while not stop.is_set():
+                with uids_lock:
+                    uid = next(uids, None)
+                if uid is None:
+                    break
+                count = 0
+                for name, doc in _batched_documents(source_cat.v1[uid].documents(), batch_size):
+                    if name == "event_page":
+                        count += len(doc["seq_num"])
+                    elif name == "datum_page":
+                        count += len(doc["datum_id"])
+                    else:
+                        count += 1
+                    put(("document", uid, (name, doc)))
+                put(("run", uid, count))
+            put(("done", None, None))
+        except Exception as exc:
+            put(("error", None, exc))
+
+    workers = [threading.Thread(target=reader, daemon=True) for _ in range(max_workers)]
+    for worker in workers:
+        worker.start()
+
+    checkpoint = None if checkpoint_file is None else checkpoint_file.open("a")
+    n_runs = 0
+    try:
+        active = len(workers)
+        while active > 0:
+            kind, uid, item = pipeline.get()
+            if kind == "document":
+                target_cat.v1.insert(*item)
+            elif kind == "run":
+                n_runs += 1
+                logger.debug("%d  %s  #docs=%d", n_runs, uid, item)
+                if checkpoint is not None:
+                    checkpoint.write(f"{uid}\n")
+                    checkpoint.flush()
+            elif kind == "error":
+                raise item
+            else:
+                active -= 1
+    finally:
+        stop.set()
+        if checkpoint is not None:
+            checkpoint.close()
+        for worker in workers:
+            worker.join()
 
-def findCatalogsInNamespace():
-    """Return a dictionary of databroker catalogs in the default namespace."""
-    g = {}
-    g.update(getDefaultNamespace())
+
+def _watch_namespace():
+    """Call ``_namespace_changed()`` after each IPython cell (register once per shell)."""
+    global _watched_shell
+
+    try:
+        from IPython import get_ipython
+
+        shell = get_ipython()
+    except ModuleNotFoundError:
+        shell = None
+    if shell is not None and shell is not _watched_shell:
+        shell.events.register("post_run_cell", _namespace_changed)
+        _watched_shell = shell
+
+
+def _namespace_changed(*args, **kwargs):
+    """Forget the catalogs found in the namespace."""
+    global _namespace_version
+    _namespace_version += 1
+
+
+def _namespace_key(ns):
+    """Summary of the namespace, changes when it might have new catalogs."""
+    _watch_namespace()
+    return id(ns), _namespace_version, len(ns)
+
+
+def _namespace_memo_is_valid(ns):
+    """Are the catalogs remembered from ``ns`` still current?"""
+    if _namespace_memo is None:
+        return False
+    key, cats, _default = _namespace_memo
+    # fmt: off
+    return (
+        key == _namespace_key(ns)
+        and all(ns.get(k) is v for k, v in cats.items())
+    )
+    # fmt: on
+
+
+def _scan_namespace_for_catalogs(ns):
+    """Return a dictionary of databroker catalogs in namespace ``ns``."""
     ns_cats = {}
-    for k, v in g.items():
+    for k, v in list(ns.items()):
         if not k.startswith("_") and hasattr(v, "__class__"):
             try:
                 if hasattr(v.v2, "container") and hasattr(v.v2, "metadata"):
@@ -81,6 +259,23 @@ def findCatalogsInNamespace():
     return ns_cats
 
 
+@versionchanged(version="1.8.0", reason="Remember catalogs found until the namespace changes.")
+def findCatalogsInNamespace():
+    """
+    Return a dictionary of databroker catalogs in the default namespace.
+
+    The namespace is searched again only after it might have changed:
+    after each IPython cell, when the number of names changes, or when any
+    of the catalogs found is no longer bound to its name.
+    """
+    global _namespace_memo
+
+    ns = getDefaultNamespace()
+    if not _namespace_memo_is_valid(ns):
+        _namespace_memo = (_namespace_key(ns), _scan_namespace_for_catalogs(ns), None)
+    return dict(_namespace_memo[1])
+
+
 def getCatalog(ref=None):
     """Return a catalog object."""
     from databroker import catalog
@@ -137,11 +332,35 @@ def getDatabase(db=None, catalog_name=None):
     return db.v2
 
 
+@versionchanged(version="1.8.0", reason="Remember the result.  Add set_default_catalog().")
 @versionchanged(
     version="1.7.10", reason="Remove intake/msgpack workaround; use databroker.temp() catalogs in tests."
 )
 def getDefaultCatalog():
-    """Return the default databroker catalog."""
+    """
+    Return the default databroker catalog.
+
+    Returns the catalog chosen by :func:`set_default_catalog()`, if any.
+    Otherwise, the catalog is found as before and remembered until
+    the namespace changes (see :func:`findCatalogsInNamespace()`).
+    """
+    global _namespace_memo
+
+    if _default_catalog is not None:
+        return _default_catalog
+
+    ns = getDefaultNamespace()
+    if _namespace_memo_is_valid(ns) and _namespace_memo[2] is not None:
+        return _namespace_memo[2]
+
+    cat = _findDefaultCatalog()
+    if _namespace_memo_is_valid(ns):
+        _namespace_memo = _namespace_memo[:2] + (cat,)
+    return cat
+
+
+def _findDefaultCatalog():
+    """Search for the default databroker catalog."""
     from databroker import catalog
 
     cats = findCatalogsInNamespace()
@@ -431,6 +650,34 @@ def quantify_md_key_use(
     print(table)
 
 
+@versionadded(version="1.8.0")
+def set_default_catalog(cat=None):
+    """
+    Choose the catalog returned by :func:`getDefaultCatalog()`.
+
+    Utilities such as ``getRunData()``, ``listruns()``, and ``plotxy()``
+    use this catalog when none is given.
+
+    PARAMETERS
+
+    cat
+        *object* or *str* :
+        Instance of databroker catalog, or name of a catalog
+        configuration.  Use ``None`` to find the default
+        catalog from the namespace again.
+        (default: ``None``)
+
+    The catalog object is returned as given (not converted to
+    ``cat.v2``), just as a catalog found in the namespace is.
+    """
+    from databroker import catalog
+
+    global _default_catalog, _namespace_memo
+
+    _default_catalog = catalog[cat] if isinstance(cat, str) else cat
+    _namespace_memo = None
+
+
 # -----------------------------------------------------------------------------
 # :author:    BCDA
 # :copyright: (c) 2017-2026, UChicago Argonne, LLC
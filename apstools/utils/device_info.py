@@ -7,17 +7,21 @@ Device information
    ~listdevice
 """
 
+import concurrent.futures
 import datetime
 import logging
+import time
 from collections import defaultdict
 
 import pandas as pd
+from deprecated.sphinx import versionchanged
 from ophyd import Device
 from ophyd import Signal
 from ophyd.signal import ConnectionTimeoutError
 from ophyd.signal import EpicsSignalBase
 
 from ._core import TableStyle
+from .misc import _component_table
 from .misc import call_signature_decorator
 
 logger = logging.getLogger(__name__)
@@ -28,35 +32,50 @@ DEFAULT_COLUMN_WIDTH = 50
 TRUNCATION_TEXT = " ..."
 # Use NOT_CONNECTED_VALUE in tables for signals that are not connected.
 NOT_CONNECTED_VALUE = "-n/c-"
+# Use TIMEOUT_VALUE in tables for signals not read within ``max_latency``.
+TIMEOUT_VALUE = "-timeout-"
+# Number of threads for batched reads of signals.
+DEFAULT_MAX_WORKERS = 16
+
+
+def _walk_signals(device, signal_class=Signal, log=logger.warning):
+    """
+    Yield each ``signal_class`` Signal of ``device``, depth-first.
+
+    Uses the cached component table of the device class.  Only the
+    components on the path to a matching Signal are created.  A component
+    that cannot be created is logged, its subcomponents are skipped.
+    """
+    objects = {"": device}  # created (or None if failed), by dotted name
+
+    def get_object(dotted_name):
+        if dotted_name not in objects:
+            parent_name, _, attr = dotted_name.rpartition(".")
+            parent = get_object(parent_name)
+            obj = None
+            if parent is not None:
+                # Check for lazy components that may not be connected
+                try:
+                    obj = getattr(parent, attr)
+                except (ConnectionTimeoutError, TimeoutError):
+                    log(f"Could not list component: {parent.name}.{attr}")
+            objects[dotted_name] = obj
+        return objects[dotted_name]
+
+    for dotted_name, cpt in _component_table(type(device)):
+        if cpt.is_device or not issubclass(cpt.cls, signal_class):
+            continue
+        obj = get_object(dotted_name)
+        if isinstance(obj, signal_class):
+            yield obj
 
 
 def _all_signals(base):
     if isinstance(base, Signal):
         return [base]
-    items = []
-    if hasattr(base, "component_names"):
-        for k in base.component_names:
-            # Check for lazy components that may not be connected
-            try:
-                obj = getattr(base, k)
-            except (ConnectionTimeoutError, TimeoutError):
-                logger.warning(f"Could not list component: {base.name}.{k}")
-                continue
-            if isinstance(obj, (Device, Signal)):
-                items += _all_signals(obj)
-    return items
-
-
-def _get_named_child(obj, nm):
-    """
-    return named child of ``obj`` or None
-    """
-    try:
-        child = getattr(obj, nm)
-        return child
-    except TimeoutError:
-        logger.debug(f"timeout: {obj.name}_{nm}")
-        return "TIMEOUT"
+    if not isinstance(base, Device):
+        return []
+    return list(_walk_signals(base))
 
 
 def _get_pv(obj):
@@ -69,6 +88,79 @@ def _get_pv(obj):
         return obj.prefix
 
 
+def _read_signal(signal):
+    """Return the value of ``signal`` or the text of the exception raised."""
+    try:
+        return signal.get()
+    except Exception as reason:
+        return str(reason)
+
+
+def _read_signals(signals, batch=True, max_latency=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Read the values of all ``signals``, return them as a list (same order).
+
+    At this point, either each Signal has connected or it may never connect.
+    It's much too slow to wait for a connection timeout on each signal, in
+    series.  Signals that are not connected now are reported as
+    ``NOT_CONNECTED_VALUE`` without waiting.
+
+    PARAMETERS
+
+    signals
+        *[obj]* : List of ophyd Signal objects.
+    batch
+        *bool* : Issue all reads together from a pool of threads (``True``)
+        or read each signal in turn (``False``).
+    max_latency
+        *float* or None : Time (s) allowed for all the reads.  Signals not
+        read in time are reported as ``TIMEOUT_VALUE``.  ``None`` waits for
+        every read to finish.
+    max_workers
+        *int* : Maximum number of threads for a batched read.
+    """
+    values = [NOT_CONNECTED_VALUE] * len(signals)
+    # fmt: off
+    pending = [
+        i for i, signal in enumerate(signals)
+        if signal.connected
+    ]
+    # fmt: on
+    if len(pending) == 0:
+        return values
+
+    deadline = None if max_latency is None else time.time() + max_latency
+    if not batch:
+        for i in pending:
+            if deadline is not None and time.time() > deadline:
+                values[i] = TIMEOUT_VALUE
+            else:
+                values[i] = _read_signal(signals[i])
+        return values
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(pending)),
+        thread_name_prefix="listdevice",
+    )
+    futures = {executor.submit(_read_signal, signals[i]): i for i in pending}
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=max_latency):
+            values[futures[future]] = future.result()
+    except concurrent.futures.TimeoutError:
+        for future, i in futures.items():
+            if not future.done():
+                values[i] = TIMEOUT_VALUE
+        logger.warning(
+            "listdevice: %d signal(s) not read within %s s.",
+            sum(v == TIMEOUT_VALUE for v in values),
+            max_latency,
+        )
+    finally:
+        # Do not wait for reads that did not finish in time.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return values
+
+
 def _list_epics_signals(obj):
     """
     Return a list of the EPICS signals in obj.
@@ -77,21 +169,13 @@ def _list_epics_signals(obj):
 
     list of ophyd objects that are children of ``obj``
     """
-    # import pdb; pdb.set_trace()
     if isinstance(obj, EpicsSignalBase):
         return [obj]
     elif isinstance(obj, Device):
-        items = []
-        for nm in obj.component_names:
-            child = _get_named_child(obj, nm)
-            if child in (None, "TIMEOUT"):
-                continue
-            result = _list_epics_signals(child)
-            if result is not None:
-                items.extend(result)
-        return items
+        return list(_walk_signals(obj, signal_class=EpicsSignalBase, log=logger.debug))
 
 
+@versionchanged(version="1.8.0", reason="Read signals in batch.  Add max_latency.")
 @call_signature_decorator
 def listdevice(
     obj,
@@ -103,6 +187,9 @@ def listdevice(
     show_ancient=True,
     max_column_width=None,
     table_style=TableStyle.pyRestTable,
+    batch=True,
+    max_latency=None,
+    max_workers=DEFAULT_MAX_WORKERS,
     _call_args=None,
 ):
     """Describe the signal information from device ``obj`` in a pandas DataFrame.
@@ -195,6 +282,21 @@ def listdevice(
 
         .. note:: ``pandas.DataFrame`` wll truncate long text
            to at most 50 characters.
+    batch *bool* :
+        Read all the signals together, from a pool of threads.  When
+        ``False``, read each signal in turn.
+
+        default: ``True``
+    max_latency *float* or *None* :
+        Time (seconds) allowed to read all the signals.  Signals not read in
+        time are shown as ``-timeout-``.  Signals that are not connected are
+        shown as ``-n/c-`` without waiting.
+
+        default: ``None`` (wait for all reads to finish)
+    max_workers *int* :
+        Maximum number of threads for a batched read.
+
+        default: ``16``
 
     .. seealso:: ``listdevice()`` in :doc:`/examples/ho_list_control_objects`
     """
@@ -234,37 +336,37 @@ def listdevice(
     if not cname and not dname:
         cname = True
 
-    dd = defaultdict(list)
+    rows = []
     for signal in signals:
         if scope != "epics" or isinstance(signal, EpicsSignalBase):
             ts = getattr(signal, "timestamp", 0)
             if show_ancient or (ts >= UNINITIALIZED):
-                if cname:
-                    head = obj
-                    while head.dotted_name != "":
-                        # walk back to the head
-                        head = head.parent
-                    dd["name"].append(f"{head.name}.{signal.dotted_name}")
-                if dname:
-                    dd["data name"].append(signal.name)
-                if show_pv:
-                    dd["PV"].append(_get_pv(signal) or "")
-                # At this point, either the Signal has connected or it may never
-                # connect.  It's much too slow to wait for a connection timeout
-                # on each signal, in series.  The default connection timeout has
-                # already been set.
-                # If the signal is not connected now, provide informative text
-                # and move along.
-                if signal.connected:
-                    try:
-                        v = signal.get()
-                    except Exception as reason:
-                        v = str(reason)
-                else:
-                    v = NOT_CONNECTED_VALUE
-                dd["value"].append(v)
-                if use_datetime:
-                    dd["timestamp"].append(datetime.datetime.fromtimestamp(ts))
+                rows.append((signal, ts))
+
+    # fmt: off
+    values = _read_signals(
+        [signal for signal, _ts in rows],
+        batch=batch,
+        max_latency=max_latency,
+        max_workers=max_workers,
+    )
+    # fmt: on
+
+    dd = defaultdict(list)
+    for (signal, ts), v in zip(rows, values):
+        if cname:
+            head = obj
+            while head.dotted_name != "":
+                # walk back to the head
+                head = head.parent
+            dd["name"].append(f"{head.name}.{signal.dotted_name}")
+        if dname:
+            dd["data name"].append(signal.name)
+        if show_pv:
+            dd["PV"].append(_get_pv(signal) or "")
+        dd["value"].append(v)
+        if use_datetime:
+            dd["timestamp"].append(datetime.datetime.fromtimestamp(ts))
 
     def truncate(value, width, pad):
         """Ensure that str(value) fits into column of 'width'."""
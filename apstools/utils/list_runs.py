@@ -9,17 +9,22 @@ Directory of bluesky runs
    ~listRunKeys
    ~ListRuns
    ~listruns
+   ~load_run_metadata
+   ~plan_frequency
+   ~run_latency_histogram
    ~summarize_runs
 """
 
+import concurrent.futures
 import dataclasses
 import datetime
 import logging
 import time
 import typing
 import warnings
-from collections import defaultdict
 
+import numpy
+import pandas
 from deprecated.sphinx import deprecated
 from deprecated.sphinx import versionadded
 from deprecated.sphinx import versionchanged
@@ -569,25 +574,54 @@ def listruns(
     return table_style.value(lr.parse_runs())
 
 
-def summarize_runs(since=None, db=None):
+#: Time bins known to :func:`plan_frequency()` (pandas frequency aliases).
+FREQUENCY_BINS = dict(day="D", week="W", month="MS", year="YS")
+
+
+def _read_start_document(cat, uid):
+    """Read one run's start document.  Return (uid, start, seconds)."""
+    t0 = time.time()
+    # next step is very slow (0.01 - 0.5 seconds each!)
+    run = cat[uid]
+    start = run.metadata["start"]
+    return uid, start, time.time() - t0
+
+
+@versionadded(version="1.8.0")
+def load_run_metadata(since=None, until=None, db=None, max_workers=8):
     """
-    Report bluesky run metrics from the databroker.
+    Load start document metadata of many runs, using a pool of threads.
 
-    * How many different plans?
-    * How many runs?
-    * How many times each run was used?
-    * How frequently?  (TODO:)
+    Most of the time to summarize a catalog is spent waiting for
+    each run to be read (``cat[uid]``).  These reads are run in parallel
+    by up to ``max_workers`` threads.  No more than ``2 * max_workers``
+    reads are pending at any time, so memory use does not grow with the
+    size of the catalog.
 
     PARAMETERS
 
     since
         *str* :
-        Report all runs since this ISO8601 date & time
+        Load all runs since this ISO8601 date & time
         (default: ``1995``)
+    until
+        *str* :
+        Load all runs before this ISO8601 date & time
+        (default: ``2100-12-31``)
     db
         *object* :
         Instance of ``databroker.Broker()``
         (default: ``db`` from the IPython shell)
+    max_workers
+        *int* :
+        Maximum number of runs to read at the same time.
+        (default: ``8``)
+
+    RETURNS
+
+    ``pandas.DataFrame`` with one row per run, sorted by start time.
+    Columns are ``uid``, ``scan_id``, ``plan_name``, ``time`` (timestamp),
+    ``datetime`` (local time), and ``latency`` (seconds to read the run).
     """
     from databroker.queries import TimeRange
 
@@ -596,52 +630,157 @@ def summarize_runs(since=None, db=None):
     db = db or ipython_shell_namespace()["db"]
     # no APS X-ray experiment data before 1995!
     since = since or "1995"
-    cat = db.v2.search(TimeRange(since=since))
-    plans = defaultdict(list)
-    t0 = time.time()
-    for n, uid in enumerate(cat):
-        t1 = time.time()
-        # next step is very slow (0.01 - 0.5 seconds each!)
-        run = cat[uid]
-        t2 = time.time()
-        plan_name = run.metadata["start"].get("plan_name", "unknown")
-        # fmt:off
-        dt = datetime.datetime.fromtimestamp(
-            run.metadata["start"]["time"]
-        ).isoformat()
-        # fmt:on
-        scan_id = run.metadata["start"].get("scan_id", "unknown")
+    until = until or LAST_DATA
+    cat = db.v2.search(TimeRange(since=since, until=until))
+    max_workers = max(1, int(max_workers))
+
+    rows = []
+
+    def collect(future):
+        uid, start, latency = future.result()
         # fmt: off
-        plans[plan_name].append(
+        rows.append(
             dict(
-                plan_name=plan_name,
-                dt=dt,
-                time_start=dt,
                 uid=uid,
-                scan_id=scan_id,
+                scan_id=start.get("scan_id", "unknown"),
+                plan_name=start.get("plan_name", "unknown"),
+                time=start["time"],
+                latency=latency,
             )
         )
         # fmt: on
-        logger.debug(
-            "%s %s dt1=%4.01fus dt2=%5.01fms %s",
-            scan_id,
-            dt,
-            (t1 - t0) * 1e6,
-            (t2 - t1) * 1e3,
-            plan_name,
-        )
-        t0 = time.time()
+        logger.debug("%s latency=%5.01fms", uid, latency * 1e3)
+
+    t0 = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for uid in cat:
+            if len(pending) >= 2 * max_workers:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            pending.add(executor.submit(_read_start_document, cat, uid))
+        for future in concurrent.futures.as_completed(pending):
+            collect(future)
+    logger.debug("loaded %d runs in %.03fs, max_workers=%d", len(rows), time.time() - t0, max_workers)
+
+    columns = "uid scan_id plan_name time datetime latency".split()
+    runs = pandas.DataFrame(rows, columns=columns)
+    runs["datetime"] = [datetime.datetime.fromtimestamp(ts) for ts in runs["time"]]
+    runs["datetime"] = pandas.to_datetime(runs["datetime"])
+    return runs.sort_values("time", ignore_index=True)
+
+
+@versionadded(version="1.8.0")
+def plan_frequency(runs, freq="week"):
+    """
+    Count how many times each plan was used, in bins of time.
+
+    PARAMETERS
+
+    runs
+        *object* :
+        ``pandas.DataFrame`` returned by :func:`load_run_metadata()`.
+    freq
+        *str* :
+        Width of each time bin: one of ``"day"``, ``"week"``,
+        ``"month"``, ``"year"``, or ``"cycle"`` (APS run cycle).
+        Any other pandas frequency alias (such as ``"8h"``) is accepted.
+        (default: ``"week"``)
+
+    RETURNS
+
+    ``pandas.DataFrame`` with one row per time bin and one column per plan.
+    """
+    if freq == "cycle":
+        from ..devices.aps_cycle import cycle_db
+
+        cycles = [cycle or "unknown" for cycle in cycle_db.get_cycle_names(runs["time"])]
+        grouper = pandas.Series(cycles, index=runs.index, name="cycle")
+    else:
+        grouper = pandas.Grouper(key="datetime", freq=FREQUENCY_BINS.get(freq, freq))
+    return runs.groupby([grouper, "plan_name"]).size().unstack(fill_value=0)
+
 
-    def sorter(plan_name):
-        return len(plans[plan_name])
+@versionadded(version="1.8.0")
+def run_latency_histogram(runs, bins=10):
+    """
+    Histogram of the time needed to read each run from the catalog.
+
+    PARAMETERS
+
+    runs
+        *object* :
+        ``pandas.DataFrame`` returned by :func:`load_run_metadata()`.
+    bins
+        *int* or *[float]* :
+        Number of bins or sequence of bin edges (seconds),
+        as accepted by ``numpy.histogram()``.
+        (default: ``10``)
+
+    RETURNS
+
+    ``pyRestTable.Table`` with the latency range (ms) and number of runs of each bin.
+    """
+    table = TableStyle.pyRestTable.value()
+    table.labels = "from_ms to_ms runs".split()
+    if len(runs) > 0:
+        counts, edges = numpy.histogram(runs["latency"], bins=bins)
+        for n, count in enumerate(counts):
+            table.addRow((f"{edges[n] * 1e3:.1f}", f"{edges[n + 1] * 1e3:.1f}", count))
+    return table
+
+
+@versionchanged(version="1.8.0", reason="Read runs in parallel, report frequency & latency.")
+def summarize_runs(since=None, db=None, freq=None, max_workers=8):
+    """
+    Report bluesky run metrics from the databroker.
+
+    * How many different plans?
+    * How many runs?
+    * How many times each run was used?
+    * How frequently?  (with ``freq``)
 
+    PARAMETERS
+
+    since
+        *str* :
+        Report all runs since this ISO8601 date & time
+        (default: ``1995``)
+    db
+        *object* :
+        Instance of ``databroker.Broker()``
+        (default: ``db`` from the IPython shell)
+    freq
+        *str* :
+        If given, also report how many times each plan was used
+        per ``"day"``, ``"week"``, ``"month"``, ``"year"``, or ``"cycle"``.
+        See :func:`plan_frequency()`.
+        (default: ``None``)
+    max_workers
+        *int* :
+        Maximum number of runs to read at the same time.
+        (default: ``8``)
+    """
+    t0 = time.time()
+    runs = load_run_metadata(since=since, db=db, max_workers=max_workers)
+    elapsed = time.time() - t0
+
+    quantity = runs["plan_name"].value_counts()
     table = TableStyle.pyRestTable.value()
     table.labels = "plan quantity".split()
-    for k in sorted(plans.keys(), key=sorter, reverse=True):
-        table.addRow((k, sorter(k)))
-    table.addRow(("TOTAL", n + 1))
+    for k, v in quantity.items():
+        table.addRow((k, v))
+    table.addRow(("TOTAL", len(runs)))
     print(table)
 
+    if freq is not None:
+        print(plan_frequency(runs, freq=freq))
+        print()
+
+    print(f"Read {len(runs)} runs in {elapsed:.2f}s ({max_workers=}).  Latency of each read:")
+    print(run_latency_histogram(runs))
+
 
 # -----------------------------------------------------------------------------
 # :author:    BCDA
@@ -29,9 +29,11 @@ Miscellaneous Support
    ~unix
 """
 
+import concurrent.futures
 import inspect
 import logging
 import pathlib
+import queue
 import re
 import socket
 import subprocess
@@ -39,6 +41,7 @@ import sys
 import threading
 import time
 import warnings
+import weakref
 from collections import OrderedDict
 from collections import defaultdict
 from functools import wraps
@@ -48,15 +51,20 @@ import pyRestTable
 from bluesky import plan_stubs as bps
 from bluesky.callbacks.best_effort import BestEffortCallback
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 from ophyd.ophydobj import OphydObject
 
 from ..callbacks import spec_file_writer
 from ._core import MAX_EPICS_STRINGOUT_LENGTH
 from ._core import TableStyle
 from .profile_support import ipython_shell_namespace
+from .pv_connection import PVConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Flattened component table of each Device class.  See _component_table().
+_component_tables = weakref.WeakKeyDictionary()
+
 
 def call_signature_decorator(f):
     """
@@ -107,15 +115,32 @@ def cleanupText(text, replace=None):
     return re.sub("[^a-zA-Z0-9_]", replace or "_", text)
 
 
+def _component_table(cls):
+    """
+    Return the flattened table of all components of Device class ``cls``.
+
+    The table is built once per class (from ``cls.walk_components()``) and
+    cached.  Each row is a ``(dotted_name, component)`` tuple, ordered
+    depth-first, as ``component_names`` at each level of the device tree.
+    """
+    table = _component_tables.get(cls)
+    if table is None:
+        table = tuple((walk.dotted_name, walk.item) for walk in cls.walk_components())
+        _component_tables[cls] = table
+    return table
+
+
+@versionchanged(version="1.8.0", reason="Use cached component table of the device class.")
 def count_child_devices_and_signals(device):
     """
     Dict with number of children of this device.  Keys: Device and Signal.
     """
     count = dict(Device=0, Signal=0)
     if hasattr(device, "walk_components"):  # Device has this attribute
-        for item in device.walk_components():
+        cls = device if isinstance(device, type) else type(device)
+        for _dotted_name, cpt in _component_table(cls):
             # assume if it is NOT a device, then it's a signal
-            which = "Device" if item.item.is_device else "Signal"
+            which = "Device" if cpt.is_device else "Signal"
             count[which] += 1
     else:
         count["Signal"] += 1
@@ -341,10 +366,16 @@ def render(value, sig_figs=12) -> str:
 
 
 @versionadded(version="1.1.11")
-def replay(headers, callback=None, sort=True):
+@versionchanged(version="1.8.0", reason="Read runs in threads.  Add several callbacks, exclude, & statistics.")
+def replay(headers, callback=None, sort=True, exclude=None, max_workers=1):
     """
     Replay the document stream from one (or more) scans (headers).
 
+    The documents of the next runs are read by ``max_workers`` threads
+    while the callback(s) handle the current run.  Callbacks are always
+    called from the calling thread, with the runs (and the documents of
+    each run) in order.
+
     PARAMETERS
 
     headers
@@ -355,16 +386,33 @@ def replay(headers, callback=None, sort=True):
         see: https://nsls-ii.github.io/databroker/api.html?highlight=header#header-api
 
     callback
-        *run* or *[run]* :
-        The Bluesky callback to handle the stream of documents from a run. If
-        ``None``, then use the `bec` (BestEffortCallback) from the IPython
-        shell.
+        *callable* or *[callable]* :
+        The Bluesky callback(s) to handle the stream of documents from a run.
+        Each document is sent to all callbacks.  If ``None``, then use the
+        `bec` (BestEffortCallback) from the IPython shell.
         (default:``None``)
 
     sort
         *bool* :
         Sort the headers chronologically if True.
         (default:``True``)
+
+    exclude
+        *str* or *[str]* :
+        Names of document types not sent to the callback(s),
+        such as ``"datum"`` when regenerating SPEC data files.
+        (default:``None``)
+
+    max_workers
+        *int* :
+        Number of runs to read at the same time.
+        (default:``1``)
+
+    RETURNS
+
+    *dict* :
+        Number of ``runs`` and ``documents`` replayed, the time
+        (``seconds``) taken, and the ``rate`` (documents/second).
     """
     from databroker import Header
 
@@ -374,6 +422,12 @@ def replay(headers, callback=None, sort=True):
         BestEffortCallback(),  # make one, if we must
     )
     # fmt: on
+    callbacks = callback if isinstance(callback, (list, tuple)) else [callback]
+    if isinstance(exclude, str):
+        exclude = exclude.split()
+    exclude = set(exclude or [])
+    max_workers = max(1, int(max_workers))
+
     _headers = headers  # do not mutate the input arg
     if not isinstance(_headers, (list, tuple)):
         _headers = [_headers]
@@ -401,19 +455,73 @@ def replay(headers, callback=None, sort=True):
     }[sort]
     # fmt: on
 
-    for h in sorted(runs, key=sorter):
+    runs = sorted(runs, key=sorter)
+    for h in runs:
         if not isinstance(h, Header):
             # fmt: off
             raise TypeError(
                 f"Must be a databroker Header: received: {type(h)}: |{h}|"
             )
             # fmt: on
-        cmd = spec_file_writer._rebuild_scan_command(h.start)
-        logger.debug("%s", cmd)
 
-        # at last, this is where the real action happens
-        for k, doc in h.documents():  # get the stream
-            callback(k, doc)  # play it through the callback
+    stop = threading.Event()
+    end_of_run = object()
+    pipelines = [queue.Queue(maxsize=1000) for _ in runs]
+
+    def put(pipeline, item):
+        """Wait for room in the pipeline, unless the replay has stopped."""
+        while not stop.is_set():
+            try:
+                pipeline.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def reader(h, pipeline):
+        try:
+            for k, doc in h.documents():  # get the stream
+                if stop.is_set():
+                    return
+                if k not in exclude:
+                    put(pipeline, (k, doc))
+        except Exception as exc:
+            put(pipeline, exc)
+        put(pipeline, end_of_run)
+
+    t0 = time.time()
+    n_docs = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for h, pipeline in zip(runs, pipelines):
+                executor.submit(reader, h, pipeline)
+            for h, pipeline in zip(runs, pipelines):
+                cmd = spec_file_writer._rebuild_scan_command(h.start)
+                logger.debug("%s", cmd)
+
+                # at last, this is where the real action happens
+                while True:
+                    item = pipeline.get()
+                    if item is end_of_run:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    for cb in callbacks:
+                        cb(*item)  # play it through the callback
+                    n_docs += 1
+        finally:
+            stop.set()
+            # Do not start readers for runs that will not be replayed.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    dt = time.time() - t0
+    stats = dict(runs=len(runs), documents=n_docs, seconds=dt, rate=n_docs / dt if dt > 0 else 0)
+    # fmt: off
+    logger.info(
+        "replayed %d documents from %d runs in %.3fs (%.1f documents/s)",
+        n_docs, len(runs), dt, stats["rate"],
+    )
+    # fmt: on
+    return stats
 
 
 def run_in_thread(func):
@@ -687,7 +795,8 @@ def listobjects(
     return table
 
 
-def connect_pvlist(pvlist, wait=True, timeout=2, poll_interval=0.1):
+@versionchanged(version="1.8.0", reason="Wait on connection callbacks, not by polling.  Add quorum.")
+def connect_pvlist(pvlist, wait=True, timeout=2, poll_interval=0.1, quorum=None):
     """
     Given list of EPICS PV names, return dict of EpicsSignal objects.
 
@@ -706,38 +815,32 @@ def connect_pvlist(pvlist, wait=True, timeout=2, poll_interval=0.1):
         (default: 2.0)
     poll_interval
         *float* :
-        time to sleep between checks for PV connections, seconds
+        not used, connections are signalled by callbacks
         (default: 0.1)
+    quorum
+        *int* or None :
+        stop waiting once this many PVs have connected
+        (default: ``None``, wait for all the PVs)
+
+    .. seealso:: :class:`~apstools.utils.pv_connection.PVConnectionManager`
     """
-    obj_dict = OrderedDict()
-    for item in pvlist:
-        if len(item.strip()) == 0:
-            continue
-        pvname = item.strip()
-        oname = "signal_{}".format(len(obj_dict))
-        obj = ophyd.EpicsSignal(pvname, name=oname)
-        obj_dict[oname] = obj
+    manager = PVConnectionManager(pvlist, quorum=quorum)
+    obj_dict = manager.signals
 
     if wait:
-        times_up = time.time() + max(0, timeout)
-        poll_interval = max(0.01, poll_interval)
-        waiting = True
-        while waiting and time.time() < times_up:
-            time.sleep(poll_interval)
-            waiting = False in [sig.connected for sig in obj_dict.values()]
-
-        if waiting:
+        if not manager.wait(timeout=max(0, timeout)):
             # If did not connect all, revise with only the connected PVs
             # and report the unconncetd PVs.
-            revised_dict = OrderedDict()
-            for label, sig in obj_dict.items():
-                if sig.connected:
-                    revised_dict[label] = sig
-                else:
-                    print(f"Could not connect {sig.pvname}")
+            revised_dict = manager.connected
+            for pvname in manager.unconnected:
+                print(f"Could not connect {pvname}")
             if len(revised_dict) == 0:
                 raise RuntimeError("Could not connect any PVs in the list")
             obj_dict = revised_dict
+        elif manager.quorum < len(obj_dict):
+            obj_dict = manager.connected
+        logger.debug("PV connection latency (s): %s", manager.latency)
+    manager.close()
 
     return obj_dict
 
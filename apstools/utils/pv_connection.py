@@ -0,0 +1,171 @@
+"""
+PV Connection Manager
++++++++++++++++++++++++++++++++++++++++
+
+Connect many EPICS PVs at once, driven by connection callbacks.
+
+.. autosummary::
+
+   ~PVConnectionManager
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import ophyd
+
+logger = logging.getLogger(__name__)
+
+
+class PVConnectionManager:
+    """
+    Create EpicsSignal objects for many PVs and wait for them to connect.
+
+    Instead of polling each signal, subscribe to its connection (metadata)
+    callbacks.  The :attr:`future` completes when all (or a ``quorum`` of)
+    the signals have connected.  The time each signal took to connect is
+    recorded in :attr:`latency`, by signal name (a PV listed twice has two
+    signals).
+
+    EXAMPLE::
+
+        manager = PVConnectionManager(["ioc:m1.RBV", "ioc:UPTIME"])
+        if not manager.wait(timeout=2):
+            print(f"Not connected: {manager.unconnected}")
+        signals = manager.signals  # dict of EpicsSignal objects
+
+    With asyncio (for example, at IOC startup)::
+
+        manager = PVConnectionManager(pvlist, quorum=900)
+        await manager.wait_async(timeout=5)
+
+    PARAMETERS
+
+    pvlist
+        *[str]* :
+        list of EPICS PV names.  Blank names are ignored.
+    quorum
+        *int* or None :
+        Number of PVs that must connect to complete the future.
+        (default: ``None``, meaning all the PVs)
+    signal_class
+        *class* :
+        ophyd Signal class to create for each PV.
+        (default: ``ophyd.EpicsSignal``)
+
+    .. autosummary::
+
+       ~wait
+       ~wait_async
+       ~close
+       ~connected
+       ~unconnected
+    """
+
+    def __init__(self, pvlist, quorum=None, signal_class=ophyd.EpicsSignal):
+        self.future = concurrent.futures.Future()
+        self.latency = {}  # seconds, by signal name
+        self.signals = OrderedDict()
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+
+        for item in pvlist:
+            if len(item.strip()) == 0:
+                continue
+            pvname = item.strip()
+            oname = f"signal_{len(self.signals)}"
+            self.signals[oname] = signal_class(pvname, name=oname)
+
+        if quorum is None:
+            quorum = len(self.signals)
+        self.quorum = min(max(0, quorum), len(self.signals))
+
+        self._check_quorum()
+        for signal in self.signals.values():
+            signal.subscribe(self._connection_cb, event_type=signal.SUB_META, run=False)
+            if signal.connected:  # Connected before the subscription?
+                self._record(signal)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"pvs={len(self.signals)}"
+            f", connected={len(self.latency)}"
+            f", quorum={self.quorum}"
+            ")"
+        )
+
+    def _connection_cb(self, *args, obj=None, connected=False, **kwargs):
+        """Metadata callback: record first connection of a signal."""
+        if connected and obj is not None:
+            self._record(obj)
+
+    def _record(self, signal):
+        with self._lock:
+            if signal.name in self.latency:
+                return
+            self.latency[signal.name] = time.monotonic() - self._t0
+        self._check_quorum()
+
+    def _check_quorum(self):
+        if len(self.latency) >= self.quorum and not self.future.done():
+            try:
+                self.future.set_result(self)
+            except concurrent.futures.InvalidStateError:
+                pass  # Another thread completed it.
+
+    def close(self):
+        """Stop watching the connection callbacks."""
+        for signal in self.signals.values():
+            signal.clear_sub(self._connection_cb)
+
+    @property
+    def connected(self):
+        """Dict of the connected signals."""
+        # fmt: off
+        return OrderedDict(
+            (k, v) for k, v in self.signals.items()
+            if v.connected
+        )
+        # fmt: on
+
+    @property
+    def unconnected(self):
+        """List of the names of PVs not connected."""
+        return [v.pvname for v in self.signals.values() if not v.connected]
+
+    def wait(self, timeout=None):
+        """
+        Wait (at most ``timeout`` s) for the quorum.  Return ``True`` if met.
+        """
+        try:
+            self.future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            return False
+        return True
+
+    async def wait_async(self, timeout=None):
+        """
+        Await (at most ``timeout`` s) the quorum.  Return ``True`` if met.
+        """
+        # shield: do not cancel self.future on timeout
+        future = asyncio.shield(asyncio.wrap_future(self.future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+# -----------------------------------------------------------------------------
+# :author:    BCDA
+# :copyright: (c) 2017-2026, UChicago Argonne, LLC
+#
+# Distributed under the terms of the Argonne National Laboratory Open Source License.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+# -----------------------------------------------------------------------------
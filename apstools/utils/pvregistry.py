@@ -6,14 +6,22 @@ EPICS PV Registry
 
    ~findbyname
    ~findbypv
+   ~findpvs
    ~PVRegistry
 """
 
+import bisect
+import fnmatch
 import logging
+import re
+import types
 from collections import defaultdict
 
 import ophyd
+from ophyd.areadetector.base import EpicsSignalWithRBV
+from ophyd.areadetector.paths import EpicsPathSignal
 from deprecated.sphinx import versionadded
+from deprecated.sphinx import versionchanged
 
 from . import full_dotted_name
 from . import ipython_shell_namespace
@@ -27,9 +35,30 @@ _findpv_registry = None
 class PVRegistry:
     """
     Cross-reference EPICS PVs with ophyd EpicsSignalBase objects.
+
+    The registry remembers which namespace symbols (and which objects)
+    it has indexed.  :meth:`refresh` walks only the symbols that are new
+    or bound to different objects and forgets the symbols removed.
+
+    With ``static=True``, the PV names of components not yet created
+    (such as *lazy* components) are derived from the device class,
+    without creating them (and their EPICS channels).  The PVs of signal
+    classes that build their own PV names (other than the areaDetector
+    ``EpicsSignalWithRBV`` & ``EpicsPathSignal``)
+    and of a ``FormattedComponent`` that needs attributes of a device not
+    yet created are not derived correctly.
+
+    .. autosummary::
+
+        ~refresh
+        ~search
+        ~search_by_mode
+        ~search_glob
+        ~search_prefix
+        ~ophyd_search
     """
 
-    def __init__(self, ns=None):
+    def __init__(self, ns=None, static=False):
         """
         Search ophyd objects for PV or ophyd names.
 
@@ -40,12 +69,19 @@ class PVRegistry:
         PARAMETERS
 
         ns *dict* or `None`: namespace dictionary
+        static *bool*: Derive PV names of components not yet created
+        from their ``Component`` definitions.  (default: ``False``)
         """
+        self.static = static
         self._pvdb = defaultdict(lambda: defaultdict(list))
         self._odb = {}
-        self._device_name = None
-        self._known_device_names = []
-        g = ns or ipython_shell_namespace() or globals()
+        self._known_device_names = {}  # device name: symbol that indexed it
+        self._skipped = defaultdict(set)  # device name: symbols that found it known
+        self._symbols = {}  # symbol: (id, object or type) indexed
+        self._added = {}  # symbol: what was added to the registry
+        self._refcounts = defaultdict(int)  # (pv, mode, dotted name): number of times added
+        self._current_symbol = None
+        self._sorted_pvs = None  # sorted PV names, for prefix searches
 
         # kickoff the registration process
         # fmt: off
@@ -53,51 +89,170 @@ class PVRegistry:
             "Cross-referencing EPICS PVs with Python objects & ophyd symbols"
         )
         # fmt: on
-        self._ophyd_epicsobject_walker(g)
+        self.refresh(ns)
+
+    def refresh(self, ns=None):
+        """
+        Update the registry from the namespace.
+
+        Index symbols that are new or bound to a different object.
+        Forget symbols no longer in the namespace.  Return the number
+        of symbols indexed.
+
+        PARAMETERS
 
-    def _ophyd_epicsobject_walker(self, parent):
+        ns *dict* or `None`: namespace dictionary
+        """
+        g = ns or ipython_shell_namespace() or globals()
+        # fmt: off
+        changed = [
+            k
+            for k, (oid, ref) in self._symbols.items()
+            if k not in g or not self._is_same_object(g[k], oid, ref)
+        ]
+        # fmt: on
+        for k in changed:
+            self._forget_symbol(k)
+        new_symbols = {k: g[k] for k in list(g) if k not in self._symbols}
+        self._ophyd_epicsobject_walker(new_symbols)
+        logger.debug("Indexed %d of %d symbols", len(new_symbols), len(g))
+        return len(new_symbols)
+
+    @staticmethod
+    def _is_same_object(obj, oid, ref):
+        """Is ``obj`` the same object that was indexed?"""
+        if isinstance(ref, ophyd.ophydobj.OphydObject):
+            return obj is ref
+        return id(obj) == oid and type(obj) is ref
+
+    def _forget_symbol(self, symbol):
+        """Remove everything added to the registry by this namespace symbol."""
+        pending = [symbol]
+        while len(pending) > 0:
+            symbol = pending.pop()
+            if self._symbols.pop(symbol, None) is None:
+                continue
+            added = self._added.pop(symbol, None)
+            if added is None:
+                continue
+            for pv, mode, fdn in added["pv"]:
+                key = (pv, mode, fdn)
+                self._refcounts[key] -= 1
+                if self._refcounts[key] <= 0:
+                    del self._refcounts[key]
+                    self._pvdb[pv][mode].remove(fdn)
+                    if not any(self._pvdb[pv].values()):
+                        del self._pvdb[pv]
+                        self._sorted_pvs = None
+            for oname, dotted in added["odb"]:
+                if self._odb.get(oname) == dotted:
+                    del self._odb[oname]
+            for dname in added["devices"]:
+                del self._known_device_names[dname]
+                # symbols that skipped this device must be walked again
+                pending.extend(self._skipped.pop(dname, []))
+
+    def _ophyd_epicsobject_walker(self, parent, path=None):
         """
         Walk through the parent object for ophyd Devices & EpicsSignals.
 
         This function is used to rebuild the ``self._pvdb`` object.
         """
         if isinstance(parent, dict):
-            keys = parent.keys()
-        else:
-            keys = parent.component_names
-            _nm_base = self._device_name
-        for k in keys:
-            if isinstance(parent, dict):
-                _nm_base = []
+            for k in parent.keys():
                 v = self._ref_dict(parent, k)
+                self._current_symbol = k
+                ref = v if isinstance(v, ophyd.ophydobj.OphydObject) else type(v)
+                self._symbols[k] = (id(v), ref)
+                self._added[k] = dict(pv=[], odb=[], devices=[])
+                self._index_object(v, [k])
+            self._current_symbol = None
+        else:
+            for k in parent.component_names:
+                v = self._ref_object_attribute(parent, k, path)
+                self._index_object(v, path + [k])
+
+    def _index_object(self, v, path):
+        """Index an EpicsSignal or walk through a Device."""
+        if v is None:
+            return
+        # print(path, type(v))
+        if isinstance(v, ophyd.signal.EpicsSignalBase):
+            try:
+                self._signal_processor(v)
+                self._register_name(v.name, ".".join(path))
+            except (KeyError, RuntimeError) as exc:
+                # fmt: off
+                logger.error(
+                    "Exception while examining key '%s': (%s)", path[-1], exc
+                )
+                # fmt: on
+        elif isinstance(v, ophyd.Device):
+            # print("Device", v.name)
+            if v.name in self._known_device_names:
+                self._skipped[v.name].add(self._current_symbol)
             else:
-                v = self._ref_object_attribute(parent, k)
-            if v is None:
-                continue
-            # print(k, type(v))
-            if isinstance(v, ophyd.signal.EpicsSignalBase):
-                try:
-                    self._signal_processor(v)
-                    self._odb[v.name] = ".".join(self._device_name + [k])
-                except (KeyError, RuntimeError) as exc:
-                    # fmt: off
-                    logger.error(
-                        "Exception while examining key '%s': (%s)", k, exc
-                    )
-                    # fmt: on
-            elif isinstance(v, ophyd.Device):
-                # print("Device", v.name)
-                self._device_name = _nm_base + [k]
-                if v.name not in self._known_device_names:
-                    self._odb[v.name] = ".".join(self._device_name)
-                    self._known_device_names.append(v.name)
-                    self._ophyd_epicsobject_walker(v)
+                self._known_device_names[v.name] = self._current_symbol
+                self._added[self._current_symbol]["devices"].append(v.name)
+                self._register_name(v.name, ".".join(path))
+                if self.static:
+                    self._static_walker(v, path, full_dotted_name(v))
+                else:
+                    self._ophyd_epicsobject_walker(v, path)
+
+    def _static_walker(self, device, path, fdn):
+        """
+        Walk through the components of a Device without creating any.
+
+        Components already created are indexed as usual.  Other components
+        are indexed from their class definition (see ``_static_component()``).
+        """
+        for attr, cpt in device._sig_attrs.items():
+            if attr in device._signals:  # already created
+                self._index_object(device._signals[attr], path + [attr])
+            else:
+                self._static_component(device, cpt, path + [attr], f"{fdn}.{attr}")
+
+    def _static_component(self, parent, cpt, path, fdn):
+        """
+        Index a component (not created) from its definition.
+
+        ``parent`` is either the Device or (for a Device not created) a
+        namespace with the ``prefix`` and ``name`` it would have.
+        """
+        cls = cpt.cls
+        if not isinstance(cls, type):
+            return
+        oname = f"{parent.name}_{cpt.attr}"
+        try:
+            pv = cpt.maybe_add_prefix(parent, "suffix", cpt.suffix)
+            write_pv = cpt.kwargs.get("write_pv")
+            if write_pv is not None:
+                write_pv = cpt.maybe_add_prefix(parent, "write_pv", write_pv)
+        except (AttributeError, IndexError, KeyError) as exc:
+            logger.debug("Cannot derive PV of '%s': (%s)", ".".join(path), exc)
+            return
+
+        if issubclass(cls, ophyd.signal.EpicsSignalBase):
+            if issubclass(cls, EpicsPathSignal):
+                pv = pv.removesuffix("_RBV")
+            if issubclass(cls, (EpicsPathSignal, EpicsSignalWithRBV)):
+                pv, write_pv = f"{pv}_RBV", pv  # areaDetector convention
+            self._register_pv(fdn, pv, "R")
+            if issubclass(cls, ophyd.EpicsSignal):
+                self._register_pv(fdn, write_pv or pv, "W")
+            self._register_name(oname, ".".join(path))
+        elif issubclass(cls, ophyd.Device):
+            self._register_name(oname, ".".join(path))
+            proxy = types.SimpleNamespace(prefix=pv, name=oname)
+            for attr, child in cls._sig_attrs.items():
+                self._static_component(proxy, child, path + [attr], f"{fdn}.{attr}")
 
     def _ref_dict(self, parent, key):
         """Accessor used by ``_ophyd_epicsobject_walker()``"""
         return parent[key]
 
-    def _ref_object_attribute(self, parent, key):
+    def _ref_object_attribute(self, parent, key, path=None):
         """Accessor used by ``_ophyd_epicsobject_walker()``"""
         try:
             obj = getattr(parent, key, None)
@@ -106,27 +261,43 @@ class PVRegistry:
             # fmt: off
             logger.error(
                 "Exception while getting object '%s.%s': (%s)",
-                ".".join(self._device_name), key, exc,
+                ".".join(path or []), key, exc,
             )
             # fmt: on
 
+    def _register_name(self, oname, dotted_name):
+        """Register the dotted name of an ophyd object by its ophyd name."""
+        self._odb[oname] = dotted_name
+        self._added[self._current_symbol]["odb"].append((oname, dotted_name))
+
     def _register_signal(self, signal, pv, mode):
         """Register a signal with the given mode."""
-        fdn = full_dotted_name(signal)
-        if fdn not in self._pvdb[pv][mode]:
+        self._register_pv(full_dotted_name(signal), pv, mode)
+
+    def _register_pv(self, fdn, pv, mode):
+        """Register the full dotted name of a signal with the given PV and mode."""
+        key = (pv, mode, fdn)
+        if self._refcounts[key] == 0:
+            if pv not in self._pvdb:
+                self._sorted_pvs = None
             self._pvdb[pv][mode].append(fdn)
+        self._refcounts[key] += 1
+        if self._current_symbol is not None:
+            self._added[self._current_symbol]["pv"].append(key)
 
     def _signal_processor(self, signal):
         """Register a signal's read & write PVs."""
-        self._register_signal(signal, signal._read_pv.pvname, "R")
-        if hasattr(signal, "_write_pv"):
-            self._register_signal(signal, signal._write_pv.pvname, "W")
+        self._register_signal(signal, signal.pvname, "R")
+        if hasattr(signal, "setpoint_pvname"):
+            self._register_signal(signal, signal.setpoint_pvname, "W")
 
     def search_by_mode(self, pvname, mode="R"):
         """Search for PV in specified mode."""
         if mode not in ["R", "W"]:
             raise ValueError(f"Incorrect mode given ({mode}.  Must be either `R` or `W`.")
-        return self._pvdb[pvname][mode]
+        if pvname not in self._pvdb:
+            return []
+        return list(self._pvdb[pvname][mode])
 
     def search(self, pvname):
         """Search for PV in both read & write modes."""
@@ -135,12 +306,35 @@ class PVRegistry:
             write=self.search_by_mode(pvname, "W"),
         )
 
+    def search_prefix(self, prefix):
+        """Search for all PVs that start with ``prefix``.  Return dict keyed by PV."""
+        if self._sorted_pvs is None:
+            self._sorted_pvs = sorted(self._pvdb)
+        pvs = self._sorted_pvs
+        result = {}
+        i = bisect.bisect_left(pvs, prefix)
+        while i < len(pvs) and pvs[i].startswith(prefix):
+            result[pvs[i]] = self.search(pvs[i])
+            i += 1
+        return result
+
+    def search_glob(self, pattern):
+        """Search for all PVs that match glob ``pattern``.  Return dict keyed by PV."""
+        prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        # fmt: off
+        return {
+            pv: found
+            for pv, found in self.search_prefix(prefix).items()
+            if fnmatch.fnmatchcase(pv, pattern)
+        }
+        # fmt: on
+
     def ophyd_search(self, oname):
         """Search for ophyd object by ophyd name."""
         return self._odb.get(oname)
 
 
-def _get_pv_registry(force_rebuild, ns):
+def _get_pv_registry(force_rebuild, ns, static=False):
     """
     Check if need to build/rebuild the PV registry.
 
@@ -148,21 +342,30 @@ def _get_pv_registry(force_rebuild, ns):
 
     force_rebuild
         *bool* :
-        If ``True``, rebuild the internal registry that maps
-        EPICS PV names to ophyd objects.
+        If ``True``, update the internal registry that maps
+        EPICS PV names to ophyd objects.  Only the new or changed
+        symbols in the namespace are examined.
     ns
         *dict* or `None` :
         Namespace dictionary of Python objects.
+    static
+        *bool* :
+        If ``True``, derive the PVs of components not yet created
+        (such as lazy components) without creating them.
+        See :class:`PVRegistry`.
 
     """
     global _findpv_registry
-    if _findpv_registry is None or force_rebuild:
-        _findpv_registry = PVRegistry(ns=ns)
+    if _findpv_registry is None or _findpv_registry.static != static:
+        _findpv_registry = PVRegistry(ns=ns, static=static)
+    elif force_rebuild:
+        _findpv_registry.refresh(ns=ns)
     return _findpv_registry
 
 
+@versionchanged(version="1.8.0", reason="Add 'static' keyword.")
 @versionadded(version="1.5.0")
-def findbyname(oname, force_rebuild=False, ns=None):
+def findbyname(oname, force_rebuild=False, ns=None, static=False):
     """
     Find the ophyd (dotted name) object associated with the given ophyd name.
 
@@ -178,6 +381,11 @@ def findbyname(oname, force_rebuild=False, ns=None):
     ns
         *dict* or `None` :
         Namespace dictionary of Python objects.
+    static
+        *bool* :
+        If ``True``, derive the PVs of components not yet created
+        (such as lazy components) without creating them.
+        See :class:`PVRegistry`.
 
     RETURNS
 
@@ -189,10 +397,11 @@ def findbyname(oname, force_rebuild=False, ns=None):
         In [45]: findbyname("adsimdet_cam_acquire")
         Out[45]: 'adsimdet.cam.acquire'
     """
-    return _get_pv_registry(force_rebuild, ns).ophyd_search(oname)
+    return _get_pv_registry(force_rebuild, ns, static).ophyd_search(oname)
 
 
-def findbypv(pvname, force_rebuild=False, ns=None):
+@versionchanged(version="1.8.0", reason="Add 'static' keyword.")
+def findbypv(pvname, force_rebuild=False, ns=None, static=False):
     """
     Find all ophyd objects associated with the given EPICS PV.
 
@@ -208,6 +417,11 @@ def findbypv(pvname, force_rebuild=False, ns=None):
     ns
         *dict* or `None` :
         Namespace dictionary of Python objects.
+    static
+        *bool* :
+        If ``True``, derive the PVs of components not yet created
+        (such as lazy components) without creating them.
+        See :class:`PVRegistry`.
 
     RETURNS
 
@@ -225,7 +439,48 @@ def findbypv(pvname, force_rebuild=False, ns=None):
         Out[46]: {'read': ['adsimdet.cam.acquire'], 'write': []}
 
     """
-    return _get_pv_registry(force_rebuild, ns).search(pvname)
+    return _get_pv_registry(force_rebuild, ns, static).search(pvname)
+
+
+@versionadded(version="1.8.0")
+def findpvs(pattern, force_rebuild=False, ns=None, static=False):
+    """
+    Find all EPICS PVs (and their ophyd objects) that match a glob pattern.
+
+    PARAMETERS
+
+    pattern
+        *str* :
+        Glob pattern of EPICS PV names to search, such as ``"ioc:m1*"``
+        (all PVs starting with ``ioc:m1``) or ``"ioc:*:Acquire"``.
+    force_rebuild
+        *bool* :
+        If ``True``, update the internal registry that maps
+        EPICS PV names to ophyd objects.
+    ns
+        *dict* or `None` :
+        Namespace dictionary of Python objects.
+    static
+        *bool* :
+        If ``True``, derive the PVs of components not yet created
+        (such as lazy components) without creating them.
+        See :class:`PVRegistry`.
+
+    RETURNS
+
+    dict:
+        Dictionary keyed by matching PV name.  Each value is a
+        dictionary as returned by :func:`findbypv()`.
+
+    EXAMPLE::
+
+        In [47]: findpvs("ad:cam1:Acquire*")
+        Out[47]:
+        {'ad:cam1:Acquire': {'read': [], 'write': ['adsimdet.cam.acquire']},
+         'ad:cam1:AcquirePeriod': {'read': [], 'write': ['adsimdet.cam.acquire_period']},
+         ...
+    """
+    return _get_pv_registry(force_rebuild, ns, static).search_glob(pattern)
 
 
 # -----------------------------------------------------------------------------
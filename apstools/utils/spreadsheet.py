@@ -9,6 +9,8 @@ Spreadsheet Support
    ~ExcelReadError
 """
 
+import contextlib
+import itertools
 import math
 import pathlib
 from collections import OrderedDict
@@ -18,6 +20,14 @@ import openpyxl.utils.exceptions
 
 from . import to_unicode_or_bust
 
+try:
+    import python_calamine
+except ModuleNotFoundError:
+    python_calamine = None
+
+EXCEL_ENGINES = ("openpyxl", "calamine")
+"""Libraries that can read the spreadsheet (``calamine`` is optional)."""
+
 
 class ExcelReadError(openpyxl.utils.exceptions.InvalidFileException):
     """
@@ -59,13 +69,27 @@ class ExcelDatabaseFileBase(object):
                 key = entry["Name"]
                 self.db[key] = entry
 
+    The rows are streamed, one at a time, from the spreadsheet file into
+    ``handleExcelRowEntry()``.  The memory used does not grow with the
+    number of rows.  Set ``EXCEL_ENGINE = "calamine"`` (or pass
+    ``engine="calamine"``) to read with the (faster) optional
+    `python-calamine <https://pypi.org/project/python-calamine/>`_ package
+    (``pip install apstools[calamine]``).
+
+    .. note:: calamine reports every number as a float.  The calamine
+       engine reports a float with an integral value as an int, as openpyxl
+       does for numbers stored without a decimal point.  (Excel and
+       openpyxl store ``3.0`` as ``3``.)  A file that stores ``3.0`` reads
+       as ``3.0`` with openpyxl and as ``3`` with calamine.
+
     """
 
     EXCEL_FILE = None  # subclass MUST define
     # EXCEL_FILE = pathlib.Path("abstracts") / "index of abstracts.xlsx"
     LABELS_ROW = 3  # labels are on line LABELS_ROW+1 in the Excel file
+    EXCEL_ENGINE = "openpyxl"  # one of EXCEL_ENGINES
 
-    def __init__(self, ignore_extra=True):
+    def __init__(self, ignore_extra=True, engine=None):
         self.db = OrderedDict()
         self.data_labels = None
         if self.EXCEL_FILE is None:
@@ -74,7 +98,7 @@ class ExcelDatabaseFileBase(object):
 
         self.sheet_name = 0
 
-        self.parse(ignore_extra=ignore_extra)
+        self.parse(ignore_extra=ignore_extra, engine=engine)
 
     def handle_single_entry(self, entry):  # subclass MUST override
         # fmt: off
@@ -95,41 +119,85 @@ class ExcelDatabaseFileBase(object):
         labels_row_num=None,
         data_start_row_num=None,
         ignore_extra=True,
+        engine=None,
     ):
+        """
+        Read the rows of the spreadsheet into ``handleExcelRowEntry()``.
+
+        PARAMETERS
+
+        labels_row_num
+            *int* :
+            Row (zero-based numbering) with the column labels.
+            (default: ``LABELS_ROW``)
+        data_start_row_num
+            *int* :
+            Not used.
+        ignore_extra
+            *bool* :
+            When ``True``, read only the table below the labels row.
+            (default: ``True``)
+        engine
+            *str* :
+            Library to read the file, one of ``EXCEL_ENGINES``.
+            (default: ``EXCEL_ENGINE``)
+        """
         labels_row_num = labels_row_num or self.LABELS_ROW
-        try:
-            wb = openpyxl.load_workbook(self.fname)
-            ws = wb.worksheets[self.sheet_name]
+        with self._sheet_rows(engine or self.EXCEL_ENGINE) as rows:
             if ignore_extra:
                 # ignore data outside of table in spreadsheet file
-                data = list(ws.rows)[labels_row_num:]
-                self.data_labels = []
-                for c in data[0]:
-                    if c.value is None:
-                        break
-                    self.data_labels.append(c.value)
-                rows = []
-                for r in data[1:]:
-                    if r[0].value is None:
-                        break
-                    rows.append(r[: len(self.data_labels)])
+                labels = next(itertools.islice(rows, labels_row_num, None), ())
+                # fmt: off
+                self.data_labels = list(
+                    itertools.takewhile(lambda v: v is not None, labels)
+                )
+                # fmt: on
+                rows = itertools.takewhile(lambda r: len(r) > 0 and r[0] is not None, rows)
             else:
                 # use the whole sheet
-                rows = list(ws.rows)
+                rows = iter(rows)
+                first = next(rows, ())
+                rows = itertools.chain([first], rows)
                 # create the column titles
                 # fmt: off
                 self.data_labels = [
-                    f"Column_{i+1}" for i in range(len(rows[0]))
+                    f"Column_{i+1}" for i in range(len(first))
                 ]
                 # fmt: on
-        except openpyxl.utils.exceptions.InvalidFileException as exc:
-            raise ExcelReadError(exc)
-        for row in rows:
-            entry = OrderedDict()
-            for _col, label in enumerate(self.data_labels):
-                entry[label] = row[_col].value
-                self.handle_single_entry(entry)
-            self.handleExcelRowEntry(entry)
+            for row in rows:
+                entry = OrderedDict()
+                for _col, label in enumerate(self.data_labels):
+                    entry[label] = row[_col] if _col < len(row) else None
+                    self.handle_single_entry(entry)
+                self.handleExcelRowEntry(entry)
+
+    @contextlib.contextmanager
+    def _sheet_rows(self, engine):
+        """Iterate the rows (tuples of cell values) of the sheet."""
+        if engine not in EXCEL_ENGINES:
+            raise ValueError(f"engine={engine!r} must be one of {EXCEL_ENGINES}")
+        if engine == "calamine":
+            if python_calamine is None:
+                raise ValueError("engine='calamine' requires the 'python-calamine' package")
+            try:
+                wb = python_calamine.CalamineWorkbook.from_path(str(self.fname))
+                sheet = wb.get_sheet_by_index(self.sheet_name)
+            except python_calamine.CalamineError as exc:
+                raise ExcelReadError(exc)
+            try:
+                yield _calamine_rows(sheet)
+            finally:
+                wb.close()
+        else:
+            try:
+                wb = openpyxl.load_workbook(self.fname, read_only=True)
+                ws = wb.worksheets[self.sheet_name]
+            except openpyxl.utils.exceptions.InvalidFileException as exc:
+                raise ExcelReadError(exc)
+            try:
+                yield ws.iter_rows(values_only=True)
+            finally:
+                wb.close()
 
     def _getExcelColumnValue(self, row_data, col):
         v = row_data[col]
@@ -207,6 +275,10 @@ class ExcelDatabaseFileGeneric(ExcelDatabaseFileBase):
 
         When ``False``, cells with other information (in Sheet 1) will
         be made available, sometimes with unpredictable results.
+    engine
+        *str* :
+        Library to read the file: ``"openpyxl"`` or (optional)
+        ``"calamine"``, default: ``"openpyxl"``.
 
     EXAMPLE
 
@@ -267,11 +339,11 @@ class ExcelDatabaseFileGeneric(ExcelDatabaseFileBase):
 
     """
 
-    def __init__(self, filename, labels_row=3, ignore_extra=True):
+    def __init__(self, filename, labels_row=3, ignore_extra=True, engine=None):
         self._index_ = 0
         self.EXCEL_FILE = self.EXCEL_FILE or filename
         self.LABELS_ROW = labels_row
-        ExcelDatabaseFileBase.__init__(self, ignore_extra=ignore_extra)
+        ExcelDatabaseFileBase.__init__(self, ignore_extra=ignore_extra, engine=engine)
 
     def handle_single_entry(self, entry):
         pass
@@ -283,6 +355,30 @@ class ExcelDatabaseFileGeneric(ExcelDatabaseFileBase):
         self._index_ += 1
 
 
+def _calamine_rows(sheet):
+    """
+    Rows of a calamine sheet, with cell values as openpyxl reports them.
+
+    Except: calamine reports every number as float, with no way to tell
+    a stored ``3`` from ``3.0``.  Integral floats are reported as int.
+    """
+
+    def value(v):
+        if v == "":
+            return None  # empty cell
+        if isinstance(v, float) and v.is_integer():
+            return int(v)  # calamine reports all numbers as float
+        return v
+
+    # calamine skips the empty rows & columns before the first used cell
+    first_row, first_col = sheet.start or (0, 0)
+    padding = (None,) * first_col
+    for _ in range(first_row):
+        yield padding + (None,) * sheet.width
+    for row in sheet.iter_rows():
+        yield padding + tuple(value(v) for v in row)
+
+
 # -----------------------------------------------------------------------------
 # :author:    BCDA
 # :copyright: (c) 2017-2026, UChicago Argonne, LLC
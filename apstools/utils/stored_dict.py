@@ -10,6 +10,10 @@ the contents of ``RE.md`` in a YAML file when this dictionary is changed.
    :nosignatures:
 
    ~StoredDict
+   ~get_serializer
+   ~JsonSerializer
+   ~MsgpackSerializer
+   ~YamlSerializer
 
 .. rubric:: Example
 
@@ -25,6 +29,10 @@ of ``RE.md`` to file ``".re.md_dict.yml"`` (in the present working directory):
 Within seconds of changing any key in the ``RE.md`` dictionary, the entire
 dictionary contents will be written to the file.
 
+To append only the changes (to a journal file) instead, use::
+
+    RE.md = StoredDict(".re.md_dict.yml", journal=True)
+
 .. note:: Only changes to the top level of `RE.md` will trigger the file
     to be updated.  Changes to lower-level structure will not trigger updates.
 
@@ -41,6 +49,13 @@ dictionary contents will be written to the file.
     (of the bluesky session) or could be in any directory (absolute or
     relative) to which the session has write access.
 
+.. tip:: The file format is chosen from the file name extension:
+    YAML (``.yml``, ``.yaml``, and any other extension), JSON (``.json``), or
+    msgpack (``.msgpack``, ``.mpk``, needs the ``msgpack`` package).  Or, choose it by name, such as
+    ``StoredDict(".re.md_dict", serializer="json")``.  See ``SERIALIZERS``.
+    The faster libyaml (``CLoader``/``CDumper``) and ``orjson`` libraries
+    are used when installed.
+
 .. tip:: The storage model (YAML) could be changed to something else
     (such as EPICS PV) by changing these two static methods:
     :meth:`~apstools.utils.stored_dict.StoredDict.dump()` and
@@ -51,13 +66,131 @@ import atexit
 import collections.abc
 import datetime
 import json
+import logging
+import os
 import pathlib
 import threading
 import time
 
 import yaml
+from deprecated.sphinx import versionchanged
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".jsonl"
+"""Suffix added to the file name for the journal file."""
+
+DEFAULT_COMPACT_EVERY = 1000
+"""Rewrite the whole file after this many journal entries."""
+
+
+class YamlSerializer:
+    """YAML file format, uses libyaml (``CLoader``/``CDumper``) if available."""
+
+    binary = False
+    loader = getattr(yaml, "CLoader", yaml.Loader)
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+    def dumps(self, contents, title=None):
+        text = ""
+        if isinstance(title, str) and len(title) > 0:
+            text += f"# {title}\n"
+        text += f"# Dictionary contents written: {datetime.datetime.now()}\n\n"
+        text += yaml.dump(contents, indent=2, Dumper=self.dumper)
+        return text
+
+    def loads(self, data):
+        return yaml.load(data, self.loader)
+
+
+class JsonSerializer:
+    """
+    JSON file format, uses ``orjson`` if available.
+
+    The title is not written.  Keys are written as text.
+    """
+
+    binary = False
+
+    def dumps(self, contents, title=None):
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(contents, option=option).decode("utf8")
+        return json.dumps(contents, indent=2)
+
+    def loads(self, data):
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackSerializer:
+    """msgpack (binary) file format.  The title is not written.  Requires ``msgpack``."""
+
+    binary = True
+
+    @staticmethod
+    def module():
+        """Import and return the (optional) ``msgpack`` package."""
+        try:
+            import msgpack
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "The msgpack file format needs the 'msgpack' package (pip install msgpack).",
+                name="msgpack",
+            ) from exc
+        return msgpack
+
+    def dumps(self, contents, title=None):
+        return self.module().packb(contents)
+
+    def loads(self, data):
+        return self.module().unpackb(data, strict_map_key=False)
+
+
+SERIALIZERS = {
+    "yaml": YamlSerializer(),
+    "json": JsonSerializer(),
+    "msgpack": MsgpackSerializer(),
+}
+"""File formats for StoredDict, by name."""
+
+SERIALIZER_SUFFIXES = {
+    ".json": "json",
+    ".mpk": "msgpack",
+    ".msgpack": "msgpack",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+"""Name of the file format for a file name extension.  Default: yaml."""
+
+
+def get_serializer(file, serializer=None):
+    """
+    Return the serializer for ``file``.
+
+    PARAMETERS
+
+    file : str or pathlib.Path
+        Name of the file.  Its extension chooses the serializer.
+    serializer : str or None
+        Name of the serializer (a key of ``SERIALIZERS``), overrides the
+        choice by file extension.
+    """
+    if serializer is None:
+        suffix = pathlib.Path(file).suffix.lower()
+        serializer = SERIALIZER_SUFFIXES.get(suffix, "yaml")
+    if serializer not in SERIALIZERS:
+        raise KeyError(f"Unknown {serializer=!r}.  Must be one of {list(SERIALIZERS)}.")
+    return SERIALIZERS[serializer]
 
 
+@versionchanged(version="1.8.0", reason="One writer thread, atomic writes, optional journal.")
 class StoredDict(collections.abc.MutableMapping):
     """
     A MutableMapping which syncs it contents to storage.
@@ -69,6 +202,16 @@ class StoredDict(collections.abc.MutableMapping):
     chosen long enough to allow multiple updates to the mapping before a single
     write but short enough to ensure prompt backup of the mapping.
 
+    All writes are done by one (long-lived) writer thread.  The file is
+    written atomically: to a temporary file (in the same directory) which
+    then replaces the file.
+
+    With ``journal=True``, each change is appended (as a line of JSON) to a
+    journal file (same name as the file, with ``.jsonl`` appended), so that
+    frequent updates do not rewrite the whole file.  The journal is replayed
+    by :meth:`reload` and compacted (the whole file is rewritten and the
+    journal emptied) after ``compact_every`` entries and by :meth:`flush`.
+
     Example::
 
         >>> import bluesky
@@ -77,7 +220,8 @@ class StoredDict(collections.abc.MutableMapping):
 
     .. rubric:: Static methods
 
-    All support for the YAML format is implemented in the static methods.
+    All support for the file format is implemented in the static methods,
+    using the serializer chosen by :func:`get_serializer`.
 
     .. autosummary::
 
@@ -88,12 +232,22 @@ class StoredDict(collections.abc.MutableMapping):
 
     .. autosummary::
 
+        ~compact
         ~flush
         ~popitem
         ~reload
     """
 
-    def __init__(self, file, delay=5, title=None, serializable=True):
+    def __init__(
+        self,
+        file,
+        delay=5,
+        title=None,
+        serializable=True,
+        journal=False,
+        compact_every=DEFAULT_COMPACT_EVERY,
+        serializer=None,
+    ):
         """
         StoredDict : Dictionary that syncs to storage
 
@@ -109,16 +263,39 @@ class StoredDict(collections.abc.MutableMapping):
             Default: "Written by StoredDict."
         serializable : bool
             If True, validate new dictionary entries are JSON serializable.
+        journal : bool
+            If True, append changes to a journal file (JSON lines) instead of
+            rewriting the whole file.
+            Default: False
+        compact_every : int
+            (with ``journal=True``) Rewrite the whole file and empty the
+            journal after this many journal entries.
+            Default: 1000
+        serializer : str or None
+            File format, one of the keys of ``SERIALIZERS`` (such as
+            ``"yaml"``, ``"json"``, or ``"msgpack"``).
+            Default: None (choose from the file name extension)
         """
         self._file = pathlib.Path(file)
         self._delay = max(0, delay)
         self._title = title or f"Written by {self.__class__.__name__}."
         self.test_serializable = serializable
-
-        self.sync_in_progress = False
+        self._serializer = serializer
+        # Raise now (not when writing) if unknown or not installed.
+        if isinstance(get_serializer(self._file, serializer), MsgpackSerializer):
+            MsgpackSerializer.module()
+        self._journal_file = self._file.with_name(self._file.name + JOURNAL_SUFFIX)
+        self._journal = journal
+        self._compact_every = max(1, compact_every)
+        self._journal_length = 0  # entries in the journal file
+        self._journal_pending = []  # entries not yet written
+
+        self.sync_in_progress = False  # True when changes are not yet written
         self._sync_deadline = time.time()
         self._sync_key = f"sync_agent_{id(self):x}"
-        self._sync_loop_period = 0.005
+        self._sync_cv = threading.Condition()  # guards the sync state
+        self._write_lock = threading.RLock()  # one write at a time
+        self._sync_thread = None
 
         self._cache = {}
         self.reload()
@@ -128,7 +305,9 @@ class StoredDict(collections.abc.MutableMapping):
 
     def __delitem__(self, key):
         """Delete dictionary value by key."""
-        del self._cache[key]
+        with self._sync_cv:
+            del self._cache[key]
+            self._journal_entry("del", key)
         self._queue_storage()
 
     def __getitem__(self, key):
@@ -152,44 +331,100 @@ class StoredDict(collections.abc.MutableMapping):
         if self.test_serializable:
             json.dumps({key: value})
 
-        self._cache[key] = value  # Store the new (or revised) content.
+        with self._sync_cv:
+            self._cache[key] = value  # Store the new (or revised) content.
+            self._journal_entry("set", key, value)
         self._queue_storage()
 
-    def _delayed_sync_to_storage(self):
-        """
-        Sync the metadata to storage.
+    def _journal_entry(self, *entry):
+        """Remember a change for the journal.  Call with _sync_cv held."""
+        if self._journal:
+            self._journal_pending.append(entry)
 
-        Start a time-delay thread.  New writes to the metadata dictionary will
-        extend the deadline.  Sync once the deadline is reached.
+    def _sync_agent(self):
         """
+        Threaded task: write changes to storage.
 
-        def sync_agent():
-            """Threaded task."""
-            self.sync_in_progress = True
-            while time.time() < self._sync_deadline:
-                time.sleep(self._sync_loop_period)
-            self.sync_in_progress = False
-
-            StoredDict.dump(self._file, self._cache, title=self._title)
-
-        thred = threading.Thread(target=sync_agent)
-        thred.start()
+        Wait (on a condition variable) for changes.  New writes to the
+        dictionary extend the deadline.  Sync once the deadline is reached.
+        A failed write is logged; the next change will write again.
+        """
+        with self._sync_cv:
+            while True:
+                if not self.sync_in_progress:
+                    self._sync_cv.wait()
+                    continue
+                remaining = self._sync_deadline - time.time()
+                if remaining > 0:
+                    self._sync_cv.wait(remaining)
+                    continue
+                self._sync_cv.release()
+                try:
+                    self._write(compact=False)
+                except Exception:
+                    logger.exception("Could not write %s", self._file)
+                finally:
+                    self._sync_cv.acquire()
 
     def _queue_storage(self):
         """Set timer to store the revised dict."""
-        # Reset the deadline.
-        self._sync_deadline = time.time() + self._delay
+        with self._sync_cv:
+            # Reset the deadline.
+            self._sync_deadline = time.time() + self._delay
+            self.sync_in_progress = True
 
-        if not self.sync_in_progress:
-            # Start the sync_agent (thread).
-            self._delayed_sync_to_storage()
+            if self._sync_thread is None:
+                # Start the sync_agent (thread), only once.
+                self._sync_thread = threading.Thread(
+                    target=self._sync_agent,
+                    name=self._sync_key,
+                    daemon=True,
+                )
+                self._sync_thread.start()
+            self._sync_cv.notify()
+
+    def _write(self, compact=True):
+        """
+        Write the changes to storage.
+
+        Write the whole file, or (when journaling and not ``compact``) append
+        the new entries to the journal.
+        """
+        with self._write_lock:
+            with self._sync_cv:
+                # Take the snapshot while holding the write lock so that
+                # writes reach the storage in order.
+                contents = self._cache.copy()
+                entries, self._journal_pending = self._journal_pending, []
+                self.sync_in_progress = False
+                self._sync_deadline = min(self._sync_deadline, time.time())
+
+            if self._journal:
+                if len(entries) > 0:
+                    try:
+                        _append_journal(self._journal_file, entries)
+                        self._journal_length += len(entries)
+                    except Exception:
+                        # Such as a value that is not JSON serializable.
+                        # Write the whole file instead (it has the changes).
+                        logger.exception("Could not append to %s", self._journal_file)
+                        self._journal_length += len(entries)
+                        compact = True
+                if not compact and self._journal_length < self._compact_every:
+                    return
+            StoredDict.dump(self._file, contents, title=self._title, serializer=self._serializer)
+            if self._journal and self._journal_length > 0:
+                # The file has all the journal entries now.
+                _atomic_write(self._journal_file, "")
+                self._journal_length = 0
+
+    def compact(self):
+        """Write the whole dictionary to the file and empty the journal."""
+        self._write(compact=True)
 
     def flush(self):
         """Force a write of the dictionary to disk"""
-        if not self.sync_in_progress:
-            StoredDict.dump(self._file, self._cache, title=self._title)
-        self._sync_deadline = time.time()
-        self.sync_in_progress = False
+        self._write(compact=True)
 
     def popitem(self):
         """
@@ -198,27 +433,76 @@ class StoredDict(collections.abc.MutableMapping):
         Pairs are returned in LIFO (last-in, first-out) order.
         Raises KeyError if the dict is empty.
         """
-        # self._queue_storage()  will be called by self.__delitem__()
-        return self._cache.popitem()
+        with self._sync_cv:
+            key, value = self._cache.popitem()
+            self._journal_entry("del", key)
+        self._queue_storage()
+        return key, value
 
     def reload(self):
-        """Read dictionary from storage."""
-        self._cache = StoredDict.load(self._file)
+        """Read dictionary from storage (and replay the journal)."""
+        with self._write_lock:
+            cache = StoredDict.load(self._file, serializer=self._serializer)
+            self._journal_length = 0
+            if self._journal_file.exists():
+                with open(self._journal_file) as f:
+                    for line in f:
+                        try:
+                            op, key, *value = json.loads(line)
+                        except ValueError:
+                            continue  # Incomplete (last) line, ignore it.
+                        if op == "set":
+                            cache[key] = value[0]
+                        elif op == "del":
+                            cache.pop(key, None)
+                        self._journal_length += 1
+            with self._sync_cv:
+                self._cache = cache
+                self._journal_pending = []
 
     @staticmethod
-    def dump(file, contents, title=None):
-        """Write dictionary to YAML file."""
-        with open(file, "w") as f:
-            if isinstance(title, str) and len(title) > 0:
-                f.write(f"# {title}\n")
-            f.write(f"# Dictionary contents written: {datetime.datetime.now()}\n\n")
-            f.write(yaml.dump(contents.copy(), indent=2))
+    def dump(file, contents, title=None, serializer=None):
+        """Write dictionary to file (atomically), YAML by default."""
+        serializer = get_serializer(file, serializer)
+        _atomic_write(file, serializer.dumps(contents.copy(), title=title))
 
     @staticmethod
-    def load(file):
-        """Read dictionary from YAML file."""
+    def load(file, serializer=None):
+        """Read dictionary from file, YAML by default."""
         file = pathlib.Path(file)
+        serializer = get_serializer(file, serializer)
         md = None
         if file.exists():
-            md = yaml.load(open(file).read(), yaml.Loader)
+            data = file.read_bytes() if serializer.binary else file.read_text()
+            if len(data) > 0:
+                md = serializer.loads(data)
         return md or {}  # In case file is empty.
+
+
+def _append_journal(file, entries):
+    """Append entries (as JSON lines) to the journal ``file``, then fsync."""
+    with open(file, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _atomic_write(file, text):
+    """
+    Replace ``file`` with ``text`` (str or bytes), atomically.
+
+    Write to a temporary file in the same directory, fsync, then rename.
+    A reader sees either the old or the new content, never a partial file.
+    """
+    file = pathlib.Path(file)
+    tmp = file.with_name(f".{file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb" if isinstance(text, bytes) else "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, file)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -1,8 +1,14 @@
+import asyncio
+import threading
+import time
+
 import pytest
+from ophyd import Signal
 
 from ...tests import IOC_AD
 from ...tests import IOC_GP
 from ..misc import connect_pvlist
+from ..pv_connection import PVConnectionManager
 
 
 @pytest.mark.parametrize(
@@ -15,3 +21,74 @@ def test_connect_pvlist(pvlist, success):
     assert isinstance(pvlist, list)
     pvdict = connect_pvlist(pvlist)
     assert isinstance(pvdict, dict)
+
+
+class FakePVSignal(Signal):
+    """Signal with a PV name that connects when told."""
+
+    def __init__(self, pvname, **kwargs):
+        super().__init__(**kwargs)
+        self.pvname = pvname
+        self._metadata["connected"] = False
+
+    @property
+    def connected(self):
+        return self._metadata["connected"]
+
+    def connect_later(self, delay):
+        def _connect():
+            self._metadata["connected"] = True
+            self._run_metadata_callbacks()
+
+        threading.Timer(delay, _connect).start()
+
+
+@pytest.mark.parametrize(
+    "quorum, n_connect, met",
+    [
+        [None, 4, True],
+        [None, 3, False],
+        [2, 2, True],
+        [3, 2, False],
+        [0, 0, True],
+    ],
+)
+def test_PVConnectionManager(quorum, n_connect, met):
+    pvlist = "pv:a pv:b  pv:c pv:d".split()
+    manager = PVConnectionManager(pvlist, quorum=quorum, signal_class=FakePVSignal)
+    assert len(manager.signals) == 4
+    for i, signal in enumerate(manager.signals.values()):
+        if i < n_connect:
+            signal.connect_later(0.01 * (i + 1))
+
+    t0 = time.time()
+    assert manager.wait(timeout=0.5) == met
+    assert (time.time() - t0) < (0.3 if met else 1)
+    if met:
+        assert len(manager.latency) >= manager.quorum
+    time.sleep(0.1)  # all timers have fired
+    assert len(manager.connected) == n_connect
+    assert manager.unconnected == pvlist[n_connect:]
+    assert sorted(manager.latency) == [f"signal_{i}" for i in range(n_connect)]
+    manager.close()
+
+
+def test_PVConnectionManager_duplicate_pv():
+    manager = PVConnectionManager(["pv:a", "pv:b", "pv:a"], signal_class=FakePVSignal)
+    assert len(manager.signals) == 3
+    for signal in manager.signals.values():
+        signal.connect_later(0.01)
+    assert manager.wait(timeout=5)  # quorum of 3 signals, 2 PVs
+    assert sorted(manager.latency) == ["signal_0", "signal_1", "signal_2"]
+    manager.close()
+
+
+def test_PVConnectionManager_async():
+    manager = PVConnectionManager(["pv:a", "pv:b"], signal_class=FakePVSignal)
+    manager.signals["signal_0"].connect_later(0.05)
+    assert not asyncio.run(manager.wait_async(timeout=0.2))
+    assert not manager.future.done()  # not cancelled by the timeout
+
+    manager.signals["signal_1"].connect_later(0.05)
+    assert asyncio.run(manager.wait_async(timeout=1))
+    assert manager.future.result() is manager
@@ -35,3 +35,90 @@ def test_ignore_extra_false(xl_file):
     xl = ExcelDatabaseFileGeneric(xl_file, ignore_extra=False)
     assert len(xl.db) == 16  # rows
     assert len(xl.db["0"]) == 9  # columns
+
+
+@pytest.mark.parametrize("ignore_extra", [True, False])
+@pytest.mark.parametrize("filename", ["demo3.xlsx", "actions.xlsx"])
+def test_engines(filename, ignore_extra):
+    pytest.importorskip("python_calamine")
+    xl_file = DATA_PATH / filename
+    expected = ExcelDatabaseFileGeneric(xl_file, ignore_extra=ignore_extra)
+    xl = ExcelDatabaseFileGeneric(xl_file, ignore_extra=ignore_extra, engine="calamine")
+    assert xl.data_labels == expected.data_labels
+    assert xl.db == expected.db
+
+
+def test_engine_unknown(xl_file):
+    with pytest.raises(ValueError, match="must be one of"):
+        ExcelDatabaseFileGeneric(xl_file, engine="xlrd")
+
+
+def scaled_actions_file(path, nrows, *extra_rows):
+    """Write the actions.xlsx table, scaled up to nrows, to path."""
+    import openpyxl
+
+    source = openpyxl.load_workbook(DATA_PATH / "actions.xlsx").active
+    header = list(source.iter_rows(max_row=4, values_only=True))
+    table = list(source.iter_rows(min_row=5, values_only=True))
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in header:
+        ws.append(row)
+    for i in range(nrows):
+        ws.append(table[i % len(table)])
+    for row in extra_rows:
+        ws.append(row)
+    wb.save(path)
+    return table
+
+
+class RowCounter(ExcelDatabaseFileGeneric):
+    """Count the rows, keep only the last one."""
+
+    def handleExcelRowEntry(self, entry):
+        self._index_ += 1
+        self.db["last"] = entry
+
+
+def test_parse_many_rows(tmp_path):
+    """Rows are streamed: scale the actions.xlsx table up to a few hundred rows."""
+    from ..spreadsheet import EXCEL_ENGINES
+    from ..spreadsheet import python_calamine
+
+    nrows = 500
+    xl_file = tmp_path / "actions_many.xlsx"
+    scaled_actions_file(xl_file, nrows, [3.0, 3.5])  # openpyxl stores 3.0 as 3
+
+    for engine in EXCEL_ENGINES:
+        if engine == "calamine" and python_calamine is None:
+            continue
+        xl = RowCounter(xl_file, engine=engine)
+        assert xl._index_ == nrows + 1
+        last = xl.db["last"]
+        assert (last["action"], last["sx"]) == (3, 3.5)
+        assert isinstance(last["action"], int)
+
+
+@pytest.mark.benchmark
+def test_parse_50k_rows_benchmark(tmp_path):
+    """Time each engine, parsing the actions.xlsx table scaled up to 50k rows."""
+    import time
+
+    from ..spreadsheet import EXCEL_ENGINES
+    from ..spreadsheet import python_calamine
+
+    nrows = 50_000
+    xl_file = tmp_path / "actions_50k.xlsx"
+    table = scaled_actions_file(xl_file, nrows)
+
+    for engine in EXCEL_ENGINES:
+        if engine == "calamine" and python_calamine is None:
+            print(f"{nrows} rows, {engine}: not installed")
+            continue
+        t0 = time.perf_counter()
+        xl = RowCounter(xl_file, engine=engine)
+        duration = time.perf_counter() - t0
+        assert xl._index_ == nrows
+        assert tuple(xl.db["last"].values()) == table[(nrows - 1) % len(table)]
+        print(f"{nrows} rows, {engine}: {duration:.3f}s")
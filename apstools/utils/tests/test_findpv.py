@@ -88,3 +88,44 @@ simdet.wait_for_connection()
 def test_main(finder, reference, expected):
     answer = finder(reference, ns=dict(m1=gpm1, simdet=simdet))
     assert answer == expected
+
+
+def test_PVRegistry_refresh():
+    from ..pvregistry import PVRegistry
+
+    ns = dict(m1=gpm1, alias=gpm1, simdet=simdet, x=5)
+    registry = PVRegistry(ns=ns)
+    assert registry.refresh(ns) == 0  # nothing new
+    assert registry.search(f"{IOC_GP}m1.RBV") == dict(read=["gpm1.user_readback"], write=[])
+    assert registry.ophyd_search(gpm1.user_setpoint.name) == "m1.user_setpoint"
+
+    # walk only the changed symbols
+    ns.pop("m1")
+    assert registry.refresh(ns) == 1  # 'alias' indexes gpm1 now
+    assert registry.ophyd_search(gpm1.user_setpoint.name) == "alias.user_setpoint"
+    ns.pop("alias")
+    assert registry.refresh(ns) == 0
+    assert registry.search(f"{IOC_GP}m1.RBV") == dict(read=[], write=[])
+    assert registry.ophyd_search(gpm1.user_setpoint.name) is None
+
+    found = registry.search_prefix(f"{IOC_AD}cam1:Acquire")
+    assert f"{IOC_AD}cam1:Acquire" in found
+    assert f"{IOC_AD}cam1:AcquireTime" in found
+    found = registry.search_glob(f"{IOC_AD}*:ArrayData")
+    assert found == {f"{IOC_AD}image1:ArrayData": registry.search(f"{IOC_AD}image1:ArrayData")}
+    assert registry.search_glob("no:such:pv*") == {}
+
+
+def test_PVRegistry_static():
+    from ..pvregistry import PVRegistry
+
+    # not connected: no IOC with this prefix
+    det = MyDetector("no_such_ioc:", name="det")
+    created = list(det._signals)
+
+    registry = PVRegistry(ns=dict(det=det), static=True)
+    assert list(det._signals) == created  # lazy components were not created
+    assert registry.search("no_such_ioc:cam1:Acquire") == dict(read=[], write=["det.cam.acquire"])
+    assert registry.search("no_such_ioc:cam1:Acquire_RBV") == dict(read=["det.cam.acquire"], write=[])
+    assert registry.search("no_such_ioc:HDF1:FilePath_RBV") == dict(read=["det.hdf1.file_path"], write=[])
+    assert registry.ophyd_search("det_image_array_data") == "det.image.array_data"
@@ -2,6 +2,8 @@
 Unit tests for :mod:`~apstools._utils.device_info`.
 """
 
+import threading
+
 import pytest
 from ophyd import Component
 from ophyd import Device
@@ -14,6 +16,8 @@ from ...devices import SwaitRecord
 from ...tests import IOC_GP
 from .._core import TableStyle
 from ..device_info import NOT_CONNECTED_VALUE
+from ..device_info import TIMEOUT_VALUE
+from ..device_info import _read_signals
 from ..device_info import _list_epics_signals
 from ..device_info import listdevice
 
@@ -37,6 +41,33 @@ class TwoSignalDevice(Device):
     bbb = Component(EpicsSignal, "bbb")
 
 
+class SlowSignal(Signal):
+    """Signal that records each read, then waits at the device's gate."""
+
+    def get(self, **kwargs):
+        self.parent.reads.append(self.attr_name)
+        self.parent.gate(self)
+        return super().get(**kwargs)
+
+
+class UnconnectedSignal(SlowSignal):
+    @property
+    def connected(self):
+        return False
+
+
+class SlowDevice(Device):
+    fast = Component(Signal, value=1)
+    slow = Component(SlowSignal, value=2)
+    slower = Component(SlowSignal, value=3)
+    offline = Component(UnconnectedSignal, value=4)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []  # names of the slow signals read, in order
+        self.gate = lambda signal: None  # called by each slow read
+
+
 calcs = MyDevice(f"{IOC_GP}userCalc", name="calcs")
 motor = EpicsMotor(f"{IOC_GP}m1", name="motor")
 signal = Signal(name="signal", value=True)
@@ -249,3 +280,64 @@ def test_listdevice_show_pv(sig, has_cname, has_dname, has_PV):
         assert "PV" in line, f"{line=}"
     else:
         assert "PV" not in line, f"{line=}"
+
+
+def test_read_signals_batch():
+    device = SlowDevice(name="device")
+    # Each slow read waits for the other: both must be read at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+    device.gate = lambda signal: barrier.wait()
+
+    values = _read_signals([device.fast, device.slow, device.slower], batch=True)
+    assert values == [1, 2, 3]
+    assert sorted(device.reads) == ["slow", "slower"]
+
+
+def test_read_signals_batch_max_latency():
+    device = SlowDevice(name="device")
+    release = threading.Event()
+    device.gate = lambda signal: release.wait(timeout=5)  # until the test is done
+
+    try:
+        values = _read_signals([device.fast, device.slow, device.slower], batch=True, max_latency=0.1)
+    finally:
+        release.set()
+    assert values == [1, TIMEOUT_VALUE, TIMEOUT_VALUE]
+
+
+@pytest.mark.parametrize(
+    "max_latency, expected, reads",
+    [
+        [None, [1, 2, 3], ["slow", "slower"]],
+        [0.1, [1, 2, TIMEOUT_VALUE], ["slow"]],  # slower is not read after the deadline
+    ],
+)
+def test_read_signals_series(max_latency, expected, reads):
+    device = SlowDevice(name="device")
+    release = threading.Event()
+
+    def gate(signal):
+        if signal.attr_name == "slow":
+            release.wait(timeout=0.3)  # past max_latency
+
+    device.gate = gate
+    values = _read_signals([device.fast, device.slow, device.slower], batch=False, max_latency=max_latency)
+    assert values == expected
+    assert device.reads == reads
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_read_signals_unconnected(batch):
+    device = SlowDevice(name="device")
+    values = _read_signals([device.offline, device.fast], batch=batch, max_latency=0.1)
+    assert values == [NOT_CONNECTED_VALUE, 1]
+    assert device.reads == []  # not read, not waited on
+
+
+def test_listdevice_unconnected_no_wait():
+    device = MyDevice("", name="device")
+
+    result = listdevice(device, max_latency=0.1)
+    values = [row[result.labels.index("value")] for row in result.rows]
+    assert values.count(NOT_CONNECTED_VALUE) == 126
+    assert TIMEOUT_VALUE not in values
@@ -370,3 +370,25 @@ def test_ListRuns_ids(ids, nresults, lr):
     dd = lr.parse_runs()
     assert len(dd["time"]) == nresults
 # fmt: on
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_load_run_metadata(max_workers, cat):
+    runs = utils.load_run_metadata(db=cat, max_workers=max_workers)
+    assert len(runs) == len(cat)
+    for key in "uid scan_id plan_name time datetime latency".split():
+        assert key in runs.columns
+    assert list(runs["time"]) == sorted(runs["time"])
+    assert (runs["latency"] >= 0).all()
+
+
+@pytest.mark.parametrize("freq", ["day", "week", "cycle", "8h"])
+def test_plan_frequency(freq, cat):
+    runs = utils.load_run_metadata(db=cat)
+    table = utils.plan_frequency(runs, freq=freq)
+    assert table.to_numpy().sum() == len(runs)
+    assert set(table.columns) == set(runs["plan_name"])
+
+    histogram = utils.run_latency_histogram(runs, bins=5)
+    assert len(histogram.rows) == 5
+    assert sum(row[-1] for row in histogram.rows) == len(runs)
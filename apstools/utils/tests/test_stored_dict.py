@@ -2,6 +2,7 @@
 Test the utils.stored_dict module.
 """
 
+import importlib.util
 import pathlib
 import re
 import sys
@@ -233,3 +234,194 @@ def test_set_exceptions(parms, context, md_file):
     with context:
         sdict.update(parms["md"])
         sdict.flush()
+
+
+def test_single_writer_thread(md_file):
+    """All writes, from many bursts, are made by one thread."""
+    sdict = StoredDict(md_file, delay=LUFTPAUSE_DELAY)
+    assert sdict._sync_thread is None  # not started until needed
+
+    for i in range(5):
+        sdict["a"] = i
+        thread = sdict._sync_thread
+        assert thread is not None
+        assert thread.is_alive()
+        luftpause(2 * LUFTPAUSE_DELAY)
+        assert not sdict.sync_in_progress
+        assert load_config_yaml(md_file)["a"] == i
+    assert sdict._sync_thread is thread
+    assert thread.name == sdict._sync_key
+
+    # No temporary files are left behind.
+    assert list(md_file.parent.glob(f".{md_file.name}.*.tmp")) == []
+
+
+def test_write_error(md_file, monkeypatch, caplog):
+    """The writer thread survives a failed write."""
+    from .. import stored_dict
+
+    sdict = StoredDict(md_file, delay=LUFTPAUSE_DELAY)
+
+    def disk_full(file, text):
+        raise OSError("No space left on device")
+
+    with monkeypatch.context() as m:
+        m.setattr(stored_dict, "_atomic_write", disk_full)
+        sdict["a"] = 1
+        luftpause(2 * LUFTPAUSE_DELAY)
+    assert "Could not write" in caplog.text
+    assert sdict._sync_thread.is_alive()
+
+    sdict["a"] = 2  # next change is written
+    luftpause(2 * LUFTPAUSE_DELAY)
+    assert load_config_yaml(md_file) == {"a": 2}
+
+    # journal: a value that is not JSON is written with the whole file
+    sdict = StoredDict(md_file, delay=LUFTPAUSE_DELAY, journal=True, serializable=False)
+    sdict["b"] = {1, 2}
+    luftpause(2 * LUFTPAUSE_DELAY)
+    assert "Could not append" in caplog.text
+    assert sdict._journal_length == 0
+    assert StoredDict.load(md_file) == {"a": 2, "b": {1, 2}}
+
+
+def test_journal(md_file):
+    """Changes are appended to a journal, compacted periodically."""
+    sdict = StoredDict(md_file, delay=LUFTPAUSE_DELAY, journal=True, compact_every=5)
+    journal = sdict._journal_file
+    assert journal.name == md_file.name + ".jsonl"
+
+    sdict.update({"a": 1, "b": 2})
+    del sdict["a"]
+    sdict[3] = [3, "three"]
+    luftpause(2 * LUFTPAUSE_DELAY)
+    assert len(file_splitlines(md_file)) == 0  # whole file not written
+    assert len(file_splitlines(journal)) == 4
+
+    # journal is replayed on reload
+    other = StoredDict(md_file, journal=True)
+    assert dict(other) == {"b": 2, 3: [3, "three"]}
+    assert other._journal_length == 4
+
+    # compaction
+    sdict["c"] = 3
+    luftpause(2 * LUFTPAUSE_DELAY)
+    assert len(file_splitlines(journal)) == 0
+    assert load_config_yaml(md_file) == {"b": 2, 3: [3, "three"], "c": 3}
+
+    sdict["c"] = 4
+    sdict.flush()
+    assert len(file_splitlines(journal)) == 0
+    assert load_config_yaml(md_file)["c"] == 4
+
+    # An incomplete last line (such as from a crash) is ignored.
+    with open(journal, "a") as f:
+        f.write('["set", "d", 5]\n["set", "e"')
+    assert dict(StoredDict(md_file, journal=True)) == {"b": 2, 3: [3, "three"], "c": 4, "d": 5}
+    journal.unlink()
+
+
+def realistic_md(n_keys=200):
+    """A dictionary such as RE.md, after a few years of use."""
+    md = {
+        "beamline_id": "APS 99-ID-Z",
+        "conda_prefix": "/home/beams/USER/micromamba/envs/bluesky_2024_3",
+        "login_id": "user@workstation",
+        "pid": 12345,
+        "proposal_id": "testing",
+        "scan_id": 98765,
+        "versions": {k: f"1.{i}.{i + 2}" for i, k in enumerate("apstools bluesky databroker ophyd numpy".split())},
+    }
+    for i in range(n_keys):
+        md[f"key_{i}"] = dict(
+            description=f"item {i} " * 5,
+            values=[i * 0.5, i, str(i)],
+            enabled=bool(i % 2),
+        )
+    return md
+
+
+@pytest.mark.parametrize(
+    "suffix, serializer, expected",
+    [
+        [".yml", None, "yaml"],
+        [".YAML", None, "yaml"],
+        [".txt", None, "yaml"],
+        ["", None, "yaml"],
+        [".json", None, "json"],
+        [".msgpack", None, "msgpack"],
+        [".mpk", None, "msgpack"],
+        [".yml", "json", "json"],
+    ],
+)
+def test_get_serializer(suffix, serializer, expected):
+    from ..stored_dict import SERIALIZERS
+    from ..stored_dict import get_serializer
+
+    assert get_serializer(f"md{suffix}", serializer) is SERIALIZERS[expected]
+
+
+def test_get_serializer_unknown(tmp_path):
+    from ..stored_dict import get_serializer
+
+    with pytest.raises(KeyError, match="Unknown serializer='xml'"):
+        get_serializer("md.yml", "xml")
+    with pytest.raises(KeyError):
+        StoredDict(tmp_path / "md.yml", serializer="xml")
+
+
+@pytest.mark.parametrize("suffix", [".yml", ".json", ".msgpack"])
+def test_serializers(suffix, tmp_path):
+    """Round trip each file format."""
+    if suffix == ".msgpack":
+        pytest.importorskip("msgpack")  # optional
+    md = realistic_md()
+    path = tmp_path / f"md{suffix}"
+    sdict = StoredDict(path, delay=LUFTPAUSE_DELAY)
+    sdict.update(md)
+    sdict.flush()
+    sdict.reload()
+    assert dict(sdict) == md
+    assert StoredDict.load(path) == md
+
+
+@pytest.mark.benchmark
+def test_serializers_benchmark(tmp_path):
+    """Compare dump & load of each file format, with realistic RE.md."""
+    from ..stored_dict import SERIALIZERS
+
+    md = realistic_md()
+    n = 20
+    results = {}
+    for key, serializer in SERIALIZERS.items():
+        if key == "msgpack" and importlib.util.find_spec("msgpack") is None:
+            continue
+        t0 = time.perf_counter()
+        for _i in range(n):
+            data = serializer.dumps(md)
+        t_dump = (time.perf_counter() - t0) / n
+        t0 = time.perf_counter()
+        for _i in range(n):
+            assert serializer.loads(data) == md
+        t_load = (time.perf_counter() - t0) / n
+        results[key] = (t_dump, t_load, len(data))
+
+    # Compare with the pure-Python YAML support.
+    t0 = time.perf_counter()
+    for _i in range(n):
+        data = yaml.dump(md, indent=2)
+    t_dump = (time.perf_counter() - t0) / n
+    t0 = time.perf_counter()
+    for _i in range(n):
+        yaml.load(data, yaml.Loader)
+    t_load = (time.perf_counter() - t0) / n
+    results["yaml (pure Python)"] = (t_dump, t_load, len(data))
+
+    for key, (t_dump, t_load, size) in results.items():
+        print(f"{key}: dump {t_dump * 1e3:.2f} ms, load {t_load * 1e3:.2f} ms, {size} bytes")
+
+
+def test_msgpack_missing(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgpack", None)  # as if not installed
+    with pytest.raises(ModuleNotFoundError, match="needs the 'msgpack' package"):
+        StoredDict(tmp_path / "md.msgpack")
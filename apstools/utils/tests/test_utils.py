@@ -214,6 +214,23 @@ def test_utils_listobjects_children(show_d, show_s, columns):
     assert columns == len(table.labels)
 
 
+def test_component_table():
+    from ..device_info import _all_signals
+    from ..misc import _component_table
+    from ..misc import _component_tables
+
+    det = ophyd.sim.hw().det
+    table = _component_table(type(det))
+    assert type(det) in _component_tables
+    assert _component_table(type(det)) is table  # cached
+    assert [row[0] for row in table] == [walk.dotted_name for walk in type(det).walk_components()]
+
+    signals = _all_signals(det)
+    assert [s.dotted_name for s in signals] == [k for k, cpt in table if not cpt.is_device]
+    counts = utils.count_child_devices_and_signals(det)
+    assert counts == dict(Device=0, Signal=len(signals))
+
+
 def test_utils_unix():
     cmd = 'echo "hello"'
     out, err = utils.unix(cmd)
@@ -244,6 +261,46 @@ def test_utils_with_database_listruns(cat):
     assert (ts == np.sort(ts)[::-1]).all()
 
 
+@pytest.fixture
+def catalog_namespace():
+    """Namespace without catalogs, restored (with the default catalog) after the test."""
+    from .. import catalog
+
+    ns = utils.getDefaultNamespace()
+    previous = {k: ns.pop(k) for k in list(ns) if k.startswith("cat")}
+    try:
+        yield ns
+    finally:
+        for key in [k for k in ns if k.startswith("cat")]:
+            ns.pop(key)
+        ns.update(previous)
+        utils.set_default_catalog(None)
+        catalog._namespace_memo = None
+
+
+def test_set_default_catalog(cat, catalog_namespace):
+    from .. import catalog
+
+    ns = catalog_namespace
+    ns.update(dict(cat1=cat.v1, cat2=cat.v1))
+    with pytest.raises(ValueError) as exinfo:
+        utils.getDefaultCatalog()
+    assert "Multiple catalog objects available." in str(exinfo.value)
+
+    # Same object, chosen or found in the namespace.
+    utils.set_default_catalog(cat.v1)
+    assert utils.getDefaultCatalog() is cat.v1
+    utils.set_default_catalog(None)
+
+    # remembered until the namespace changes
+    ns.pop("cat2")
+    assert len(utils.findCatalogsInNamespace()) == 1
+    assert utils.getDefaultCatalog() is cat.v1
+    assert catalog._namespace_memo[2] is cat.v1
+    ns.pop("cat1")
+    assert len(utils.findCatalogsInNamespace()) == 0
+
+
 def test_utils_with_database_replay(cat):
     replies = []
 
@@ -285,6 +342,50 @@ def test_utils_with_database_replay(cat):
         previous = v
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_replay_fan_out(max_workers, cat):
+    serial = []
+    utils.replay(cat.v1[-5:], callback=lambda k, doc: serial.append((k, doc["uid"])))
+
+    first, second = [], []
+    stats = utils.replay(
+        cat.v1[-5:],
+        callback=[
+            lambda k, doc: first.append((k, doc["uid"])),
+            lambda k, doc: second.append((k, doc["uid"])),
+        ],
+        exclude="datum resource",
+        max_workers=max_workers,
+    )
+    expected = [item for item in serial if item[0] not in ("datum", "resource")]
+    assert first == expected  # same order as a serial replay
+    assert second == expected
+    assert stats["runs"] == 5
+    assert stats["documents"] == len(expected)
+    assert stats["rate"] >= 0
+
+
+def test_replay_abort(cat, monkeypatch):
+    from databroker import Header
+
+    read = []
+    documents = Header.documents
+
+    def counting_documents(self, *args, **kwargs):
+        read.append(self.start["uid"])
+        return documents(self, *args, **kwargs)
+
+    monkeypatch.setattr(Header, "documents", counting_documents)
+
+    def callback(key, doc):
+        raise KeyboardInterrupt
+
+    runs = cat.v1[-10:]
+    with pytest.raises(KeyboardInterrupt):
+        utils.replay(runs, callback=callback, max_workers=2)
+    assert 0 < len(read) < len(list(runs))  # queued readers were cancelled
+
+
 @pytest.mark.parametrize(
     "run_type, ref, scan_ids",
     [
@@ -650,3 +751,29 @@ def test_call_signature_decorator(args, kwargs, expect):
 
     result = func1(*args, **kwargs)
     assert result == expect, f"{result=}  {expect=}"
+
+
+@pytest.mark.parametrize("batch_size, max_workers", [[1, 1], [50, 1], [50, 3]])
+def test_copy_filtered_catalog(batch_size, max_workers, cat, tmp_path):
+    import databroker
+
+    checkpoint = tmp_path / "copied.txt"
+    target = databroker.temp().v2
+    utils.copy_filtered_catalog(
+        cat,
+        target,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        checkpoint_file=checkpoint,
+    )
+    copied = checkpoint.read_text().split()
+    assert sorted(copied) == sorted(cat)
+
+    target.force_reload()
+    source_events = [doc for name, doc in cat.v1[COUNT].documents() if name == "event"]
+    target_events = [doc for name, doc in target.v1[COUNT].documents() if name == "event"]
+    assert [doc["seq_num"] for doc in target_events] == [doc["seq_num"] for doc in source_events]
+
+    # resume: nothing left to copy
+    utils.copy_filtered_catalog(cat, target, checkpoint_file=checkpoint)
+    assert checkpoint.read_text().split() == copied